@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urlparse
 
-from app.domain.entities import LmSelection, TtsSelection
+from app.application.pipeline import ItemContext, PipelineStage
+from app.domain.entities import ArtifactMeta, DeliverySelection, LmSelection, SynthesisProgress, TtsSelection
 from app.domain.ports import ArticleParserPort, LmClientPort, TtsEnginePort
-from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.db.event_writer import JobEventWriter
+from app.infrastructure.db.sqlite_repository import ClaimedItem, SQLiteJobRepository
 
 
 class JobService:
@@ -22,8 +29,15 @@ class JobService:
         parse_timeout_seconds: int = 60,
         tts_task_timeout_seconds: int = 900,
         lm_task_timeout_seconds: int = 45,
+        event_writer: JobEventWriter | None = None,
+        queue_poll_interval_seconds: float = 1.0,
+        parse_workers: int | None = None,
+        tts_workers: int | None = None,
+        lm_workers: int | None = None,
+        stage_queue_size: int | None = None,
     ) -> None:
         self._repository = repository
+        self._events = event_writer or JobEventWriter(repository)
         self._parser = parser
         self._tts_engine = tts_engine
         self._lm_client = lm_client
@@ -31,7 +45,94 @@ class JobService:
         self._parse_timeout_seconds = max(1, parse_timeout_seconds)
         self._tts_task_timeout_seconds = max(1, tts_task_timeout_seconds)
         self._lm_task_timeout_seconds = max(1, lm_task_timeout_seconds)
-        self._running_jobs: dict[str, asyncio.Task[None]] = {}
+        self._queue_poll_interval_seconds = max(0.05, queue_poll_interval_seconds)
+
+        # Every stage defaults to `url_concurrency`; the parse stage pulls from
+        # the DB queue, TTS and LM are fed through bounded in-memory queues.
+        queue_size = stage_queue_size or self._url_concurrency
+        self._parse_stage = PipelineStage("parse", parse_workers or self._url_concurrency, None)
+        self._tts_stage = PipelineStage("tts", tts_workers or self._url_concurrency, queue_size)
+        self._lm_stage = PipelineStage("lm", lm_workers or self._url_concurrency, queue_size)
+
+        self._workers: list[asyncio.Task[None]] = []
+        self._wakeup: asyncio.Event | None = None
+        self._running_items: dict[str, ItemContext] = {}
+        # Per stage: [stops, total release seconds, max release seconds].
+        self._releases: dict[str, list[float]] = {}
+        self._releases_lock = threading.Lock()
+        # Delivered artifacts by "<kind>: <format>", to watch the encoding ladder.
+        self._artifact_formats: Counter[str] = Counter()
+        self._artifact_bytes = 0
+
+    async def start(self) -> None:
+        self._ensure_started()
+
+    async def shutdown(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await self._events.stop()
+
+    def metrics(self) -> dict[str, object]:
+        return {
+            "stages": {stage.name: stage.metrics() for stage in self._stages},
+            "items_in_flight": len(self._running_items),
+            "events": self._events.stats(),
+            "cancellations": self._release_metrics(),
+            "artifacts": self._artifact_metrics(),
+        }
+
+    def _artifact_metrics(self) -> dict[str, object]:
+        count = sum(self._artifact_formats.values())
+        return {
+            "count": count,
+            "avg_size_bytes": round(self._artifact_bytes / count) if count else 0,
+            "formats": dict(self._artifact_formats),
+        }
+
+    def _release_metrics(self) -> dict[str, dict[str, float]]:
+        with self._releases_lock:
+            return {
+                stage: {
+                    "stops": int(count),
+                    "avg_release_seconds": round(total / count, 4),
+                    "max_release_seconds": round(longest, 4),
+                }
+                for stage, (count, total, longest) in self._releases.items()
+            }
+
+    @property
+    def _stages(self) -> tuple[PipelineStage, ...]:
+        return (self._parse_stage, self._tts_stage, self._lm_stage)
+
+    def _ensure_started(self) -> None:
+        self._events.start()
+        if self._workers:
+            return
+
+        # Items left in `processing` by a previous run never finished; put them
+        # back on the queue and close out jobs whose items all completed.
+        for job_id in self._repository.requeue_interrupted_items():
+            self._events.add(job_id, "info", "Job resumed after restart")
+        for job_id in self._repository.list_active_job_ids():
+            self._finalize_job_if_done(job_id)
+
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            *(
+                asyncio.create_task(self._parse_worker(), name=f"parse-worker-{index}")
+                for index in range(self._parse_stage.workers)
+            ),
+            *(
+                asyncio.create_task(self._stage_worker(self._tts_stage, self._synthesize), name=f"tts-worker-{index}")
+                for index in range(self._tts_stage.workers)
+            ),
+            *(
+                asyncio.create_task(self._stage_worker(self._lm_stage, self._generate_metadata), name=f"lm-worker-{index}")
+                for index in range(self._lm_stage.workers)
+            ),
+        ]
 
     async def create_job(
         self,
@@ -40,10 +141,12 @@ class JobService:
         urls: list[str],
         tts: TtsSelection,
         lm: LmSelection,
+        delivery: DeliverySelection | None = None,
     ) -> str:
-        job_id, _ = self._repository.create_job(chat_id, urls)
-        task = asyncio.create_task(self._process_job(job_id=job_id, tts=tts, lm=lm), name=f"job-{job_id}")
-        self._running_jobs[job_id] = task
+        job_id, _ = self._repository.create_job(chat_id, urls, tts=tts, lm=lm, delivery=delivery)
+        self._ensure_started()
+        assert self._wakeup is not None
+        self._wakeup.set()
         return job_id
 
     def cancel_job(self, job_id: str) -> bool:
@@ -51,32 +154,347 @@ class JobService:
         if not job:
             return False
         self._repository.mark_cancelled(job_id)
-        task = self._running_jobs.get(job_id)
-        if task and not task.done():
-            task.cancel()
+        self._events.add(job_id, "warning", "Job cancelled")
+        self._events.flush()
+        for ctx in list(self._running_items.values()):
+            if ctx.job_id != job_id:
+                continue
+            ctx.cancelled = True
+            self._request_stop(ctx)
+            for task in list(ctx.tasks):
+                task.cancel()
         return True
 
-    async def _process_job(self, *, job_id: str, tts: TtsSelection, lm: LmSelection) -> None:
-        self._repository.update_job_status(job_id, "processing")
-        self._repository.add_event(job_id, "info", "Job started")
+    async def _parse_worker(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            claimed: ClaimedItem | None = None
+            try:
+                claimed = self._repository.claim_next_item()
+                if claimed is None:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self._queue_poll_interval_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._parse_claimed(claimed)
+            except Exception as exc:  # noqa: BLE001
+                # A repository or event write failed; close out the item and
+                # keep this worker alive for the next one.
+                if claimed is None:
+                    await asyncio.sleep(self._queue_poll_interval_seconds)
+                else:
+                    self._abandon_item(claimed.job["id"], claimed.item["id"], exc)
 
-        items = self._repository.get_job_items(job_id)
-        semaphore = asyncio.Semaphore(self._url_concurrency)
+    async def _parse_claimed(self, claimed: ClaimedItem) -> None:
+        ctx = self._start_item(claimed)
+        if ctx is None:
+            return
+
+        task = await self._parse_stage.run(ctx, self._parse)
+        if ctx.cancelled or task.cancelled():
+            self._finish_item(ctx)
+            return
+        error = task.exception()
+        if error is not None:
+            self._repository.update_item_status(ctx.item_id, "failed", str(error))
+            self._events.add(ctx.job_id, "error", f"Item failed: {error}", ctx.item_id)
+            self._finish_item(ctx)
+            return
 
-        async def run_item(item: dict) -> None:
-            async with semaphore:
-                await self._process_item(job_id=job_id, item=item, tts=tts, lm=lm)
+        # Blocks while a downstream queue is full, so this worker stops
+        # claiming new items until TTS/LM catch up.
+        ctx.pending_stages = 2
+        await self._tts_stage.put(ctx)
+        await self._lm_stage.put(ctx)
 
+    async def _stage_worker(
+        self,
+        stage: PipelineStage,
+        handler: Callable[[ItemContext], Awaitable[None]],
+    ) -> None:
+        assert stage.queue is not None
+        while True:
+            ctx = await stage.queue.get()
+            try:
+                if not ctx.cancelled and ctx.tts_error is None:
+                    await stage.run(ctx, handler)
+            finally:
+                stage.queue.task_done()
+            ctx.pending_stages -= 1
+            if ctx.pending_stages == 0:
+                try:
+                    self._complete_item(ctx)
+                except Exception as exc:  # noqa: BLE001
+                    self._abandon_item(ctx.job_id, ctx.item_id, exc)
+
+    def _abandon_item(self, job_id: str, item_id: str, error: Exception) -> None:
+        # Best effort while the database is failing: whatever cannot be
+        # written here is picked up by `requeue_interrupted_items` on restart.
+        self._running_items.pop(item_id, None)
         try:
-            await asyncio.gather(*(run_item(item) for item in items), return_exceptions=False)
-        except asyncio.CancelledError:
-            self._repository.add_event(job_id, "warning", "Job cancelled")
-            self._repository.mark_cancelled(job_id)
+            self._repository.update_item_status(item_id, "failed", f"Internal error: {error}")
+            self._events.add(job_id, "error", f"Item failed: internal error: {error}", item_id)
+            self._finalize_job_if_done(job_id)
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _start_item(self, claimed: ClaimedItem) -> ItemContext | None:
+        job = claimed.job
+        job_id = job["id"]
+        item = claimed.item
+        if claimed.job_started:
+            self._events.add(job_id, "info", "Job started")
+
+        if job.get("tts_model_id") is None:
+            self._repository.update_item_status(item["id"], "failed", "Job has no stored TTS/LM selection")
+            self._finalize_job_if_done(job_id)
+            return None
+
+        ctx = ItemContext(
+            job_id=job_id,
+            item_id=item["id"],
+            url=item["url"],
+            tts=TtsSelection(model_id=job["tts_model_id"], voice=job["tts_voice"], speed=job["tts_speed"]),
+            lm=LmSelection(summary_model_id=job["summary_model_id"], filename_model_id=job["filename_model_id"]),
+            delivery=DeliverySelection(
+                prefer=job.get("delivery_prefer") or "voice",
+                fallback=job.get("delivery_fallback") or "document",
+                split=bool(job.get("delivery_split")),
+            ),
+        )
+        self._running_items[ctx.item_id] = ctx
+        self._events.add(job_id, "info", "Item processing started", ctx.item_id)
+        return ctx
+
+    async def _parse(self, ctx: ItemContext) -> None:
+        self._events.add(ctx.job_id, "info", "Parsing started", ctx.item_id)
+        ctx.article = await asyncio.wait_for(
+            asyncio.to_thread(self._parser.parse, ctx.url),
+            timeout=self._parse_timeout_seconds,
+        )
+        self._events.add(ctx.job_id, "info", "Parsing completed", ctx.item_id)
+
+    async def _synthesize(self, ctx: ItemContext) -> None:
+        assert ctx.article is not None
+        self._events.add(ctx.job_id, "info", "TTS started", ctx.item_id)
+        try:
+            ctx.artifact = await asyncio.wait_for(
+                asyncio.to_thread(self._run_synthesis, ctx),
+                timeout=self._tts_task_timeout_seconds,
+            )
+        except BaseException as exc:
+            # Timed out or cancelled: the synthesis thread is still running.
+            self._request_stop(ctx)
+            if isinstance(exc, Exception):
+                ctx.tts_error = exc
             raise
+        self._events.add(ctx.job_id, "info", self._tts_completed_message(ctx.artifact), ctx.item_id)
+
+    @staticmethod
+    def _tts_completed_message(artifact: ArtifactMeta) -> str:
+        if artifact.duration_seconds is None:
+            return "TTS completed"
+        return (
+            f"TTS completed: {artifact.duration_seconds:.1f}s audio, "
+            f"{artifact.silence_removed_seconds or 0:.1f}s silence removed, "
+            f"peak PCM buffer {(artifact.peak_pcm_bytes or 0) / 1_000_000:.1f} MB"
+        )
+
+    def _run_synthesis(self, ctx: ItemContext) -> ArtifactMeta:
+        assert ctx.article is not None
+        artifact: ArtifactMeta | None = None
+        try:
+            artifact = self._tts_engine.synthesize(
+                ctx.article.markdown,
+                ctx.tts,
+                f"{ctx.job_id}-{ctx.item_id}",
+                on_progress=partial(self._record_progress, ctx),
+                delivery=ctx.delivery,
+                cancel=ctx.cancel_event,
+            )
+            return artifact
         finally:
-            self._running_jobs.pop(job_id, None)
+            # Runs on the synthesis thread, so this is when the model and
+            # encoder are actually free, not when the awaiting task gave up.
+            self._record_release("tts", ctx)
+            if ctx.cancel_event.is_set():
+                if ctx.delivery.split:
+                    # Parts recorded after `_complete_item` already discarded them.
+                    self._discard_parts(ctx.item_id)
+                elif artifact is not None and not self._repository.artifact_in_use(artifact.path):
+                    # Finished after the stop; the item will never record it.
+                    Path(artifact.path).unlink(missing_ok=True)
+
+    def _request_stop(self, ctx: ItemContext) -> None:
+        if ctx.cancel_requested_at is None:
+            ctx.cancel_requested_at = time.monotonic()
+        ctx.cancel_event.set()
+
+    def _record_release(self, stage: str, ctx: ItemContext) -> None:
+        if ctx.cancel_requested_at is None:
+            return
+        delay = time.monotonic() - ctx.cancel_requested_at
+        with self._releases_lock:
+            count, total, longest = self._releases.get(stage, (0, 0.0, 0.0))
+            self._releases[stage] = [count + 1, total + delay, max(longest, delay)]
+        self._events.add(ctx.job_id, "info", f"{stage.upper()} stopped {delay:.2f}s after cancellation", ctx.item_id)
+
+    def _record_progress(self, ctx: ItemContext, progress: SynthesisProgress) -> None:
+        # Called from the synthesis thread after every chunk.
+        self._repository.update_item_progress(
+            ctx.item_id,
+            chunks_done=progress.chunks_done,
+            chunks_total=progress.chunks_total,
+            partial_path=progress.partial_path,
+        )
+        part = progress.completed_part
+        if part is None or part.part is None:
+            return
+        if ctx.cancel_event.is_set():
+            # The item's parts are being discarded; this one must not outlive them.
+            Path(part.path).unlink(missing_ok=True)
+            return
+        # Listed by the job status right away, so part 1 can be sent while
+        # the rest of the article is still being synthesized.
+        self._repository.add_item_artifact(
+            ctx.item_id,
+            part=part.part,
+            path=part.path,
+            kind=part.kind,
+            mime_type=part.mime_type,
+            size_bytes=part.size_bytes,
+            duration_seconds=part.duration_seconds,
+        )
+        if ctx.cancel_event.is_set():
+            # Stopped while the part was being recorded; `_run_synthesis`
+            # discards again once the thread is done, but do not announce it.
+            self._discard_parts(ctx.item_id)
+            return
+        self._events.add(
+            ctx.job_id,
+            "info",
+            f"Part {part.part} ready: {part.duration_seconds or 0:.1f}s audio, {part.size_bytes} bytes",
+            ctx.item_id,
+        )
+
+    async def _generate_metadata(self, ctx: ItemContext) -> None:
+        article = ctx.article
+        assert article is not None
+        self._events.add(ctx.job_id, "info", "LM started", ctx.item_id)
+
+        # Cancelling this task aborts the in-flight HTTP requests; once the
+        # cancellation reaches here their connections are back in the pool.
+        try:
+            if ctx.lm.summary_model_id == ctx.lm.filename_model_id:
+                summary_result, filename_result = await self._generate_combined_metadata(ctx)
+            else:
+                summary_result, filename_result = await asyncio.gather(
+                    asyncio.wait_for(
+                        self._lm_client.summarize(article.markdown, ctx.lm),
+                        timeout=self._summary_timeout(ctx),
+                    ),
+                    asyncio.wait_for(
+                        self._lm_client.filename(article.markdown, article.url, ctx.lm),
+                        timeout=self._lm_task_timeout_seconds,
+                    ),
+                    return_exceptions=True,
+                )
+        except asyncio.CancelledError:
+            self._record_release("lm", ctx)
+            raise
 
-        if self._repository.is_cancelled(job_id):
+        if isinstance(summary_result, Exception):
+            self._events.add(ctx.job_id, "warning", f"Summary fallback: {summary_result}", ctx.item_id)
+        if isinstance(filename_result, Exception):
+            self._events.add(ctx.job_id, "warning", f"Filename fallback: {filename_result}", ctx.item_id)
+
+        ctx.summary = (
+            self._fallback_summary(article.markdown)
+            if isinstance(summary_result, Exception)
+            else str(summary_result).strip()
+        )
+        filename_raw = (
+            self._fallback_filename(article.url)
+            if isinstance(filename_result, Exception)
+            else str(filename_result).strip()
+        )
+        ctx.filename = self._sanitize_filename(filename_raw, article.url)
+        self._events.add(ctx.job_id, "info", "LM completed", ctx.item_id)
+
+    def _summary_timeout(self, ctx: ItemContext) -> float:
+        # `lm_task_timeout_seconds` is per request; a map-reduced summary
+        # makes several rounds of them before the final one.
+        assert ctx.article is not None
+        rounds = self._lm_client.request_rounds(ctx.article.markdown, ctx.lm.summary_model_id)
+        return self._lm_task_timeout_seconds * max(1, rounds)
+
+    async def _generate_combined_metadata(self, ctx: ItemContext) -> tuple[str | Exception, str | Exception]:
+        # One request prefills the article once; each missing field falls back on its own.
+        article = ctx.article
+        assert article is not None
+        try:
+            summary, filename = await asyncio.wait_for(
+                self._lm_client.summary_and_filename(article.markdown, article.url, ctx.lm),
+                timeout=self._summary_timeout(ctx),
+            )
+        except Exception as exc:  # noqa: BLE001
+            return exc, exc
+        missing = ValueError("missing from combined LM response")
+        return summary if summary is not None else missing, filename if filename is not None else missing
+
+    def _complete_item(self, ctx: ItemContext) -> None:
+        # A cancelled item was already marked `cancelled` by `mark_cancelled`.
+        if not ctx.cancelled:
+            self._record_item_result(ctx)
+        if ctx.cancelled or ctx.artifact is None:
+            self._discard_parts(ctx.item_id)
+        self._finish_item(ctx)
+
+    def _discard_parts(self, item_id: str) -> None:
+        # Parts already listed for an item that did not complete will never
+        # be followed by the rest of the article.
+        for path in self._repository.clear_item_artifact_parts(item_id):
+            if not self._repository.artifact_in_use(path):
+                Path(path).unlink(missing_ok=True)
+
+    def _record_item_result(self, ctx: ItemContext) -> None:
+        if ctx.tts_error is not None or ctx.artifact is None:
+            error = ctx.tts_error or RuntimeError("TTS produced no artifact")
+            self._repository.update_item_status(ctx.item_id, "failed", str(error))
+            self._events.add(ctx.job_id, "error", f"Item failed: {error}", ctx.item_id)
+            return
+
+        assert ctx.article is not None
+        # For a split item the engine's sizes cover every part, but the item's
+        # own artifact is part 1 and `/artifact` serves only that file.
+        first = self._repository.get_item_artifact(ctx.job_id, ctx.item_id, 1) if ctx.delivery.split else None
+        self._repository.set_item_result(
+            ctx.item_id,
+            summary=ctx.summary or self._fallback_summary(ctx.article.markdown),
+            filename=ctx.filename or self._fallback_filename(ctx.article.url),
+            artifact_path=ctx.artifact.path,
+            artifact_kind=ctx.artifact.kind,
+            mime_type=ctx.artifact.mime_type,
+            size_bytes=first["size_bytes"] if first is not None else ctx.artifact.size_bytes,
+        )
+        if first is not None and first["path"] is None:
+            # Part 1 was sent and acknowledged while later parts were still
+            # being synthesized.
+            self._repository.clear_item_artifact(ctx.item_id)
+        # Cache hits do not know their ladder step; the MIME type still shows the mix.
+        audio_format = ctx.artifact.audio_format or ctx.artifact.mime_type
+        self._artifact_formats[f"{ctx.artifact.kind}: {audio_format}"] += 1
+        self._artifact_bytes += ctx.artifact.size_bytes
+        self._events.add(ctx.job_id, "info", "Item processing completed", ctx.item_id)
+
+    def _finish_item(self, ctx: ItemContext) -> None:
+        self._running_items.pop(ctx.item_id, None)
+        self._finalize_job_if_done(ctx.job_id)
+
+    def _finalize_job_if_done(self, job_id: str) -> None:
+        if self._repository.is_cancelled(job_id) or self._repository.count_open_items(job_id):
             return
 
         final_items = self._repository.get_job_items(job_id)
@@ -91,107 +509,45 @@ class JobService:
             final_status = "failed"
 
         self._repository.update_job_status(job_id, final_status)
-        self._repository.add_event(job_id, "info", f"Job finished with status={final_status}")
-
-    async def _process_item(
-        self,
-        *,
-        job_id: str,
-        item: dict,
-        tts: TtsSelection,
-        lm: LmSelection,
-    ) -> None:
-        item_id = item["id"]
-
-        if self._repository.is_cancelled(job_id):
-            self._repository.update_item_status(item_id, "cancelled")
-            return
-
-        self._repository.update_item_status(item_id, "processing")
-        self._repository.add_event(job_id, "info", "Item processing started", item_id)
-
-        try:
-            self._repository.add_event(job_id, "info", "Parsing started", item_id)
-            article = await asyncio.wait_for(
-                asyncio.to_thread(self._parser.parse, item["url"]),
-                timeout=self._parse_timeout_seconds,
-            )
-            self._repository.add_event(job_id, "info", "Parsing completed", item_id)
-            self._repository.add_event(job_id, "info", "TTS/LM started", item_id)
-
-            tts_task = asyncio.wait_for(
-                asyncio.to_thread(
-                    self._tts_engine.synthesize,
-                    article.markdown,
-                    tts,
-                    f"{job_id}-{item_id}",
-                ),
-                timeout=self._tts_task_timeout_seconds,
-            )
-            summary_task = asyncio.wait_for(
-                asyncio.to_thread(self._lm_client.summarize, article.markdown, lm),
-                timeout=self._lm_task_timeout_seconds,
-            )
-            filename_task = asyncio.wait_for(
-                asyncio.to_thread(self._lm_client.filename, article.markdown, article.url, lm),
-                timeout=self._lm_task_timeout_seconds,
-            )
-
-            tts_result, summary_result, filename_result = await asyncio.gather(
-                tts_task,
-                summary_task,
-                filename_task,
-                return_exceptions=True,
-            )
-
-            if isinstance(tts_result, Exception):
-                raise tts_result
-
-            if isinstance(summary_result, Exception):
-                self._repository.add_event(job_id, "warning", f"Summary fallback: {summary_result}", item_id)
-            if isinstance(filename_result, Exception):
-                self._repository.add_event(job_id, "warning", f"Filename fallback: {filename_result}", item_id)
-
-            summary = (
-                self._fallback_summary(article.markdown)
-                if isinstance(summary_result, Exception)
-                else str(summary_result).strip()
-            )
-            filename_raw = (
-                self._fallback_filename(article.url)
-                if isinstance(filename_result, Exception)
-                else str(filename_result).strip()
-            )
-            filename = self._sanitize_filename(filename_raw, article.url)
-
-            self._repository.set_item_result(
-                item_id,
-                summary=summary,
-                filename=filename,
-                artifact_path=tts_result.path,
-                artifact_kind=tts_result.kind,
-                mime_type=tts_result.mime_type,
-                size_bytes=tts_result.size_bytes,
-            )
-            self._repository.add_event(job_id, "info", "TTS/LM completed", item_id)
-            self._repository.add_event(job_id, "info", "Item processing completed", item_id)
-        except Exception as exc:  # noqa: BLE001
-            self._repository.update_item_status(item_id, "failed", str(exc))
-            self._repository.add_event(job_id, "error", f"Item failed: {exc}", item_id)
+        self._events.add(job_id, "info", f"Job finished with status={final_status}")
+        self._events.flush()
 
     def acknowledge_sent(self, job_id: str, item_id: str) -> bool:
         item = self._repository.get_job_item(job_id, item_id)
         if not item:
             return False
 
+        self._repository.clear_item_artifact(item_id)
+        part_paths = self._repository.clear_item_artifact_parts(item_id)
+
+        # Cached artifacts can be shared by several items; the file is only
+        # removed once nothing references it any more.
         artifact_path = item.get("artifact_path")
-        if artifact_path:
-            path = Path(artifact_path)
-            if path.exists():
-                path.unlink(missing_ok=True)
+        deleted = False
+        for path in dict.fromkeys([*([artifact_path] if artifact_path else []), *part_paths]):
+            if not self._repository.artifact_in_use(path):
+                Path(path).unlink(missing_ok=True)
+                deleted = True
+        message = "Artifact acknowledged and deleted" if deleted else "Artifact acknowledged"
+        self._events.add(job_id, "info", message, item_id)
+        return True
 
-        self._repository.clear_item_artifact(item_id)
-        self._repository.add_event(job_id, "info", "Artifact acknowledged and deleted", item_id)
+    def acknowledge_part(self, job_id: str, item_id: str, part: int) -> bool:
+        artifact = self._repository.get_item_artifact(job_id, item_id, part)
+        if not artifact:
+            return False
+
+        self._repository.clear_item_artifact_part(item_id, part)
+        path = artifact.get("path")
+        if path is None:
+            return True
+        # The item's own artifact is part 1; sending it is what was acked.
+        item = self._repository.get_job_item(job_id, item_id)
+        if item and item.get("artifact_path") == path:
+            self._repository.clear_item_artifact(item_id)
+        if not self._repository.artifact_in_use(path):
+            Path(path).unlink(missing_ok=True)
+        self._events.add(job_id, "info", f"Part {part} acknowledged", item_id)
         return True
 
     @staticmethod
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.domain.entities import ArtifactMeta, DeliverySelection, LmSelection, TtsSelection
+from app.domain.ports import ParsedArticle
+
+
+@dataclass(slots=True)
+class ItemContext:
+    """State of one job item while it moves through the pipeline stages."""
+
+    job_id: str
+    item_id: str
+    url: str
+    tts: TtsSelection
+    lm: LmSelection
+    delivery: DeliverySelection
+    article: ParsedArticle | None = None
+    artifact: ArtifactMeta | None = None
+    tts_error: Exception | None = None
+    summary: str | None = None
+    filename: str | None = None
+    # Stages (TTS, LM) still to report back before the item can be finished.
+    pending_stages: int = 0
+    cancelled: bool = False
+    tasks: set[asyncio.Task[Any]] = field(default_factory=set)
+    # Set on cancel or timeout so work running outside the event loop stops too.
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    # `time.monotonic()` of the first stop request, to time how long work takes to let go.
+    cancel_requested_at: float | None = None
+
+
+class PipelineStage:
+    """A fixed number of workers fed by a bounded queue.
+
+    `put` blocks while the queue is full, which holds the upstream stage back
+    instead of letting items pile up in memory.
+    """
+
+    def __init__(self, name: str, workers: int, queue_size: int | None) -> None:
+        self.name = name
+        self.workers = max(1, workers)
+        self.queue: asyncio.Queue[ItemContext] | None = (
+            asyncio.Queue(maxsize=max(1, queue_size)) if queue_size is not None else None
+        )
+        self.busy = 0
+        self.processed = 0
+        self.failed = 0
+
+    async def put(self, ctx: ItemContext) -> None:
+        assert self.queue is not None
+        await self.queue.put(ctx)
+
+    async def run(self, ctx: ItemContext, handler: Callable[[ItemContext], Awaitable[None]]) -> asyncio.Task[None]:
+        """Run `handler` as a task tracked on `ctx` and return it once it is done."""
+        task = asyncio.create_task(handler(ctx), name=f"{self.name}-{ctx.item_id}")
+        ctx.tasks.add(task)
+        self.busy += 1
+        try:
+            # `asyncio.wait` does not propagate the item's own cancellation, so
+            # cancelling one job never takes a stage worker down with it.
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            self.busy -= 1
+            ctx.tasks.discard(task)
+
+        if not task.cancelled():
+            if task.exception() is not None:
+                self.failed += 1
+            else:
+                self.processed += 1
+        return task
+
+    def metrics(self) -> dict[str, int | None]:
+        return {
+            "workers": self.workers,
+            "busy": self.busy,
+            "queued": self.queue.qsize() if self.queue is not None else None,
+            "queue_capacity": self.queue.maxsize if self.queue is not None else None,
+            "processed": self.processed,
+            "failed": self.failed,
+        }
@@ -26,14 +26,45 @@ class Settings(BaseSettings):
         default=Path("/Users/alex/Documents/tts-trying/apps/tts-service/data/tts.db"),
         alias="TTS_DB_PATH",
     )
+    db_busy_timeout_ms: int = Field(default=5_000, alias="TTS_DB_BUSY_TIMEOUT_MS")
+    db_synchronous: str = Field(default="NORMAL", alias="TTS_DB_SYNCHRONOUS")
+    event_flush_batch_size: int = Field(default=64, alias="TTS_EVENT_FLUSH_BATCH_SIZE")
+    event_flush_interval_seconds: float = Field(default=0.5, alias="TTS_EVENT_FLUSH_INTERVAL_SECONDS")
     artifacts_dir: Path = Field(
         default=Path("/Users/alex/Documents/tts-trying/apps/tts-service/data/artifacts"),
         alias="TTS_ARTIFACTS_DIR",
     )
 
     url_concurrency: int = Field(default=2, alias="TTS_URL_CONCURRENCY")
+    # Pipeline stage sizes; each falls back to `url_concurrency` when unset.
+    parse_workers: int | None = Field(default=None, alias="TTS_PARSE_WORKERS")
+    tts_workers: int | None = Field(default=None, alias="TTS_SYNTH_WORKERS")
+    lm_workers: int | None = Field(default=None, alias="TTS_LM_WORKERS")
+    stage_queue_size: int | None = Field(default=None, alias="TTS_STAGE_QUEUE_SIZE")
     voice_max_bytes: int = Field(default=45_000_000, alias="VOICE_MAX_BYTES")
+    synthesis_cache_max_bytes: int = Field(default=2_000_000_000, alias="TTS_SYNTHESIS_CACHE_MAX_BYTES")
+    chunk_cache_max_bytes: int = Field(default=1_000_000_000, alias="TTS_CHUNK_CACHE_MAX_BYTES")
+    article_cache_ttl_seconds: int = Field(default=86_400, alias="TTS_ARTICLE_CACHE_TTL_SECONDS")
+    # 0 synthesizes in-process; N > 0 runs synthesis in N worker processes.
+    tts_worker_processes: int = Field(default=0, alias="TTS_WORKER_PROCESSES")
+    # Comma-separated TTS model ids loaded (and warmed up) at startup.
+    tts_preload_models: str = Field(default="", alias="TTS_PRELOAD_MODELS")
+    tts_warm_up_enabled: bool = Field(default=True, alias="TTS_WARM_UP_ENABLED")
+    tts_model_memory_budget_bytes: int = Field(default=8_000_000_000, alias="TTS_MODEL_MEMORY_BUDGET_BYTES")
+    # Chunks from concurrent items are batched for models exposing `batch_generate`; 1 disables batching.
+    tts_batch_max_size: int = Field(default=4, alias="TTS_BATCH_MAX_SIZE")
+    tts_batch_max_wait_ms: int = Field(default=50, alias="TTS_BATCH_MAX_WAIT_MS")
+    tts_streaming_enabled: bool = Field(default=False, alias="TTS_STREAMING_ENABLED")
     lm_http_timeout_seconds: int = Field(default=30, alias="LM_HTTP_TIMEOUT_SECONDS")
+    lm_http_max_connections: int = Field(default=8, alias="LM_HTTP_MAX_CONNECTIONS")
+    lm_http_max_keepalive_connections: int = Field(default=4, alias="LM_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    lm_http_keepalive_expiry_seconds: float = Field(default=30.0, alias="LM_HTTP_KEEPALIVE_EXPIRY_SECONDS")
+    lm_context_tokens: int = Field(default=4_096, alias="LM_CONTEXT_TOKENS")
+    # JSON object of per-model overrides, e.g. {"qwen3-8b": 32768}.
+    lm_model_context_tokens: dict[str, int] = Field(default_factory=dict, alias="LM_MODEL_CONTEXT_TOKENS")
+    lm_map_parallelism: int = Field(default=2, alias="LM_MAP_PARALLELISM")
+    lm_models_cache_ttl_seconds: float = Field(default=60.0, alias="LM_MODELS_CACHE_TTL_SECONDS")
+    lm_validation_cache_ttl_seconds: float = Field(default=86_400.0, alias="LM_VALIDATION_CACHE_TTL_SECONDS")
     parse_timeout_seconds: int = Field(default=60, alias="PARSE_TIMEOUT_SECONDS")
     tts_task_timeout_seconds: int = Field(default=900, alias="TTS_TASK_TIMEOUT_SECONDS")
     lm_task_timeout_seconds: int = Field(default=45, alias="LM_TASK_TIMEOUT_SECONDS")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+from app.domain.entities import DeliverySelection
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFormat:
+    kind: str
+    extension: str
+    mime_type: str
+    codec: str
+    bitrate_bps: int
+    # Resample before encoding; None keeps the synthesis rate.
+    sample_rate: int | None = None
+    # Opus `-application`; "voip" favours speech intelligibility at low bitrates.
+    application: str | None = None
+
+    @property
+    def bitrate(self) -> str:
+        return f"{self.bitrate_bps // 1000}k"
+
+    @property
+    def label(self) -> str:
+        rate = f"/{self.sample_rate // 1000}kHz" if self.sample_rate else ""
+        return f"{self.extension} {self.bitrate}{rate}"
+
+
+VOICE_OPUS_64K: Final = AudioFormat("voice", "ogg", "audio/ogg", "libopus", 64_000)
+VOICE_OPUS_32K: Final = AudioFormat("voice", "ogg", "audio/ogg", "libopus", 32_000)
+# Speech-tuned steps: wideband/super-wideband speech loses little below 12 kHz.
+VOICE_OPUS_24K_SPEECH: Final = AudioFormat("voice", "ogg", "audio/ogg", "libopus", 24_000, 24_000, "voip")
+VOICE_OPUS_16K_SPEECH: Final = AudioFormat("voice", "ogg", "audio/ogg", "libopus", 16_000, 16_000, "voip")
+DOCUMENT_MP3_128K: Final = AudioFormat("document", "mp3", "audio/mpeg", "libmp3lame", 128_000)
+
+# Voice formats from best to smallest; the planner takes the first that fits.
+_VOICE_LADDER: Final[list[AudioFormat]] = [
+    VOICE_OPUS_64K,
+    VOICE_OPUS_32K,
+    VOICE_OPUS_24K_SPEECH,
+    VOICE_OPUS_16K_SPEECH,
+]
+
+# Opus is VBR and can run slightly above its nominal bitrate on dense speech;
+# Ogg pages add ~1% on top. MP3 is CBR with a small ID3/Xing header.
+_OVERHEAD_RATIO: Final[dict[str, float]] = {"libopus": 1.06, "libmp3lame": 1.01}
+_HEADER_BYTES: Final = 16_384
+
+# Speaking rate used to guess duration from text before any audio exists.
+_CHARS_PER_SECOND: Final = 15.0
+
+
+def estimate_duration_seconds(text: str, speed: float) -> float:
+    return len(text) / (_CHARS_PER_SECOND * max(speed, 0.1))
+
+
+def predict_size_bytes(duration_seconds: float, audio_format: AudioFormat) -> int:
+    payload = duration_seconds * audio_format.bitrate_bps / 8
+    return int(payload * _OVERHEAD_RATIO.get(audio_format.codec, 1.05)) + _HEADER_BYTES
+
+
+def max_voice_seconds(audio_format: AudioFormat, voice_max_bytes: int, headroom: float = 0.9) -> float:
+    """Longest audio predicted to fit one voice note in `audio_format`.
+
+    `headroom` absorbs the error of estimating the next chunk's duration
+    from its text before deciding whether it still fits the current part.
+    """
+    bytes_per_second = audio_format.bitrate_bps / 8 * _OVERHEAD_RATIO.get(audio_format.codec, 1.05)
+    return max(1.0, (voice_max_bytes * headroom - _HEADER_BYTES) / bytes_per_second)
+
+
+def plan_format(duration_seconds: float, voice_max_bytes: int, delivery: DeliverySelection) -> AudioFormat:
+    """Pick the output format before encoding, honouring `prefer`/`fallback`."""
+    if delivery.prefer == "document":
+        return DOCUMENT_MP3_128K
+
+    for audio_format in _VOICE_LADDER:
+        if predict_size_bytes(duration_seconds, audio_format) <= voice_max_bytes:
+            return audio_format
+
+    if delivery.fallback == "voice":
+        # The caller insists on a voice note; send the smallest one we have.
+        return _VOICE_LADDER[-1]
+    return DOCUMENT_MP3_128K
+
+
+def fallback_format(
+    audio_format: AudioFormat,
+    duration_seconds: float,
+    size_bytes: int,
+    voice_max_bytes: int,
+    delivery: DeliverySelection,
+) -> AudioFormat | None:
+    """Format to re-encode into when an encoded voice note ended up over the limit.
+
+    The miss of the prediction for `audio_format` is applied to the smaller
+    ladder steps, so one re-encode usually suffices. Returns None when there
+    is nothing smaller to try.
+    """
+    if audio_format not in _VOICE_LADDER:
+        return None
+    ratio = size_bytes / predict_size_bytes(duration_seconds, audio_format)
+    smaller = _VOICE_LADDER[_VOICE_LADDER.index(audio_format) + 1 :]
+    for candidate in smaller:
+        if predict_size_bytes(duration_seconds, candidate) * ratio <= voice_max_bytes:
+            return candidate
+    if delivery.fallback == "voice":
+        return smaller[-1] if smaller else None
+    return DOCUMENT_MP3_128K
@@ -36,12 +36,38 @@ class LmSelection:
     filename_model_id: str
 
 
+@dataclass(slots=True)
+class DeliverySelection:
+    prefer: str = "voice"
+    fallback: str = "document"
+    # Deliver long audio as several voice notes, each under the size limit.
+    split: bool = False
+
+
 @dataclass(slots=True)
 class ArtifactMeta:
     path: str
     kind: str
     mime_type: str
     size_bytes: int
+    # Filled in by engines that post-process the PCM; absent on cache hits.
+    duration_seconds: float | None = None
+    silence_removed_seconds: float | None = None
+    peak_pcm_bytes: int | None = None
+    # Encoding ladder step, e.g. "ogg 24k/24kHz".
+    audio_format: str | None = None
+    # 1-based part number for multi-part deliveries; None for a single artifact.
+    part: int | None = None
+
+
+@dataclass(slots=True)
+class SynthesisProgress:
+    chunks_done: int
+    chunks_total: int
+    # Set when a playable file is being written while synthesis continues.
+    partial_path: str | None = None
+    # Multi-part delivery: a part that has just been encoded and can be sent.
+    completed_part: ArtifactMeta | None = None
 
 
 @dataclass(slots=True)
@@ -12,6 +12,9 @@ class TtsModelDescriptor:
     voice_presets: list[str]
     default_voice: str
     speed_presets: list[float]
+    # Longest text chunk passed to one `generate` call; models with short
+    # context windows drift or truncate on longer input.
+    max_chunk_chars: int = 1_500
 
 
 _SPEED_PRESETS: Final[list[float]] = [0.8, 1.0, 1.2, 1.4]
@@ -32,6 +35,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["Chelsie", "Ethan", "Serena"],
         default_voice="Chelsie",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=800,
     ),
     TtsModelDescriptor(
         id="mlx-community/csm-1b",
@@ -40,6 +44,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["conversational_a", "conversational_b"],
         default_voice="conversational_a",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=400,
     ),
     TtsModelDescriptor(
         id="mlx-community/Dia-1.6B-fp16",
@@ -48,6 +53,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["default"],
         default_voice="default",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=500,
     ),
     TtsModelDescriptor(
         id="mlx-community/OuteTTS-1.0-0.6B-fp16",
@@ -56,6 +62,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["default"],
         default_voice="default",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=600,
     ),
     TtsModelDescriptor(
         id="mlx-community/Spark-TTS-0.5B-bf16",
@@ -64,6 +71,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["default"],
         default_voice="default",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=600,
     ),
     TtsModelDescriptor(
         id="mlx-community/chatterbox-fp16",
@@ -72,6 +80,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["default"],
         default_voice="default",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=500,
     ),
     TtsModelDescriptor(
         id="mlx-community/Soprano-1.1-80M-bf16",
@@ -80,6 +89,7 @@ _TTS_MODELS: Final[list[TtsModelDescriptor]] = [
         voice_presets=["default"],
         default_voice="default",
         speed_presets=_SPEED_PRESETS,
+        max_chunk_chars=800,
     ),
 ]
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol
 
-from app.domain.entities import ArtifactMeta, LmSelection, TtsSelection
+from app.domain.entities import ArtifactMeta, DeliverySelection, LmSelection, SynthesisProgress, TtsSelection
 
 
 @dataclass(slots=True)
@@ -18,20 +20,44 @@ class ArticleParserPort(Protocol):
         ...
 
 
+class SynthesisCancelled(Exception):
+    """Raised by `TtsEnginePort.synthesize` once its `cancel` event is set."""
+
+
 class TtsEnginePort(Protocol):
-    def synthesize(self, text: str, selection: TtsSelection, output_basename: str) -> ArtifactMeta:
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
         ...
 
 
 class LmClientPort(Protocol):
-    def list_models(self) -> list[str]:
+    async def list_models(self) -> list[str]:
+        ...
+
+    async def validate_model(self, model_id: str) -> tuple[bool, str | None]:
+        ...
+
+    async def summarize(self, text: str, selection: LmSelection) -> str:
         ...
 
-    def validate_model(self, model_id: str) -> tuple[bool, str | None]:
+    async def filename(self, text: str, url: str, selection: LmSelection) -> str:
         ...
 
-    def summarize(self, text: str, selection: LmSelection) -> str:
+    async def summary_and_filename(
+        self,
+        text: str,
+        url: str,
+        selection: LmSelection,
+    ) -> tuple[str | None, str | None]:
         ...
 
-    def filename(self, text: str, url: str, selection: LmSelection) -> str:
+    def request_rounds(self, text: str, model_id: str) -> int:
+        """Sequential LM requests a summary of `text` takes (map rounds plus the final one)."""
         ...
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import Final
+
+from app.domain.text_processing import chunk_text
+
+# Rough token estimate without a tokenizer: ~4 characters per token for
+# alphabetic scripts, ~1 token per CJK character.
+_CHARS_PER_TOKEN: Final = 4.0
+_CJK_RE: Final = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+_WORD_RE: Final = re.compile(r"\w+")
+_LINK_RE: Final = re.compile(r"!?\[([^\]]*)\]\([^)]*\)|https?://\S+")
+_BOILERPLATE_RE: Final = re.compile(
+    r"\b(subscribe|newsletter|cookies?|sign up|log in|advertisement|share this|related (articles|posts)|"
+    r"all rights reserved|follow us|read more|comments?)\b",
+    re.IGNORECASE,
+)
+_GAP_MARKER: Final = "[...]"
+
+
+def estimate_tokens(text: str) -> int:
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / _CHARS_PER_TOKEN)
+
+
+def chars_for_tokens(tokens: int) -> int:
+    return int(tokens * _CHARS_PER_TOKEN)
+
+
+def select_spans(text: str, max_tokens: int) -> str:
+    """Fit `text` into `max_tokens` by keeping its most informative paragraphs.
+
+    The opening and closing paragraphs are kept when they fit; the rest are
+    ranked by how much content they carry per token (distinct words, numbers)
+    and penalized for links and site boilerplate. Kept paragraphs stay in
+    their original order, with `[...]` where text was dropped.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Long paragraphs are split so one of them cannot eat the whole budget.
+    piece_chars = max(chars_for_tokens(max_tokens) // 4, 200)
+    pieces = [
+        piece
+        for paragraph in re.split(r"\n\s*\n", text)
+        if paragraph.strip()
+        for piece in chunk_text(paragraph.strip(), piece_chars)
+    ]
+    costs = [estimate_tokens(piece) + 1 for piece in pieces]
+
+    chosen: set[int] = set()
+    remaining = max_tokens
+    ranked = sorted(range(1, len(pieces) - 1), key=lambda index: _score(pieces[index]) / costs[index], reverse=True)
+    for index in [0, len(pieces) - 1, *ranked]:
+        if index not in chosen and costs[index] <= remaining:
+            chosen.add(index)
+            remaining -= costs[index]
+
+    if not chosen:
+        return text[: chars_for_tokens(max_tokens)]
+
+    parts: list[str] = []
+    previous = -1
+    for index in sorted(chosen):
+        if index != previous + 1:
+            parts.append(_GAP_MARKER)
+        parts.append(pieces[index])
+        previous = index
+    return "\n\n".join(parts)
+
+
+def _score(piece: str) -> float:
+    if piece.lstrip().startswith("#"):
+        # Headings are short but tell the model what the next section is about.
+        return 8.0
+    plain = _LINK_RE.sub(r"\1", piece)
+    words = _WORD_RE.findall(plain.lower())
+    if not words:
+        return 0.0
+    link_share = 1 - len(plain) / max(len(piece), 1)
+    score = min(len(words), 150) * len(set(words)) / len(words) * (1 - link_share)
+    score *= 1 + 0.05 * min(sum(word.isdigit() for word in words), 6)
+    if len(words) < 6:
+        score *= 0.5
+    if _BOILERPLATE_RE.search(plain):
+        score *= 0.2
+    return score
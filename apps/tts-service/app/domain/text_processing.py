@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import re
+from itertools import chain
+
+# One alternation, applied in a single `sub` pass; the named group that
+# matched decides the replacement. Order matters: fenced code and tables are
+# dropped before their contents could match an inline rule. Line-level rules
+# match their leading newline instead of `^`, so the lookahead can reject
+# most positions (plain letters mid-line) with a single character check.
+_MARKDOWN = re.compile(
+    r"""
+    (?=[!\[<`*_~\n]|https?://|www\.)
+    (?:
+      (?P<fence>\n[ \t]*(?P<marker>```|~~~).*?(?:^[ \t]*(?P=marker)[^\n]*$|\Z))
+    | (?P<table>\n[ \t]*\|[^\n]*\|[ \t]*$)
+    | (?P<image>!\[[^\]]*\]\([^)]*\))
+    | \[(?P<link>[^\]]+)\]\([^)]*\)
+    | (?P<url>\b(?:https?://|www\.)[^\s<>()\[\]]+)
+    | (?P<html></?[A-Za-z][^>\n]*>)
+    | (?P<rule>\n[ \t]*(?:[-*_][ \t]*){3,}$)
+    | (?P<block>\n[ \t]*(?:\#{1,6}|>+|[-*+]|\d+[.)])[ \t]+)
+    | `(?P<code>[^`\n]+)`
+    | (?P<emphasis>\*{1,3}|_{2,3}|~~|(?<!\w)_|_(?!\w))
+    )
+    """,
+    re.MULTILINE | re.DOTALL | re.VERBOSE,
+)
+
+_KEEP_GROUPS = ("link", "code")
+
+# A sentence ends at terminal punctuation (plus closing quotes/brackets)
+# followed by whitespace, or right after CJK/fullwidth terminals, which are
+# not followed by spaces. Abbreviations and single initials are checked only
+# once a period has matched.
+_SENTENCE_END = re.compile(
+    r"""
+    (?=[.…!?؟।۔。！？．])
+    (?:
+        (?:
+            [.…]+
+            (?<!\bMr\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)(?<!\bvs\.)(?<!\bMrs\.)(?<!\betc\.)(?<!\bProf\.)
+            (?<!\be\.g\.)(?<!\bi\.e\.)(?<!\b[A-Z]\.)
+          | [!?؟।۔]+
+        ) ["'”’»)\]]* \s+
+      | [。！？．]+ [」』”’）\]]* \s*
+    )
+    """,
+    re.VERBOSE,
+)
+
+_CLAUSE_END = re.compile(r"[,;:—–]\s+|[、，；：]\s*")
+
+# Tried in order for a span that does not fit; past the last one the span is
+# cut at the last space that fits.
+_BOUNDARIES = (_SENTENCE_END, _CLAUSE_END)
+
+
+def normalize_text(text: str) -> str:
+    """Reduce markdown to speakable plain text.
+
+    Code blocks, tables, images, bare URLs and HTML tags are dropped, links
+    keep their text, and block/emphasis markers are removed. Intra-word
+    hyphens and underscores are kept.
+    """
+    # The leading newline lets the first line match line-level rules.
+    normalized = _MARKDOWN.sub(_replace_markdown, "\n" + text)
+    return " ".join(normalized.split())
+
+
+def _replace_markdown(match: re.Match[str]) -> str:
+    # Each alternative's outermost group is the last one to close.
+    name = match.lastgroup
+    if name in _KEEP_GROUPS:
+        return match.group(name)
+    # Emphasis sits inside a sentence; anything else stood between words.
+    return "" if name == "emphasis" else " "
+
+
+def chunk_text(text: str, max_chars: int = 1_500) -> list[str]:
+    """Pack sentences into chunks of at most `max_chars` characters.
+
+    Sentences longer than `max_chars` are split at clause punctuation, then
+    between words; only a single word (or an unspaced CJK run) longer than
+    `max_chars` is ever cut.
+    """
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks: list[str] = []
+    tail = _pack(text, 0, len(text), 0, max_chars, chunks)
+    chunks.append(text[tail:].strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def _pack(text: str, start: int, end: int, level: int, max_chars: int, chunks: list[str]) -> int:
+    # Works on offsets into `text`, so no intermediate sentence strings are
+    # built. Emits full chunks of `text[start:end]` and returns where the
+    # unemitted tail (at most `max_chars` long) begins.
+    if level == len(_BOUNDARIES):
+        return _pack_words(text, start, end, max_chars, chunks)
+
+    bounds = (match.end() for match in _BOUNDARIES[level].finditer(text, start, end))
+    last = start
+    for bound in chain(bounds, (end,)):
+        if bound - start > max_chars:
+            if last > start:
+                chunks.append(text[start:last].strip())
+                start = last
+            if bound - start > max_chars:
+                start = _pack(text, start, bound, level + 1, max_chars, chunks)
+        last = bound
+    return start
+
+
+def _pack_words(text: str, start: int, end: int, max_chars: int, chunks: list[str]) -> int:
+    while end - start > max_chars:
+        cut = text.rfind(" ", start, start + max_chars + 1)
+        # No space in reach: one word longer than a chunk, or unspaced CJK.
+        cut = cut + 1 if cut > start else start + max_chars
+        chunks.append(text[start:cut].strip())
+        start = cut
+    return start
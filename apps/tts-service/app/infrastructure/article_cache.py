@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Final
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.domain.ports import ArticleParserPort, ParsedArticle
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.single_flight import SingleFlight
+
+_TRACKING_PARAMS: Final = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "ref_src",
+        "spm",
+    }
+)
+_TRACKING_PREFIXES: Final = ("utm_",)
+_DEFAULT_PORTS: Final = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """Cache key for a URL: tracking params and fragment removed, query sorted."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _TRACKING_PARAMS and not name.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+class CachingArticleParser:
+    """TTL cache in front of an `ArticleParserPort`, keyed by canonical URL.
+
+    Concurrent jobs asking for the same article share one scrape. Failures
+    are not cached, so the next request retries the remote parser.
+    """
+
+    def __init__(self, parser: ArticleParserPort, repository: SQLiteJobRepository, ttl_seconds: float) -> None:
+        self._parser = parser
+        self._repository = repository
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._single_flight = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+
+    def parse(self, url: str) -> ParsedArticle:
+        key = canonical_url(url)
+        with self._single_flight.hold(key):
+            cutoff = (datetime.now(timezone.utc) - self._ttl).isoformat()
+            cached = self._repository.get_cached_article(key, fetched_after=cutoff)
+            if cached is not None:
+                self._hits += 1
+                return ParsedArticle(url=url, markdown=cached["markdown"], title=cached["title"])
+
+            self._misses += 1
+            article = self._parser.parse(url)
+            self._repository.put_cached_article(key, markdown=article.markdown, title=article.title)
+            self._repository.prune_cached_articles(fetched_before=cutoff)
+        return article
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "in_flight": self._single_flight.in_flight(),
+        }
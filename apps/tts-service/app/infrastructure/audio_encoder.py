@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+OPUS_CODEC = "libopus"
+MP3_CODEC = "libmp3lame"
+
+
+class PcmStreamEncoder:
+    """Encodes mono float32 PCM through ffmpeg's stdin, without a WAV file.
+
+    Packets are flushed as soon as they are muxed, so an Ogg output can be
+    read (and played) while later audio is still being written.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        sample_rate: int,
+        codec: str = OPUS_CODEC,
+        bitrate: str = "64k",
+        output_sample_rate: int | None = None,
+        application: str | None = None,
+    ) -> None:
+        self._output_path = output_path
+        output_options = ["-ac", "1"]
+        if output_sample_rate is not None:
+            output_options += ["-ar", str(output_sample_rate)]
+        if application is not None:
+            output_options += ["-application", application]
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "f32le",
+                "-ar",
+                str(sample_rate),
+                "-ac",
+                "1",
+                "-i",
+                "pipe:0",
+                "-c:a",
+                codec,
+                "-b:a",
+                bitrate,
+                *output_options,
+                "-flush_packets",
+                "1",
+                str(output_path),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    @property
+    def output_path(self) -> Path:
+        return self._output_path
+
+    def write(self, audio: np.ndarray) -> None:
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.write(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+            self._process.stdin.flush()
+        except BrokenPipeError as exc:
+            self._process.wait()
+            raise RuntimeError(f"ffmpeg encoder exited early: {self._stderr()}") from exc
+
+    def close(self) -> None:
+        assert self._process.stdin is not None
+        self._process.stdin.close()
+        returncode = self._process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg conversion failed: {self._stderr()}")
+
+    def abort(self) -> None:
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._output_path.unlink(missing_ok=True)
+
+    def _stderr(self) -> str:
+        assert self._process.stderr is not None
+        return self._process.stderr.read().decode(errors="replace").strip()
+
+
+def encode_pcm(
+    segments: Iterable[np.ndarray],
+    sample_rate: int,
+    output_path: Path,
+    codec: str,
+    bitrate: str,
+    output_sample_rate: int | None = None,
+    application: str | None = None,
+) -> int:
+    """Encode PCM segments into `output_path` and return the file size."""
+    encoder = PcmStreamEncoder(
+        output_path,
+        sample_rate,
+        codec=codec,
+        bitrate=bitrate,
+        output_sample_rate=output_sample_rate,
+        application=application,
+    )
+    try:
+        for segment in segments:
+            encoder.write(segment)
+        encoder.close()
+    except BaseException:
+        encoder.abort()
+        raise
+    return output_path.stat().st_size
+
+
+def transcode(
+    input_path: Path,
+    output_path: Path,
+    codec: str,
+    bitrate: str,
+    output_sample_rate: int | None = None,
+    application: str | None = None,
+) -> int:
+    """Re-encode an encoded file into `output_path` and return the file size.
+
+    Used when the PCM was not kept; a step down the bitrate ladder loses
+    little by starting from the already encoded audio.
+    """
+    output_options = ["-ac", "1"]
+    if output_sample_rate is not None:
+        output_options += ["-ar", str(output_sample_rate)]
+    if application is not None:
+        output_options += ["-application", application]
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            str(input_path),
+            "-c:a",
+            codec,
+            "-b:a",
+            bitrate,
+            *output_options,
+            str(output_path),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        output_path.unlink(missing_ok=True)
+        raise RuntimeError(f"ffmpeg conversion failed: {result.stderr.decode(errors='replace').strip()}")
+    return output_path.stat().st_size
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+
+def trim_silence(
+    audio: np.ndarray,
+    sample_rate: int,
+    threshold_db: float = -45.0,
+    frame_ms: float = 10.0,
+    keep_ms: float = 60.0,
+) -> np.ndarray:
+    """Return a view of `audio` without its leading and trailing silence.
+
+    Frame RMS is computed on a reshaped view, so the whole segment is
+    scanned in a few vectorized operations. `keep_ms` of the quiet edge is
+    kept so word onsets and releases are not clipped.
+    """
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    frames = audio.size // frame
+    if frames == 0:
+        return audio
+    framed = audio[: frames * frame].reshape(frames, frame)
+    rms = np.sqrt(np.mean(np.square(framed, dtype=np.float32), axis=1))
+    loud = np.flatnonzero(rms > 10 ** (threshold_db / 20))
+    if loud.size == 0:
+        return audio[:0]
+    keep = int(sample_rate * keep_ms / 1000)
+    start = max(0, loud[0] * frame - keep)
+    end = min(audio.size, (loud[-1] + 1) * frame + keep)
+    return audio[start:end]
+
+
+class PcmAssembler:
+    """Joins synthesized segments into one continuous PCM stream.
+
+    Each segment is trimmed of edge silence, brought to a common RMS level
+    (capped so it never clips) and crossfaded into the previous one. Audio
+    goes to `sink` as soon as no later segment can change it; only the open
+    crossfade tail is held back, in a buffer preallocated once. Memory is
+    one segment plus that tail, whatever the article length. `sink` gets
+    views into that buffer and must consume them before returning.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        sink: Callable[[np.ndarray], None],
+        crossfade_ms: float = 15.0,
+        target_rms_db: float = -20.0,
+        peak_limit: float = 0.98,
+        max_gain: float = 4.0,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self._sink = sink
+        self._crossfade = max(1, int(sample_rate * crossfade_ms / 1000))
+        self._tail = np.zeros(self._crossfade, dtype=np.float32)
+        self._tail_length = 0
+        self._target_rms = 10 ** (target_rms_db / 20)
+        self._peak_limit = peak_limit
+        self._max_gain = max_gain
+        self._fade_in = np.linspace(0.0, 1.0, self._crossfade, dtype=np.float32)
+        self._fade_out = self._fade_in[::-1].copy()
+        self.emitted_samples = 0
+        self.trimmed_samples = 0
+        self.peak_bytes = self._tail.nbytes
+
+    def append(self, audio: np.ndarray) -> None:
+        segment = trim_silence(audio, self.sample_rate)
+        self.trimmed_samples += audio.size - segment.size
+        if segment.size == 0:
+            return
+        # A fresh array, so the crossfade can be mixed into it in place.
+        segment = segment * np.float32(self._gain(segment))
+        self.peak_bytes = max(self.peak_bytes, audio.nbytes + segment.nbytes + self._tail.nbytes)
+
+        # The kept quiet edges of both segments overlap by up to `crossfade`
+        # samples, which removes the click of a hard cut.
+        overlap = min(self._crossfade, segment.size, self._tail_length)
+        if overlap:
+            segment[:overlap] *= self._fade_in[:overlap]
+            segment[:overlap] += self._tail[self._tail_length - overlap : self._tail_length] * self._fade_out[-overlap:]
+        self._emit(self._tail[: self._tail_length - overlap])
+
+        keep = min(self._crossfade, segment.size)
+        self._emit(segment[: segment.size - keep])
+        self._tail[:keep] = segment[segment.size - keep :]
+        self._tail_length = keep
+
+    def finish(self) -> None:
+        """Flush the held-back tail; nothing may be appended afterwards."""
+        self._emit(self._tail[: self._tail_length])
+        self._tail_length = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.emitted_samples + self._tail_length) / self.sample_rate
+
+    @property
+    def silence_removed_seconds(self) -> float:
+        return self.trimmed_samples / self.sample_rate
+
+    def _emit(self, audio: np.ndarray) -> None:
+        if audio.size:
+            self._sink(audio)
+            self.emitted_samples += audio.size
+
+    def _gain(self, segment: np.ndarray) -> float:
+        rms = float(np.sqrt(np.mean(np.square(segment, dtype=np.float32))))
+        peak = float(np.max(np.abs(segment)))
+        if rms == 0.0 or peak == 0.0:
+            return 1.0
+        return min(self._target_rms / rms, self._peak_limit / peak, self._max_gain)
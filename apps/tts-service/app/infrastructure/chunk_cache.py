@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.entities import TtsSelection
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+class ChunkAudioCache:
+    """Disk cache of synthesized PCM per text chunk.
+
+    A retry or a lightly edited article re-synthesizes only the chunks whose
+    text changed. Entries are float32 `.npy` files indexed in the `chunk_cache`
+    table, so TTS worker processes share every entry and one size limit; the
+    least recently used ones are evicted once the total grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, repository: SQLiteJobRepository) -> None:
+        self._cache_dir = cache_dir
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._index_files()
+
+    @staticmethod
+    def key(chunk: str, selection: TtsSelection, sample_rate: int) -> str:
+        payload = json.dumps(
+            [chunk, selection.model_id, selection.voice, round(selection.speed, 3), sample_rate],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> np.ndarray | None:
+        if not self._repository.touch_chunk_entry(key):
+            self._count(misses=1)
+            return None
+        try:
+            audio = np.load(self._path(key), allow_pickle=False)
+        except (OSError, ValueError):
+            # Evicted or corrupted between the index check and the read.
+            self._repository.delete_chunk_entry(key)
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+        return audio
+
+    def put(self, key: str, audio: np.ndarray) -> None:
+        path = self._path(key)
+        # Worker processes share the directory, so the name must be unique across them.
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        with tmp_path.open("wb") as handle:
+            np.save(handle, np.ascontiguousarray(audio, dtype=np.float32), allow_pickle=False)
+        tmp_path.replace(path)
+        evicted = self._repository.put_chunk_entry(key, size_bytes=path.stat().st_size, max_bytes=self._max_bytes)
+        self._remove(evicted)
+
+    def stats(self) -> dict[str, int | float]:
+        entries, total_bytes = self._repository.chunk_cache_usage()
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _count(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._evictions += evictions
+
+    def _remove(self, keys: list[str]) -> None:
+        self._count(evictions=len(keys))
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+    def _index_files(self) -> None:
+        # Files written before the index existed are adopted by modification time.
+        files = []
+        for path in self._cache_dir.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Evicted by another worker meanwhile.
+            last_used = datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat()
+            files.append((path.stem, stat.st_size, last_used))
+        self._remove(self._repository.index_chunk_files(files, max_bytes=self._max_bytes))
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.npy"
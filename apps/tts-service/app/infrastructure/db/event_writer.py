@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from threading import Lock
+from uuid import uuid4
+
+from app.infrastructure.db.sqlite_repository import EventRow, SQLiteJobRepository
+
+
+class JobEventWriter:
+    """Buffers `job_events` rows and writes them in one transaction.
+
+    Rows are flushed when `max_batch` is reached, every `flush_interval_seconds`
+    while the background loop runs, and explicitly via `flush()`.
+    """
+
+    def __init__(
+        self,
+        repository: SQLiteJobRepository,
+        *,
+        max_batch: int = 64,
+        flush_interval_seconds: float = 0.5,
+    ) -> None:
+        self._repository = repository
+        self._max_batch = max(1, max_batch)
+        self._flush_interval_seconds = max(0.01, flush_interval_seconds)
+        self._buffer: list[EventRow] = []
+        self._buffer_lock = Lock()
+        self._flush_lock = Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._flushes = 0
+        self._written = 0
+        self._flush_errors = 0
+
+    def add(self, job_id: str, level: str, message: str, item_id: str | None = None) -> None:
+        row = EventRow(
+            id=str(uuid4()),
+            job_id=job_id,
+            item_id=item_id,
+            level=level,
+            message=message,
+            created_at=self._repository.now_iso(),
+        )
+        with self._buffer_lock:
+            self._buffer.append(row)
+            should_flush = len(self._buffer) >= self._max_batch
+        if should_flush:
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                # `flush` put the rows back; the next flush retries them, so a
+                # failing write never surfaces in the caller's job handling.
+                pass
+
+    def flush(self) -> int:
+        # The flush lock keeps batches in insertion order when a size-triggered
+        # flush races the background loop.
+        with self._flush_lock:
+            with self._buffer_lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            try:
+                self._repository.add_events(rows)
+            except Exception:
+                with self._buffer_lock:
+                    self._buffer[:0] = rows
+                self._flush_errors += 1
+                raise
+            self._flushes += 1
+            self._written += len(rows)
+            return len(rows)
+
+    @property
+    def pending(self) -> int:
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending,
+            "flushes": self._flushes,
+            "written": self._written,
+            "flush_errors": self._flush_errors,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="job-event-writer")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            if not self.pending:
+                continue
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:  # noqa: BLE001
+                # Rows stay buffered and are retried on the next tick.
+                continue
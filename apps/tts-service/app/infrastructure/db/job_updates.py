@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Iterator
+from threading import Lock
+from typing import Any
+
+# Put in a subscriber's queue instead of the updates it could not hold; the
+# reader then resynchronizes from the database.
+LAGGED: dict[str, Any] = {"type": "lagged"}
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "partial_failed", "failed", "cancelled"})
+
+
+class JobSubscription:
+    """Updates for one job, delivered on the subscriber's event loop."""
+
+    def __init__(self, job_id: str, loop: asyncio.AbstractEventLoop, max_pending: int) -> None:
+        self.job_id = job_id
+        self._loop = loop
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._max_pending = max_pending
+        self._lagged = False
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """Next update, or None once `timeout` seconds pass without one."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Updates already queued, without waiting."""
+        updates = []
+        while not self._queue.empty():
+            updates.append(self._queue.get_nowait())
+        return updates
+
+    def _deliver(self, update: dict[str, Any]) -> None:
+        # Runs on the subscriber's loop. A reader that fell behind gets one
+        # `LAGGED` marker instead of an unbounded backlog.
+        if self._queue.qsize() >= self._max_pending:
+            if not self._lagged:
+                self._lagged = True
+                self._queue.put_nowait(LAGGED)
+            return
+        self._lagged = False
+        self._queue.put_nowait(update)
+
+
+class JobUpdateHub:
+    """In-process fan-out of job changes to waiting HTTP clients.
+
+    The repository publishes after each committed write, from whatever thread
+    made it; subscribers receive updates on their own event loop. A job with
+    no subscribers costs one dict lookup per write, and a waiting client
+    costs nothing until something changes.
+    """
+
+    def __init__(self, max_pending: int = 256) -> None:
+        self._max_pending = max(1, max_pending)
+        self._subscribers: dict[str, set[JobSubscription]] = {}
+        self._lock = Lock()
+        self._published = 0
+        self._delivered = 0
+
+    @contextlib.contextmanager
+    def subscribe(self, job_id: str) -> Iterator[JobSubscription]:
+        subscription = JobSubscription(job_id, asyncio.get_running_loop(), self._max_pending)
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[job_id]
+
+    def publish(self, job_id: str, update: dict[str, Any]) -> None:
+        with self._lock:
+            self._published += 1
+            subscribers = list(self._subscribers.get(job_id, ()))
+            self._delivered += len(subscribers)
+        for subscription in subscribers:
+            with contextlib.suppress(RuntimeError):
+                # The subscriber's loop has closed; its `subscribe` block is gone too.
+                subscription._loop.call_soon_threadsafe(subscription._deliver, update)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+                "published": self._published,
+                "delivered": self._delivered,
+            }
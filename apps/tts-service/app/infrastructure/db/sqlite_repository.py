@@ -1,32 +1,72 @@
 from __future__ import annotations
 
 import sqlite3
-from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import RLock
-from typing import Any, Iterator
+from typing import Any
 from uuid import uuid4
 
+from app.domain.entities import DeliverySelection, LmSelection, TtsSelection
+from app.infrastructure.db.connection_pool import SQLiteConnectionPool
+from app.infrastructure.db.job_updates import JobUpdateHub
+
+# Columns added after the initial schema. `init_schema` adds whichever are
+# missing, so existing databases pick them up on startup.
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "jobs": {
+        "tts_model_id": "TEXT",
+        "tts_voice": "TEXT",
+        "tts_speed": "REAL",
+        "summary_model_id": "TEXT",
+        "filename_model_id": "TEXT",
+        "delivery_prefer": "TEXT",
+        "delivery_fallback": "TEXT",
+        "delivery_split": "INTEGER",
+    },
+    "job_items": {
+        "chunks_done": "INTEGER",
+        "chunks_total": "INTEGER",
+        "partial_path": "TEXT",
+    },
+}
+
+
+@dataclass(slots=True)
+class EventRow:
+    id: str
+    job_id: str
+    item_id: str | None
+    level: str
+    message: str
+    created_at: str
+
+
+@dataclass(slots=True)
+class ClaimedItem:
+    item: dict[str, Any]
+    job: dict[str, Any]
+    job_started: bool
+
 
 class SQLiteJobRepository:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        busy_timeout_ms: int = 5_000,
+        synchronous: str = "NORMAL",
+    ) -> None:
         self._db_path = db_path
-        self._lock = RLock()
-
-    @contextmanager
-    def _conn(self) -> Iterator[sqlite3.Connection]:
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self._db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        self._pool = SQLiteConnectionPool(db_path, busy_timeout_ms=busy_timeout_ms, synchronous=synchronous)
+        # Job, item and event writes are published here once committed.
+        self.updates = JobUpdateHub()
+
+    def close(self) -> None:
+        self._pool.close()
 
     def init_schema(self) -> None:
-        with self._lock, self._conn() as conn:
+        with self._pool.writer() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -72,23 +112,127 @@ class SQLiteJobRepository:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS synthesis_cache (
+                    key TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    mime_type TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_used_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunk_cache (
+                    key TEXT PRIMARY KEY,
+                    size_bytes INTEGER NOT NULL,
+                    last_used_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS article_cache (
+                    url TEXT PRIMARY KEY,
+                    markdown TEXT NOT NULL,
+                    title TEXT,
+                    fetched_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lm_dialects (
+                    model_id TEXT PRIMARY KEY,
+                    dialect TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lm_validations (
+                    model_id TEXT PRIMARY KEY,
+                    valid INTEGER NOT NULL,
+                    reason TEXT,
+                    validated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_item_artifacts (
+                    item_id TEXT NOT NULL,
+                    part INTEGER NOT NULL,
+                    path TEXT,
+                    kind TEXT NOT NULL,
+                    mime_type TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    duration_seconds REAL,
+                    created_at TEXT NOT NULL,
+                    acked_at TEXT,
+                    PRIMARY KEY(item_id, part),
+                    FOREIGN KEY(item_id) REFERENCES job_items(id)
+                )
+                """
+            )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_job_items_job_id ON job_items(job_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_job_items_status ON job_items(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_items_artifact_path ON job_items(artifact_path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_item_artifacts_path ON job_item_artifacts(path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_synthesis_cache_last_used ON synthesis_cache(last_used_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chunk_cache_last_used ON chunk_cache(last_used_at)")
+            for table, columns in _ADDED_COLUMNS.items():
+                existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for name, column_type in columns.items():
+                    if name not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
 
     def healthcheck(self) -> bool:
-        with self._lock, self._conn() as conn:
+        with self._pool.reader() as conn:
             conn.execute("SELECT 1")
             return True
 
-    def create_job(self, chat_id: str, urls: list[str]) -> tuple[str, list[str]]:
+    def create_job(
+        self,
+        chat_id: str,
+        urls: list[str],
+        tts: TtsSelection | None = None,
+        lm: LmSelection | None = None,
+        delivery: DeliverySelection | None = None,
+    ) -> tuple[str, list[str]]:
         now = self.now_iso()
         job_id = str(uuid4())
         item_ids = [str(uuid4()) for _ in urls]
 
-        with self._lock, self._conn() as conn:
+        with self._pool.writer() as conn:
             conn.execute(
-                "INSERT INTO jobs (id, chat_id, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
-                (job_id, chat_id, "queued", now, now),
+                """
+                INSERT INTO jobs (
+                    id, chat_id, status, created_at, updated_at,
+                    tts_model_id, tts_voice, tts_speed, summary_model_id, filename_model_id,
+                    delivery_prefer, delivery_fallback, delivery_split
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    chat_id,
+                    "queued",
+                    now,
+                    now,
+                    tts.model_id if tts else None,
+                    tts.voice if tts else None,
+                    tts.speed if tts else None,
+                    lm.summary_model_id if lm else None,
+                    lm.filename_model_id if lm else None,
+                    delivery.prefer if delivery else None,
+                    delivery.fallback if delivery else None,
+                    int(delivery.split) if delivery else None,
+                ),
             )
             conn.executemany(
                 """
@@ -102,12 +246,12 @@ class SQLiteJobRepository:
         return job_id, item_ids
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
-        with self._lock, self._conn() as conn:
+        with self._pool.reader() as conn:
             row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
             return dict(row) if row else None
 
     def get_job_items(self, job_id: str) -> list[dict[str, Any]]:
-        with self._lock, self._conn() as conn:
+        with self._pool.reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM job_items WHERE job_id = ? ORDER BY created_at ASC",
                 (job_id,),
@@ -115,25 +259,120 @@ class SQLiteJobRepository:
             return [dict(row) for row in rows]
 
     def get_job_item(self, job_id: str, item_id: str) -> dict[str, Any] | None:
-        with self._lock, self._conn() as conn:
+        with self._pool.reader() as conn:
             row = conn.execute(
                 "SELECT * FROM job_items WHERE id = ? AND job_id = ?",
                 (item_id, job_id),
             ).fetchone()
             return dict(row) if row else None
 
+    def claim_next_item(self) -> ClaimedItem | None:
+        now = self.now_iso()
+        with self._pool.writer() as conn:
+            row = conn.execute(
+                """
+                UPDATE job_items
+                SET status = 'processing', updated_at = ?
+                WHERE id = (
+                    SELECT job_items.id
+                    FROM job_items
+                    JOIN jobs ON jobs.id = job_items.job_id
+                    WHERE job_items.status = 'queued' AND jobs.status IN ('queued', 'processing')
+                    ORDER BY job_items.created_at ASC, job_items.rowid ASC
+                    LIMIT 1
+                )
+                RETURNING *
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            item = dict(row)
+            started = conn.execute(
+                "UPDATE jobs SET status = 'processing', updated_at = ? WHERE id = ? AND status = 'queued'",
+                (now, item["job_id"]),
+            ).rowcount
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (item["job_id"],)).fetchone()
+            claimed = ClaimedItem(item=item, job=dict(job), job_started=started == 1)
+        if claimed.job_started:
+            self.updates.publish(item["job_id"], {"type": "job", "status": "processing", "error_message": None})
+        self.updates.publish(
+            item["job_id"],
+            {"type": "item", "item_id": item["id"], "status": "processing", "error": None},
+        )
+        return claimed
+
+    def requeue_interrupted_items(self) -> set[str]:
+        with self._pool.writer() as conn:
+            rows = conn.execute(
+                """
+                UPDATE job_items
+                SET status = 'queued', updated_at = ?
+                WHERE status = 'processing'
+                  AND job_id IN (SELECT id FROM jobs WHERE status IN ('queued', 'processing'))
+                RETURNING job_id
+                """,
+                (self.now_iso(),),
+            ).fetchall()
+            return {row["job_id"] for row in rows}
+
+    def list_active_job_ids(self) -> list[str]:
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('queued', 'processing') ORDER BY created_at ASC"
+            ).fetchall()
+            return [row["id"] for row in rows]
+
+    def count_open_items(self, job_id: str) -> int:
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS open FROM job_items WHERE job_id = ? AND status IN ('queued', 'processing')",
+                (job_id,),
+            ).fetchone()
+            return int(row["open"])
+
     def update_job_status(self, job_id: str, status: str, error_message: str | None = None) -> None:
-        with self._lock, self._conn() as conn:
+        with self._pool.writer() as conn:
             conn.execute(
                 "UPDATE jobs SET status = ?, error_message = ?, updated_at = ? WHERE id = ?",
                 (status, error_message, self.now_iso(), job_id),
             )
+        self.updates.publish(job_id, {"type": "job", "status": status, "error_message": error_message})
 
     def update_item_status(self, item_id: str, status: str, error_message: str | None = None) -> None:
-        with self._lock, self._conn() as conn:
-            conn.execute(
-                "UPDATE job_items SET status = ?, error_message = ?, updated_at = ? WHERE id = ?",
+        with self._pool.writer() as conn:
+            row = conn.execute(
+                "UPDATE job_items SET status = ?, error_message = ?, updated_at = ? WHERE id = ? RETURNING job_id",
                 (status, error_message, self.now_iso(), item_id),
+            ).fetchone()
+        if row is not None:
+            self.updates.publish(
+                row["job_id"],
+                {"type": "item", "item_id": item_id, "status": status, "error": error_message},
+            )
+
+    def update_item_progress(
+        self,
+        item_id: str,
+        *,
+        chunks_done: int,
+        chunks_total: int,
+        partial_path: str | None = None,
+    ) -> None:
+        with self._pool.writer() as conn:
+            row = conn.execute(
+                """
+                UPDATE job_items
+                SET chunks_done = ?, chunks_total = ?, partial_path = COALESCE(?, partial_path), updated_at = ?
+                WHERE id = ?
+                RETURNING job_id
+                """,
+                (chunks_done, chunks_total, partial_path, self.now_iso(), item_id),
+            ).fetchone()
+        if row is not None:
+            self.updates.publish(
+                row["job_id"],
+                {"type": "progress", "item_id": item_id, "chunks_done": chunks_done, "chunks_total": chunks_total},
             )
 
     def set_item_result(
@@ -147,8 +386,8 @@ class SQLiteJobRepository:
         mime_type: str,
         size_bytes: int,
     ) -> None:
-        with self._lock, self._conn() as conn:
-            conn.execute(
+        with self._pool.writer() as conn:
+            row = conn.execute(
                 """
                 UPDATE job_items
                 SET
@@ -162,6 +401,7 @@ class SQLiteJobRepository:
                     error_message = NULL,
                     updated_at = ?
                 WHERE id = ?
+                RETURNING job_id
                 """,
                 (
                     "completed",
@@ -174,41 +414,409 @@ class SQLiteJobRepository:
                     self.now_iso(),
                     item_id,
                 ),
+            ).fetchone()
+        if row is not None:
+            self.updates.publish(
+                row["job_id"],
+                {
+                    "type": "item",
+                    "item_id": item_id,
+                    "status": "completed",
+                    "error": None,
+                    "artifact": {"kind": artifact_kind, "mime_type": mime_type, "size_bytes": size_bytes},
+                },
             )
 
     def clear_item_artifact(self, item_id: str) -> None:
-        with self._lock, self._conn() as conn:
-            conn.execute(
+        with self._pool.writer() as conn:
+            row = conn.execute(
                 """
                 UPDATE job_items
                 SET artifact_path = NULL, updated_at = ?
                 WHERE id = ?
+                RETURNING job_id, status, error_message
                 """,
                 (self.now_iso(), item_id),
+            ).fetchone()
+        if row is not None:
+            self.updates.publish(
+                row["job_id"],
+                {
+                    "type": "item",
+                    "item_id": item_id,
+                    "status": row["status"],
+                    "error": row["error_message"],
+                    "artifact": None,
+                },
             )
 
-    def add_event(self, job_id: str, level: str, message: str, item_id: str | None = None) -> None:
-        with self._lock, self._conn() as conn:
+    def add_item_artifact(
+        self,
+        item_id: str,
+        *,
+        part: int,
+        path: str,
+        kind: str,
+        mime_type: str,
+        size_bytes: int,
+        duration_seconds: float | None = None,
+    ) -> None:
+        with self._pool.writer() as conn:
             conn.execute(
+                """
+                INSERT OR REPLACE INTO job_item_artifacts (
+                    item_id, part, path, kind, mime_type, size_bytes, duration_seconds, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (item_id, part, path, kind, mime_type, size_bytes, duration_seconds, self.now_iso()),
+            )
+            row = conn.execute("SELECT job_id FROM job_items WHERE id = ?", (item_id,)).fetchone()
+        if row is not None:
+            self.updates.publish(
+                row["job_id"],
+                {
+                    "type": "part",
+                    "item_id": item_id,
+                    "part": part,
+                    "size_bytes": size_bytes,
+                    "duration_seconds": duration_seconds,
+                    "acked": False,
+                },
+            )
+
+    def list_job_artifacts(self, job_id: str) -> list[dict[str, Any]]:
+        """Parts of every multi-part item of the job, by item then part."""
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT artifacts.*
+                FROM job_item_artifacts AS artifacts
+                JOIN job_items ON job_items.id = artifacts.item_id
+                WHERE job_items.job_id = ?
+                ORDER BY artifacts.item_id, artifacts.part
+                """,
+                (job_id,),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def get_item_artifact(self, job_id: str, item_id: str, part: int) -> dict[str, Any] | None:
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                """
+                SELECT artifacts.*
+                FROM job_item_artifacts AS artifacts
+                JOIN job_items ON job_items.id = artifacts.item_id
+                WHERE job_items.job_id = ? AND artifacts.item_id = ? AND artifacts.part = ?
+                """,
+                (job_id, item_id, part),
+            ).fetchone()
+            return dict(row) if row else None
+
+    def clear_item_artifact_part(self, item_id: str, part: int) -> None:
+        with self._pool.writer() as conn:
+            row = conn.execute(
+                """
+                UPDATE job_item_artifacts SET path = NULL, acked_at = ?
+                WHERE item_id = ? AND part = ?
+                RETURNING size_bytes, duration_seconds
+                """,
+                (self.now_iso(), item_id, part),
+            ).fetchone()
+            job = conn.execute("SELECT job_id FROM job_items WHERE id = ?", (item_id,)).fetchone()
+        if row is not None and job is not None:
+            self._publish_acked_part(job["job_id"], item_id, part, row)
+
+    def clear_item_artifact_parts(self, item_id: str) -> list[str]:
+        """Clear every unacknowledged part of the item and return their paths."""
+        with self._pool.writer() as conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    job_items.job_id, artifacts.part, artifacts.path, artifacts.size_bytes, artifacts.duration_seconds
+                FROM job_item_artifacts AS artifacts
+                JOIN job_items ON job_items.id = artifacts.item_id
+                WHERE artifacts.item_id = ? AND artifacts.path IS NOT NULL
+                ORDER BY artifacts.part
+                """,
+                (item_id,),
+            ).fetchall()
+            conn.execute(
+                "UPDATE job_item_artifacts SET path = NULL, acked_at = ? WHERE item_id = ? AND path IS NOT NULL",
+                (self.now_iso(), item_id),
+            )
+        for row in rows:
+            self._publish_acked_part(row["job_id"], item_id, row["part"], row)
+        return [row["path"] for row in rows]
+
+    def _publish_acked_part(self, job_id: str, item_id: str, part: int, row: sqlite3.Row) -> None:
+        self.updates.publish(
+            job_id,
+            {
+                "type": "part",
+                "item_id": item_id,
+                "part": part,
+                "size_bytes": row["size_bytes"],
+                "duration_seconds": row["duration_seconds"],
+                "acked": True,
+            },
+        )
+
+    def add_event(self, job_id: str, level: str, message: str, item_id: str | None = None) -> None:
+        self.add_events([EventRow(str(uuid4()), job_id, item_id, level, message, self.now_iso())])
+
+    def add_events(self, rows: list[EventRow]) -> None:
+        if not rows:
+            return
+        with self._pool.writer() as conn:
+            conn.executemany(
                 "INSERT INTO job_events (id, job_id, item_id, level, message, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (str(uuid4()), job_id, item_id, level, message, self.now_iso()),
+                [(row.id, row.job_id, row.item_id, row.level, row.message, row.created_at) for row in rows],
             )
+        for row in rows:
+            self.updates.publish(row.job_id, self.event_update(asdict(row)))
+
+    def get_job_events(self, job_id: str, since: str | None = None) -> list[dict[str, Any]]:
+        """Events of the job in insertion order, only those after event `since` if given.
+
+        An unknown `since` id returns every event, so a client never skips any.
+        """
+        with self._pool.reader() as conn:
+            if since is None:
+                rows = conn.execute(
+                    "SELECT * FROM job_events WHERE job_id = ? ORDER BY rowid ASC",
+                    (job_id,),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM job_events
+                    WHERE job_id = ?
+                      AND rowid > COALESCE((SELECT rowid FROM job_events WHERE id = ? AND job_id = ?), 0)
+                    ORDER BY rowid ASC
+                    """,
+                    (job_id, since, job_id),
+                ).fetchall()
+            return [dict(row) for row in rows]
+
+    @staticmethod
+    def event_update(event: dict[str, Any]) -> dict[str, Any]:
+        """The published/streamed form of a `job_events` row."""
+        return {
+            "type": "event",
+            "id": event["id"],
+            "item_id": event["item_id"],
+            "level": event["level"],
+            "message": event["message"],
+            "created_at": event["created_at"],
+        }
+
+    def artifact_in_use(self, path: str) -> bool:
+        """True while an item or part still references `path` or the synthesis cache owns it."""
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    EXISTS(SELECT 1 FROM job_items WHERE artifact_path = ?)
+                    OR EXISTS(SELECT 1 FROM job_item_artifacts WHERE path = ?)
+                    OR EXISTS(SELECT 1 FROM synthesis_cache WHERE path = ?) AS in_use
+                """,
+                (path, path, path),
+            ).fetchone()
+            return bool(row["in_use"])
+
+    def get_cache_entry(self, key: str) -> dict[str, Any] | None:
+        with self._pool.reader() as conn:
+            row = conn.execute("SELECT * FROM synthesis_cache WHERE key = ?", (key,)).fetchone()
+            return dict(row) if row else None
+
+    def touch_cache_entry(self, key: str) -> None:
+        with self._pool.writer() as conn:
+            conn.execute(
+                "UPDATE synthesis_cache SET last_used_at = ? WHERE key = ?",
+                (self.now_iso(), key),
+            )
+
+    def put_cache_entry(self, key: str, *, path: str, kind: str, mime_type: str, size_bytes: int) -> None:
+        now = self.now_iso()
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO synthesis_cache (key, path, kind, mime_type, size_bytes, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    path = excluded.path,
+                    kind = excluded.kind,
+                    mime_type = excluded.mime_type,
+                    size_bytes = excluded.size_bytes,
+                    last_used_at = excluded.last_used_at
+                """,
+                (key, path, kind, mime_type, size_bytes, now, now),
+            )
+
+    def delete_cache_entry(self, key: str) -> None:
+        with self._pool.writer() as conn:
+            conn.execute("DELETE FROM synthesis_cache WHERE key = ?", (key,))
+
+    def list_cache_entries(self) -> list[dict[str, Any]]:
+        """Cache entries, least recently used first."""
+        with self._pool.reader() as conn:
+            rows = conn.execute("SELECT * FROM synthesis_cache ORDER BY last_used_at ASC").fetchall()
+            return [dict(row) for row in rows]
+
+    def touch_chunk_entry(self, key: str) -> bool:
+        """Mark a cached chunk as used; False if it is not indexed."""
+        with self._pool.writer() as conn:
+            return conn.execute(
+                "UPDATE chunk_cache SET last_used_at = ? WHERE key = ?",
+                (self.now_iso(), key),
+            ).rowcount == 1
+
+    def put_chunk_entry(self, key: str, *, size_bytes: int, max_bytes: int) -> list[str]:
+        """Index a cached chunk and return the keys evicted to stay under `max_bytes`."""
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO chunk_cache (key, size_bytes, last_used_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET size_bytes = excluded.size_bytes, last_used_at = excluded.last_used_at
+                """,
+                (key, size_bytes, self.now_iso()),
+            )
+            return self._evict_chunks(conn, max_bytes)
+
+    def index_chunk_files(self, files: list[tuple[str, int, str]], *, max_bytes: int) -> list[str]:
+        """Index `(key, size_bytes, last_used_at)` chunk files not known yet; return the keys evicted."""
+        with self._pool.writer() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO chunk_cache (key, size_bytes, last_used_at) VALUES (?, ?, ?)",
+                files,
+            )
+            return self._evict_chunks(conn, max_bytes)
+
+    def delete_chunk_entry(self, key: str) -> None:
+        with self._pool.writer() as conn:
+            conn.execute("DELETE FROM chunk_cache WHERE key = ?", (key,))
+
+    def chunk_cache_usage(self) -> tuple[int, int]:
+        """Indexed chunks and their total size in bytes."""
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS entries, COALESCE(SUM(size_bytes), 0) AS bytes FROM chunk_cache"
+            ).fetchone()
+            return int(row["entries"]), int(row["bytes"])
+
+    @staticmethod
+    def _evict_chunks(conn: sqlite3.Connection, max_bytes: int) -> list[str]:
+        # Keeps the most recently used chunks that fit, and always the newest one.
+        keys = [
+            row["key"]
+            for row in conn.execute(
+                """
+                SELECT key FROM (
+                    SELECT
+                        key,
+                        SUM(size_bytes) OVER recent AS kept_bytes,
+                        ROW_NUMBER() OVER recent AS position
+                    FROM chunk_cache
+                    WINDOW recent AS (ORDER BY last_used_at DESC, key DESC)
+                )
+                WHERE kept_bytes > ? AND position > 1
+                """,
+                (max_bytes,),
+            )
+        ]
+        conn.executemany("DELETE FROM chunk_cache WHERE key = ?", [(key,) for key in keys])
+        return keys
+
+    def get_cached_article(self, url: str, *, fetched_after: str) -> dict[str, Any] | None:
+        with self._pool.reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM article_cache WHERE url = ? AND fetched_at > ?",
+                (url, fetched_after),
+            ).fetchone()
+            return dict(row) if row else None
+
+    def put_cached_article(self, url: str, *, markdown: str, title: str | None) -> None:
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO article_cache (url, markdown, title, fetched_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    markdown = excluded.markdown,
+                    title = excluded.title,
+                    fetched_at = excluded.fetched_at
+                """,
+                (url, markdown, title, self.now_iso()),
+            )
+
+    def prune_cached_articles(self, *, fetched_before: str) -> int:
+        with self._pool.writer() as conn:
+            return conn.execute("DELETE FROM article_cache WHERE fetched_at <= ?", (fetched_before,)).rowcount
+
+    def list_lm_dialects(self) -> dict[str, str]:
+        with self._pool.reader() as conn:
+            rows = conn.execute("SELECT model_id, dialect FROM lm_dialects").fetchall()
+            return {row["model_id"]: row["dialect"] for row in rows}
+
+    def put_lm_dialect(self, model_id: str, dialect: str) -> None:
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO lm_dialects (model_id, dialect, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(model_id) DO UPDATE SET
+                    dialect = excluded.dialect,
+                    updated_at = excluded.updated_at
+                """,
+                (model_id, dialect, self.now_iso()),
+            )
+
+    def get_lm_validation(self, model_id: str) -> dict[str, Any] | None:
+        with self._pool.reader() as conn:
+            row = conn.execute("SELECT * FROM lm_validations WHERE model_id = ?", (model_id,)).fetchone()
+            return dict(row) if row else None
+
+    def put_lm_validation(self, model_id: str, *, valid: bool, reason: str | None) -> None:
+        with self._pool.writer() as conn:
+            conn.execute(
+                """
+                INSERT INTO lm_validations (model_id, valid, reason, validated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(model_id) DO UPDATE SET
+                    valid = excluded.valid,
+                    reason = excluded.reason,
+                    validated_at = excluded.validated_at
+                """,
+                (model_id, int(valid), reason, self.now_iso()),
+            )
+
+    def invalidate_lm_validations(self, *, keep_valid: list[str]) -> int:
+        """Drop failed validations and those of models not in `keep_valid`."""
+        placeholders = ", ".join("?" for _ in keep_valid)
+        with self._pool.writer() as conn:
+            return conn.execute(
+                f"DELETE FROM lm_validations WHERE valid = 0 OR model_id NOT IN ({placeholders})",
+                keep_valid,
+            ).rowcount
 
     def mark_cancelled(self, job_id: str) -> None:
-        with self._lock, self._conn() as conn:
+        with self._pool.writer() as conn:
             conn.execute(
                 "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
                 ("cancelled", self.now_iso(), job_id),
             )
-            conn.execute(
+            rows = conn.execute(
                 """
                 UPDATE job_items
-                SET status = CASE WHEN status IN ('queued', 'processing') THEN 'cancelled' ELSE status END,
-                    updated_at = ?
-                WHERE job_id = ?
+                SET status = 'cancelled', updated_at = ?
+                WHERE job_id = ? AND status IN ('queued', 'processing')
+                RETURNING id
                 """,
                 (self.now_iso(), job_id),
-            )
+            ).fetchall()
+        for row in rows:
+            self.updates.publish(job_id, {"type": "item", "item_id": row["id"], "status": "cancelled", "error": None})
+        self.updates.publish(job_id, {"type": "job", "status": "cancelled", "error_message": None})
 
     def is_cancelled(self, job_id: str) -> bool:
         job = self.get_job(job_id)
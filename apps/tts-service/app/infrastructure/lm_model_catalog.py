@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import TypeVar
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.lm_studio_client import LmStudioClient, LmValidationResult
+
+T = TypeVar("T")
+
+
+class LmModelCatalog:
+    """Cached LM model list and validation results for the settings routes.
+
+    The model list is kept for `models_ttl_seconds`; validation results are
+    stored in `lm_validations` and survive restarts. Stale values are served
+    immediately while a background task refreshes them. When a refresh sees
+    a different model list, validations of removed models and failed
+    validations are dropped, so the next request re-checks them. Checks that
+    could not reach LM Studio are never stored.
+    """
+
+    def __init__(
+        self,
+        client: LmStudioClient,
+        repository: SQLiteJobRepository,
+        models_ttl_seconds: float = 60.0,
+        validation_ttl_seconds: float = 86_400.0,
+    ) -> None:
+        self._client = client
+        self._repository = repository
+        self._models_ttl = models_ttl_seconds
+        self._validation_ttl = timedelta(seconds=validation_ttl_seconds)
+        self._models: list[str] | None = None
+        self._models_fetched_at = 0.0
+        self._refreshes: dict[str, asyncio.Task[object]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._background_refreshes = 0
+        self._invalidations = 0
+
+    async def list_models(self) -> list[str]:
+        if self._models is None:
+            self._misses += 1
+            return await asyncio.shield(self._start_refresh("list_models", self._refresh_models))
+        self._hits += 1
+        if time.monotonic() - self._models_fetched_at >= self._models_ttl:
+            self._background_refreshes += 1
+            self._start_refresh("list_models", self._refresh_models)
+        return list(self._models)
+
+    async def validate_model(self, model_id: str) -> LmValidationResult:
+        cached = self._repository.get_lm_validation(model_id)
+        if cached is None:
+            self._misses += 1
+            return await asyncio.shield(self._start_refresh(f"validate:{model_id}", partial(self._refresh_validation, model_id)))
+
+        self._hits += 1
+        stale_before = (datetime.now(timezone.utc) - self._validation_ttl).isoformat()
+        if cached["validated_at"] <= stale_before:
+            self._background_refreshes += 1
+            self._start_refresh(f"validate:{model_id}", partial(self._refresh_validation, model_id))
+        return LmValidationResult(valid=bool(cached["valid"]), reason=cached["reason"])
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "background_refreshes": self._background_refreshes,
+            "invalidations": self._invalidations,
+        }
+
+    async def _refresh_models(self) -> list[str]:
+        models = await self._client.list_models()
+        if self._models is not None and set(models) != set(self._models):
+            self._invalidations += self._repository.invalidate_lm_validations(keep_valid=models)
+        self._models = models
+        self._models_fetched_at = time.monotonic()
+        return list(models)
+
+    async def _refresh_validation(self, model_id: str) -> LmValidationResult:
+        result = await self._client.validate_model(model_id)
+        # An unreachable LM Studio is not the model's fault; the next request re-checks.
+        if not result.transient:
+            self._repository.put_lm_validation(model_id, valid=result.valid, reason=result.reason)
+        return result
+
+    def _start_refresh(self, key: str, refresh: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """Start `refresh` unless one for `key` is already running; return its task."""
+        task = self._refreshes.get(key)
+        if task is None:
+            task = asyncio.create_task(refresh())
+            self._refreshes[key] = task
+            task.add_done_callback(partial(self._refresh_done, key))
+        return task  # type: ignore[return-value]
+
+    def _refresh_done(self, key: str, task: asyncio.Task[object]) -> None:
+        self._refreshes.pop(key, None)
+        # Background failures keep the stale value; the next request retries.
+        if not task.cancelled():
+            task.exception()
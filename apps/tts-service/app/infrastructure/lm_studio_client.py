@@ -1,178 +1,344 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 from dataclasses import dataclass
+from typing import Any, Final
 
-import requests
+import httpx
 
 from app.domain.entities import LmSelection
+from app.domain.text_budget import chars_for_tokens, estimate_tokens, select_spans
+from app.domain.text_processing import chunk_text
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+# Request shapes LM Studio models accept, in the order they are tried for a
+# model whose dialect is not known yet. Some prompt templates reject plain
+# string content and only work with structured parts or raw completions.
+_DIALECTS: Final = ("chat", "chat_parts", "completions")
+_DIALECT_ENDPOINTS: Final = {
+    "chat": "chat/completions",
+    "chat_parts": "chat/completions",
+    "completions": "completions",
+}
+
+# Tokens reserved for instructions around the article in each prompt.
+_PROMPT_OVERHEAD_TOKENS: Final = 256
+_MIN_INPUT_TOKENS: Final = 256
+_FILENAME_INPUT_TOKENS: Final = 1_000
+# Up to this multiple of the budget, dropping paragraphs keeps enough of the
+# article; beyond it, chunks are summarized first (map) and then combined.
+_SPAN_SELECTION_MAX_RATIO: Final = 3
+_MAP_REPLY_TOKENS: Final = 200
+_COMBINED_REPLY_TOKENS: Final = 300
+
+
+def _build_payload(
+    dialect: str,
+    model_id: str,
+    prompt: str,
+    *,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str | None,
+    lang_code: str,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {"model": model_id, "temperature": temperature, "max_tokens": max_tokens}
+    if dialect == "chat":
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        payload["messages"] = [*messages, {"role": "user", "content": prompt}]
+    elif dialect == "chat_parts":
+        payload["messages"] = [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "source_lang_code": lang_code,
+                        "target_lang_code": lang_code,
+                        "text": prompt,
+                        "image": None,
+                    }
+                ],
+            }
+        ]
+    else:
+        payload["prompt"] = prompt
+    return payload
+
+
+def parse_metadata_json(text: str) -> tuple[str | None, str | None]:
+    """Read `summary` and `filename` from a model reply that should be JSON.
+
+    Models wrap JSON in code fences or prose often enough that the first
+    decodable object with either field is used. A missing or empty field
+    comes back as `None` so the caller can fall back for that field alone.
+    """
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r"\{", text):
+        try:
+            payload, _ = decoder.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(payload, dict) or not {"summary", "filename"} & payload.keys():
+            continue
+        summary, filename = payload.get("summary"), payload.get("filename")
+        return (
+            summary.strip() if isinstance(summary, str) and summary.strip() else None,
+            filename.strip() if isinstance(filename, str) and filename.strip() else None,
+        )
+    return None, None
 
 
 @dataclass(slots=True)
 class LmValidationResult:
     valid: bool
     reason: str | None = None
+    # LM Studio could not be reached, so the result says nothing about the model.
+    transient: bool = False
 
 
 class LmStudioClient:
-    def __init__(self, base_url: str, timeout_seconds: int = 30) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._timeout_seconds = timeout_seconds
+    """Async LM Studio client over one keep-alive connection pool.
+
+    Calls are native coroutines, so summary and filename requests do not
+    occupy a thread while the model generates. The request shape that works
+    for each model is remembered (and persisted when a repository is given),
+    so later calls skip the shapes that model rejects.
+    """
 
-    def list_models(self) -> list[str]:
-        response = requests.get(
-            f"{self._base_url}/models",
-            timeout=self._timeout_seconds,
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: int = 30,
+        max_connections: int = 8,
+        max_keepalive_connections: int = 4,
+        keepalive_expiry_seconds: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        repository: SQLiteJobRepository | None = None,
+        context_tokens: int = 4_096,
+        model_context_tokens: dict[str, int] | None = None,
+        map_parallelism: int = 2,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._repository = repository
+        self._context_tokens = context_tokens
+        self._model_context_tokens = model_context_tokens or {}
+        self._map_parallelism = max(1, map_parallelism)
+        self._span_selections = 0
+        self._map_reduce_runs = 0
+        self._dialects: dict[str, str] = repository.list_lm_dialects() if repository is not None else {}
+        self._requests = 0
+        self._fallback_attempts = 0
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_seconds,
+            ),
+            transport=transport,
         )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def list_models(self) -> list[str]:
+        response = await self._client.get(f"{self._base_url}/models")
         response.raise_for_status()
         payload = response.json()
         data = payload.get("data", [])
         return [item.get("id", "") for item in data if item.get("id")]
 
-    def validate_model(self, model_id: str) -> LmValidationResult:
-        attempts = [
-            {
-                "model": model_id,
-                "messages": [{"role": "user", "content": "Reply with exactly: ok"}],
-                "temperature": 0,
-                "max_tokens": 8,
-            },
-            {
-                "model": model_id,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "source_lang_code": "EN",
-                                "target_lang_code": "EN",
-                                "text": "Reply with exactly: ok",
-                                "image": None,
-                            }
-                        ],
-                    }
-                ],
-                "temperature": 0,
-                "max_tokens": 8,
-            },
-            {
-                "model": model_id,
-                "prompt": "Reply with exactly: ok",
-                "temperature": 0,
-                "max_tokens": 8,
-            },
-        ]
-
-        errors: list[str] = []
-
-        for index, payload in enumerate(attempts):
-            endpoint = "chat/completions" if index < 2 else "completions"
-            try:
-                response = requests.post(
-                    f"{self._base_url}/{endpoint}",
-                    json=payload,
-                    timeout=self._timeout_seconds,
-                )
-                if response.status_code >= 400:
-                    errors.append(f"{endpoint}: {response.text[:200]}")
-                    continue
-
-                text = self._extract_text(response.json())
-                if text.strip():
-                    return LmValidationResult(valid=True)
-                errors.append(f"{endpoint}: empty response")
-            except Exception as exc:  # noqa: BLE001
-                errors.append(f"{endpoint}: {exc}")
-
+    async def validate_model(self, model_id: str) -> LmValidationResult:
+        try:
+            text, errors = await self._complete(
+                model_id,
+                "Reply with exactly: ok",
+                temperature=0,
+                max_tokens=8,
+                system_prompt=None,
+                lang_code="EN",
+            )
+        except httpx.TransportError as exc:
+            return LmValidationResult(valid=False, reason=f"LM Studio unreachable: {exc!r}", transient=True)
+        if text is not None:
+            return LmValidationResult(valid=True)
         reason = " | ".join(errors)[:1000] if errors else "Unknown validation error"
         return LmValidationResult(valid=False, reason=reason)
 
-    def summarize(self, text: str, selection: LmSelection) -> str:
+    async def summarize(self, text: str, selection: LmSelection) -> str:
+        article = await self._fit_article(text, selection.summary_model_id, reply_tokens=220)
         prompt = (
             "Summarize the following article in 2-4 concise sentences. "
             "Focus on concrete facts and keep the output plain text.\n\n"
-            f"Article:\n{text[:12000]}"
+            f"Article:\n{article}"
         )
-        return self._chat(selection.summary_model_id, prompt, max_tokens=220)
+        return await self._chat(selection.summary_model_id, prompt, max_tokens=220)
 
-    def filename(self, text: str, url: str, selection: LmSelection) -> str:
+    async def filename(self, text: str, url: str, selection: LmSelection) -> str:
+        budget = min(_FILENAME_INPUT_TOKENS, self._input_budget(selection.filename_model_id, reply_tokens=48))
         prompt = (
             "Generate a short filename slug for an audio file from this article. "
             "Rules: lowercase, english letters/numbers/hyphen only, 4-10 words, no extension, no extra text.\n\n"
             f"URL: {url}\n"
-            f"Content:\n{text[:4000]}"
+            f"Content:\n{select_spans(text, budget)}"
         )
-        return self._chat(selection.filename_model_id, prompt, max_tokens=48)
-
-    def _chat(self, model_id: str, prompt: str, max_tokens: int) -> str:
-        attempts = [
-            (
-                "chat/completions",
-                {
-                    "model": model_id,
-                    "messages": [
-                        {"role": "system", "content": "You are a concise assistant."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.2,
-                    "max_tokens": max_tokens,
-                },
-            ),
-            (
-                "chat/completions",
-                {
-                    "model": model_id,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "source_lang_code": "en",
-                                    "target_lang_code": "en",
-                                    "text": prompt,
-                                    "image": None,
-                                }
-                            ],
-                        }
-                    ],
-                    "temperature": 0.2,
-                    "max_tokens": max_tokens,
-                },
-            ),
-            (
-                "completions",
-                {
-                    "model": model_id,
-                    "prompt": prompt,
-                    "temperature": 0.2,
-                    "max_tokens": max_tokens,
-                },
-            ),
-        ]
+        return await self._chat(selection.filename_model_id, prompt, max_tokens=48)
+
+    async def summary_and_filename(
+        self,
+        text: str,
+        url: str,
+        selection: LmSelection,
+    ) -> tuple[str | None, str | None]:
+        """Summary and filename slug from one request, for when both use the same model."""
+        article = await self._fit_article(text, selection.summary_model_id, reply_tokens=_COMBINED_REPLY_TOKENS)
+        prompt = (
+            "Read the article and reply with only a JSON object with two string fields:\n"
+            '- "summary": 2-4 concise sentences with concrete facts, plain text.\n'
+            '- "filename": a short slug for an audio file; lowercase, english letters/numbers/hyphen only, '
+            "4-10 words, no extension.\n"
+            'Example: {"summary": "...", "filename": "..."}\n\n'
+            f"URL: {url}\n"
+            f"Article:\n{article}"
+        )
+        reply = await self._chat(selection.summary_model_id, prompt, max_tokens=_COMBINED_REPLY_TOKENS)
+        return parse_metadata_json(reply)
+
+    def request_rounds(self, text: str, model_id: str) -> int:
+        """Sequential requests a summary of `text` takes, so callers can size their timeout.
+
+        1 unless the article needs map-reduce; then one round per
+        `map_parallelism` chunks plus the final request.
+        """
+        budget = self._input_budget(model_id, _COMBINED_REPLY_TOKENS)
+        if estimate_tokens(text) <= budget * _SPAN_SELECTION_MAX_RATIO:
+            return 1
+        chunks = len(self._map_chunks(text, model_id))
+        return -(-chunks // self._map_parallelism) + 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self._requests,
+            "fallback_attempts": self._fallback_attempts,
+            "known_dialects": len(self._dialects),
+            "span_selections": self._span_selections,
+            "map_reduce_runs": self._map_reduce_runs,
+        }
+
+    def _input_budget(self, model_id: str, reply_tokens: int) -> int:
+        context = self._model_context_tokens.get(model_id, self._context_tokens)
+        return max(context - reply_tokens - _PROMPT_OVERHEAD_TOKENS, _MIN_INPUT_TOKENS)
+
+    async def _fit_article(self, text: str, model_id: str, reply_tokens: int) -> str:
+        """Article text that fits the model's context next to the prompt and reply.
+
+        Moderately long articles keep their most informative paragraphs.
+        Longer ones are summarized chunk by chunk (at most `map_parallelism`
+        requests at a time) and the final prompt sees those partial summaries.
+        """
+        budget = self._input_budget(model_id, reply_tokens)
+        tokens = estimate_tokens(text)
+        if tokens <= budget:
+            return text
+        if tokens <= budget * _SPAN_SELECTION_MAX_RATIO:
+            self._span_selections += 1
+            return select_spans(text, budget)
+
+        self._map_reduce_runs += 1
+        chunks = self._map_chunks(text, model_id)
+        semaphore = asyncio.Semaphore(self._map_parallelism)
+
+        async def summarize_chunk(index: int, chunk: str) -> str:
+            prompt = (
+                f"This is part {index + 1} of {len(chunks)} of a long article. "
+                "List its key facts, names and numbers in a few plain-text sentences.\n\n"
+                f"Part:\n{chunk}"
+            )
+            async with semaphore:
+                return await self._chat(model_id, prompt, max_tokens=_MAP_REPLY_TOKENS)
+
+        results = await asyncio.gather(
+            *(summarize_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True,
+        )
+        partials = [result for result in results if isinstance(result, str)]
+        if not partials:
+            raise RuntimeError(f"All {len(chunks)} article parts failed to summarize: {results[0]}")
+        return select_spans("\n\n".join(partials), budget)
+
+    def _map_chunks(self, text: str, model_id: str) -> list[str]:
+        return chunk_text(text, chars_for_tokens(self._input_budget(model_id, _MAP_REPLY_TOKENS)))
+
+    async def _chat(self, model_id: str, prompt: str, max_tokens: int) -> str:
+        text, errors = await self._complete(
+            model_id,
+            prompt,
+            temperature=0.2,
+            max_tokens=max_tokens,
+            system_prompt="You are a concise assistant.",
+            lang_code="en",
+        )
+        if text is not None:
+            return text
+        reason = " | ".join(errors)[:1000] if errors else "Unknown chat error"
+        raise RuntimeError(reason)
+
+    async def _complete(
+        self,
+        model_id: str,
+        prompt: str,
+        *,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str | None,
+        lang_code: str,
+    ) -> tuple[str | None, list[str]]:
+        """Try each dialect, the one known to work for `model_id` first."""
+        known = self._dialects.get(model_id)
+        order = [known, *(dialect for dialect in _DIALECTS if dialect != known)] if known else list(_DIALECTS)
 
         errors: list[str] = []
-        for endpoint, payload in attempts:
+        self._requests += 1
+        for attempt, dialect in enumerate(order):
+            if attempt:
+                self._fallback_attempts += 1
+            endpoint = _DIALECT_ENDPOINTS[dialect]
+            payload = _build_payload(
+                dialect,
+                model_id,
+                prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt,
+                lang_code=lang_code,
+            )
             try:
-                response = requests.post(
-                    f"{self._base_url}/{endpoint}",
-                    json=payload,
-                    timeout=self._timeout_seconds,
-                )
+                response = await self._client.post(f"{self._base_url}/{endpoint}", json=payload)
                 if response.status_code >= 400:
                     errors.append(f"{endpoint}: {response.text[:200]}")
                     continue
 
                 text = self._extract_text(response.json()).strip()
                 if text:
-                    return text
+                    self._remember_dialect(model_id, dialect)
+                    return text, errors
                 errors.append(f"{endpoint}: empty response")
+            except httpx.TransportError:
+                # The server is unreachable; every other dialect would fail the same way.
+                raise
             except Exception as exc:  # noqa: BLE001
                 errors.append(f"{endpoint}: {exc}")
+        return None, errors
 
-        reason = " | ".join(errors)[:1000] if errors else "Unknown chat error"
-        raise RuntimeError(reason)
+    def _remember_dialect(self, model_id: str, dialect: str) -> None:
+        if self._dialects.get(model_id) == dialect:
+            return
+        self._dialects[model_id] = dialect
+        if self._repository is not None:
+            self._repository.put_lm_dialect(model_id, dialect)
 
     @staticmethod
     def _extract_text(payload: dict) -> str:
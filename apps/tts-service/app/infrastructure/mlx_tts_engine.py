@@ -1,17 +1,91 @@
 from __future__ import annotations
 
 import inspect
-import re
-import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
-from threading import RLock
 from typing import Any
 
+import mlx.core as mx
 import numpy as np
-import soundfile as sf
+from mlx.utils import tree_flatten
 from mlx_audio.tts.utils import load_model
 
-from app.domain.entities import ArtifactMeta, TtsSelection
+from app.config.settings import Settings
+from app.domain.audio_format import (
+    VOICE_OPUS_64K,
+    AudioFormat,
+    estimate_duration_seconds,
+    fallback_format,
+    max_voice_seconds,
+    plan_format,
+    predict_size_bytes,
+)
+from app.domain.entities import ArtifactMeta, DeliverySelection, SynthesisProgress, TtsSelection
+from app.domain.model_registry import get_tts_model
+from app.domain.ports import SynthesisCancelled
+from app.domain.text_processing import chunk_text, normalize_text
+from app.infrastructure.audio_encoder import PcmStreamEncoder, encode_pcm, transcode
+from app.infrastructure.audio_postprocess import PcmAssembler
+from app.infrastructure.chunk_cache import ChunkAudioCache
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.pcm_spool import PcmSpool
+from app.infrastructure.tts_batcher import TtsBatchScheduler
+from app.infrastructure.tts_model_pool import TtsModelPool
+
+_WARM_UP_TEXT = "Hello, this is a warm-up."
+
+# Below this share of the voice limit a text-based size estimate is trusted
+# enough to encode without keeping the PCM for a fallback re-encode.
+_DIRECT_ENCODE_HEADROOM = 0.5
+
+
+@dataclass(slots=True)
+class _PartWriter:
+    """Encoder, PCM spool and assembler of one part of a multi-part delivery."""
+
+    basename: str
+    output_path: Path
+    spool: PcmSpool
+    encoder: PcmStreamEncoder
+    pcm: PcmAssembler
+
+    @classmethod
+    def open(cls, artifacts_dir: Path, output_basename: str, part: int, sample_rate: int) -> _PartWriter:
+        basename = f"{output_basename}.part{part}"
+        output_path = artifacts_dir / f"{basename}.{VOICE_OPUS_64K.extension}"
+        spool = PcmSpool(artifacts_dir / f"{basename}.pcm")
+        encoder = PcmStreamEncoder(output_path, sample_rate, codec=VOICE_OPUS_64K.codec, bitrate=VOICE_OPUS_64K.bitrate)
+        pcm = PcmAssembler(sample_rate, partial(_write_to, encoder, spool))
+        return cls(basename, output_path, spool, encoder, pcm)
+
+    def abort(self) -> None:
+        self.encoder.abort()
+        self.spool.discard()
+
+
+def _encode(spool: PcmSpool, sample_rate: int, output_path: Path, audio_format: AudioFormat) -> int:
+    return encode_pcm(
+        spool.blocks(),
+        sample_rate,
+        output_path,
+        codec=audio_format.codec,
+        bitrate=audio_format.bitrate,
+        output_sample_rate=audio_format.sample_rate,
+        application=audio_format.application,
+    )
+
+
+def _write_to(encoder: PcmStreamEncoder, spool: PcmSpool, audio: np.ndarray) -> None:
+    encoder.write(audio)
+    spool.write(audio)
+
+
+def _raise_if_cancelled(cancel: threading.Event | None) -> None:
+    if cancel is not None and cancel.is_set():
+        raise SynthesisCancelled("Synthesis cancelled")
 
 
 class MlxTtsEngine:
@@ -21,72 +95,440 @@ class MlxTtsEngine:
         "serena": "A bright and expressive young female voice with slightly higher pitch and energetic tone.",
     }
 
-    def __init__(self, artifacts_dir: Path, voice_max_bytes: int) -> None:
+    def __init__(
+        self,
+        artifacts_dir: Path,
+        voice_max_bytes: int,
+        streaming: bool = False,
+        chunk_cache: ChunkAudioCache | None = None,
+        model_memory_budget_bytes: int = 8_000_000_000,
+        batcher: TtsBatchScheduler | None = None,
+    ) -> None:
         self._artifacts_dir = artifacts_dir
         self._artifacts_dir.mkdir(parents=True, exist_ok=True)
         self._voice_max_bytes = voice_max_bytes
-        self._models: dict[str, Any] = {}
-        self._lock = RLock()
-
-    def synthesize(self, text: str, selection: TtsSelection, output_basename: str) -> ArtifactMeta:
-        clean_text = self._normalize_text(text)
-        chunks = self._chunk_text(clean_text)
-        model = self._load_model(selection.model_id)
-
+        self._streaming = streaming
+        self._chunk_cache = chunk_cache
+        self._models = TtsModelPool(
+            load_model,
+            model_memory_budget_bytes,
+            measure=self._model_bytes,
+            on_evict=mx.clear_cache,
+        )
+        self._preload_errors: dict[str, str] = {}
+        self._batcher = batcher
+        self._postprocess_lock = threading.Lock()
+        self._postprocess: dict[str, float] = {
+            "articles": 0,
+            "silence_removed_seconds": 0.0,
+            "max_peak_pcm_bytes": 0,
+        }
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        delivery = delivery or DeliverySelection()
+        clean_text = normalize_text(text)
+        descriptor = get_tts_model(selection.model_id)
+        chunks = chunk_text(clean_text, descriptor.max_chunk_chars) if descriptor else chunk_text(clean_text)
+        if delivery.split and delivery.prefer == "voice":
+            with self._models.lease(selection.model_id) as model:
+                return self._synthesize_parts(model, selection, chunks, output_basename, on_progress, cancel)
+
+        # Nothing is synthesized yet, so the duration is estimated from text.
+        estimate = estimate_duration_seconds(clean_text, selection.speed)
+        planned_format = plan_format(estimate, self._voice_max_bytes, delivery)
+        may_fall_back = (
+            planned_format.kind == "voice"
+            and predict_size_bytes(estimate, planned_format) > self._voice_max_bytes * _DIRECT_ENCODE_HEADROOM
+        )
+        # With ample headroom the real duration cannot change the format, so
+        # audio is encoded as it is synthesized; otherwise the format waits
+        # for the real duration.
+        encode_directly = self._streaming or (
+            not may_fall_back and (delivery.prefer == "document" or planned_format == VOICE_OPUS_64K)
+        )
+        # PCM is spooled to disk (not RAM) only when it may have to be encoded
+        # again; that costs as many bytes as the audio itself.
+        spool: PcmSpool | None = None
+        if may_fall_back or not encode_directly:
+            spool = PcmSpool(self._artifacts_dir / f"{output_basename}.pcm")
+        try:
+            with self._models.lease(selection.model_id) as model:
+                if encode_directly:
+                    audio_format = planned_format
+                    output_path = self._output_path(output_basename, audio_format)
+                    pcm = self._synthesize_encoding(
+                        model, selection, chunks, spool, output_path, audio_format, on_progress, cancel
+                    )
+                else:
+                    assert spool is not None
+                    pcm = self._synthesize_segments(model, selection, chunks, spool, on_progress, cancel)
+                    audio_format = plan_format(pcm.duration_seconds, self._voice_max_bytes, delivery)
+                    output_path = self._output_path(output_basename, audio_format)
+                    _raise_if_cancelled(cancel)
+                    # Spooled PCM goes into ffmpeg's stdin block by block.
+                    _encode(spool, pcm.sample_rate, output_path, audio_format)
+
+            self._record_postprocess(pcm.silence_removed_seconds, pcm.peak_bytes)
+            return self._finalize_artifact(output_path, audio_format, pcm, spool, output_basename, delivery, cancel)
+        finally:
+            if spool is not None:
+                spool.discard()
+
+    def _output_path(self, output_basename: str, audio_format: AudioFormat) -> Path:
+        return self._artifacts_dir / f"{output_basename}.{audio_format.extension}"
+
+    def _synthesize_segments(
+        self,
+        model: Any,
+        selection: TtsSelection,
+        chunks: list[str],
+        spool: PcmSpool,
+        on_progress: Callable[[SynthesisProgress], None] | None,
+        cancel: threading.Event | None,
+    ) -> PcmAssembler:
         sample_rate = getattr(model, "sample_rate", 24_000)
-        segments: list[np.ndarray] = []
-
-        for chunk in chunks:
-            generation_kwargs = self._build_generation_kwargs(model, selection, chunk)
-
-            results = list(model.generate(**generation_kwargs))
-            if not results:
-                continue
-
-            sample_rate = getattr(results[0], "sample_rate", sample_rate)
-            for result in results:
-                audio = np.asarray(result.audio, dtype=np.float32)
-                if audio.size:
-                    segments.append(audio)
-
-        if not segments:
+        pcm: PcmAssembler | None = None
+
+        for index, chunk in enumerate(chunks, start=1):
+            _raise_if_cancelled(cancel)
+            for sample_rate, audio in self._generate_chunk(model, selection, chunk, sample_rate, cancel):
+                if pcm is None:
+                    pcm = PcmAssembler(sample_rate, spool.write)
+                pcm.append(audio)
+            if on_progress is not None:
+                on_progress(SynthesisProgress(chunks_done=index, chunks_total=len(chunks)))
+
+        if pcm is None or not pcm.duration_seconds:
+            raise ValueError("TTS engine produced no audio segments")
+        pcm.finish()
+        return pcm
+
+    def _synthesize_encoding(
+        self,
+        model: Any,
+        selection: TtsSelection,
+        chunks: list[str],
+        spool: PcmSpool | None,
+        output_path: Path,
+        audio_format: AudioFormat,
+        on_progress: Callable[[SynthesisProgress], None] | None,
+        cancel: threading.Event | None,
+    ) -> PcmAssembler:
+        # Each chunk is piped into ffmpeg as soon as it is generated, so the
+        # output grows on disk and, with streaming on, can be served before
+        # synthesis finishes. Given a spool, the PCM is kept too, in case the
+        # size estimate was wrong and a fallback format has to be encoded.
+        sample_rate = getattr(model, "sample_rate", 24_000)
+        pcm: PcmAssembler | None = None
+        encoder: PcmStreamEncoder | None = None
+
+        try:
+            for index, chunk in enumerate(chunks, start=1):
+                _raise_if_cancelled(cancel)
+                for sample_rate, audio in self._generate_chunk(model, selection, chunk, sample_rate, cancel):
+                    if pcm is None:
+                        encoder = PcmStreamEncoder(
+                            output_path,
+                            sample_rate,
+                            codec=audio_format.codec,
+                            bitrate=audio_format.bitrate,
+                            output_sample_rate=audio_format.sample_rate,
+                            application=audio_format.application,
+                        )
+                        sink = encoder.write if spool is None else partial(_write_to, encoder, spool)
+                        pcm = PcmAssembler(sample_rate, sink)
+                    pcm.append(audio)
+                if on_progress is not None:
+                    on_progress(
+                        SynthesisProgress(
+                            chunks_done=index,
+                            chunks_total=len(chunks),
+                            partial_path=str(output_path) if self._streaming and encoder is not None else None,
+                        )
+                    )
+
+            if pcm is None or encoder is None or not pcm.duration_seconds:
+                raise ValueError("TTS engine produced no audio segments")
+            pcm.finish()
+            encoder.close()
+        except BaseException:
+            if encoder is not None:
+                encoder.abort()
+            raise
+
+        return pcm
+
+    def _synthesize_parts(
+        self,
+        model: Any,
+        selection: TtsSelection,
+        chunks: list[str],
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None,
+        cancel: threading.Event | None,
+    ) -> ArtifactMeta:
+        # Parts are cut at chunk boundaries: a chunk whose estimated duration
+        # would push the current part past one voice note starts the next
+        # part. Each part is announced through `on_progress` once encoded, so
+        # it can be sent while later parts are still being synthesized.
+        max_part_seconds = max_voice_seconds(VOICE_OPUS_64K, self._voice_max_bytes)
+        sample_rate = getattr(model, "sample_rate", 24_000)
+        parts: list[ArtifactMeta] = []
+        writer: _PartWriter | None = None
+
+        try:
+            for index, chunk in enumerate(chunks, start=1):
+                _raise_if_cancelled(cancel)
+                estimate = estimate_duration_seconds(chunk, selection.speed)
+                if writer is not None and writer.pcm.duration_seconds + estimate > max_part_seconds:
+                    parts.append(
+                        self._close_part(writer, len(parts) + 1, index - 1, len(chunks), on_progress, cancel)
+                    )
+                    writer = None
+                for sample_rate, audio in self._generate_chunk(model, selection, chunk, sample_rate, cancel):
+                    if writer is None:
+                        writer = _PartWriter.open(self._artifacts_dir, output_basename, len(parts) + 1, sample_rate)
+                    writer.pcm.append(audio)
+                if on_progress is not None:
+                    on_progress(SynthesisProgress(chunks_done=index, chunks_total=len(chunks)))
+
+            if writer is not None:
+                if writer.pcm.duration_seconds:
+                    parts.append(
+                        self._close_part(writer, len(parts) + 1, len(chunks), len(chunks), on_progress, cancel)
+                    )
+                else:
+                    # Its audio was all trimmed as silence.
+                    writer.abort()
+                writer = None
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        if not parts:
             raise ValueError("TTS engine produced no audio segments")
 
-        merged = np.concatenate(segments)
-        wav_path = self._artifacts_dir / f"{output_basename}.wav"
-        sf.write(wav_path, merged, sample_rate)
-
-        ogg_path = self._artifacts_dir / f"{output_basename}.ogg"
-        self._convert_audio(wav_path, ogg_path, codec="libopus", bitrate="64k")
-
-        wav_path.unlink(missing_ok=True)
+        silence_removed = sum(part.silence_removed_seconds or 0.0 for part in parts)
+        peak_bytes = max(part.peak_pcm_bytes or 0 for part in parts)
+        self._record_postprocess(silence_removed, peak_bytes)
+        # The item's own artifact is the first part; sizes and durations
+        # cover the whole article.
+        return ArtifactMeta(
+            path=parts[0].path,
+            kind="voice",
+            mime_type=parts[0].mime_type,
+            size_bytes=sum(part.size_bytes for part in parts),
+            duration_seconds=round(sum(part.duration_seconds or 0.0 for part in parts), 2),
+            silence_removed_seconds=round(silence_removed, 2),
+            peak_pcm_bytes=peak_bytes,
+            audio_format=f"{VOICE_OPUS_64K.label} in {len(parts)} parts",
+        )
 
-        if ogg_path.stat().st_size <= self._voice_max_bytes:
-            return ArtifactMeta(
-                path=str(ogg_path),
-                kind="voice",
-                mime_type="audio/ogg",
-                size_bytes=ogg_path.stat().st_size,
+    def _close_part(
+        self,
+        writer: _PartWriter,
+        part: int,
+        chunks_done: int,
+        chunks_total: int,
+        on_progress: Callable[[SynthesisProgress], None] | None,
+        cancel: threading.Event | None,
+    ) -> ArtifactMeta:
+        try:
+            writer.pcm.finish()
+            writer.encoder.close()
+            _raise_if_cancelled(cancel)
+            # Parts must stay voice notes; an oversized one steps down the ladder.
+            artifact = self._finalize_artifact(
+                writer.output_path,
+                VOICE_OPUS_64K,
+                writer.pcm,
+                writer.spool,
+                writer.basename,
+                DeliverySelection(fallback="voice"),
+                cancel,
             )
+        except BaseException:
+            writer.abort()
+            raise
+        writer.spool.discard()
+        if cancel is not None and cancel.is_set():
+            # A fallback re-encode can outlast the cancel; a part is never
+            # announced for an item that is already being discarded.
+            Path(artifact.path).unlink(missing_ok=True)
+            _raise_if_cancelled(cancel)
+        artifact = replace(artifact, part=part)
+        if on_progress is not None:
+            on_progress(SynthesisProgress(chunks_done=chunks_done, chunks_total=chunks_total, completed_part=artifact))
+        return artifact
+
+    def _generate_chunk(
+        self,
+        model: Any,
+        selection: TtsSelection,
+        chunk: str,
+        sample_rate: int,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        if self._chunk_cache is None:
+            yield from self._run_model(model, selection, chunk, sample_rate, cancel)
+            return
+
+        key = self._chunk_cache.key(chunk, selection, sample_rate)
+        cached = self._chunk_cache.get(key)
+        if cached is not None:
+            if cached.size:
+                yield sample_rate, cached
+            return
+
+        outputs = list(self._run_model(model, selection, chunk, sample_rate, cancel))
+        # Only cache output at the rate the key was built for.
+        if all(rate == sample_rate for rate, _ in outputs):
+            audio = np.concatenate([audio for _, audio in outputs]) if outputs else np.zeros(0, dtype=np.float32)
+            self._chunk_cache.put(key, audio)
+        yield from outputs
+
+    def _run_model(
+        self,
+        model: Any,
+        selection: TtsSelection,
+        chunk: str,
+        sample_rate: int,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        generation_kwargs = self._build_generation_kwargs(model, selection, chunk)
+
+        if self._batcher is not None and callable(getattr(model, "batch_generate", None)):
+            # Concurrent items with the same model, voice and speed share one call.
+            key = (selection.model_id, selection.voice, round(selection.speed, 3))
+            results = self._batcher.submit(key, chunk, partial(self._generate_batch, model, generation_kwargs))
+        else:
+            results = []
+            # Models yield one result per segment; stop between them once cancelled.
+            for result in model.generate(**generation_kwargs):
+                _raise_if_cancelled(cancel)
+                results.append(result)
+        _raise_if_cancelled(cancel)
+        if not results:
+            return
+
+        sample_rate = getattr(results[0], "sample_rate", sample_rate)
+        for result in results:
+            audio = np.asarray(result.audio, dtype=np.float32)
+            if audio.size:
+                yield sample_rate, audio
 
-        mp3_path = self._artifacts_dir / f"{output_basename}.mp3"
-        self._convert_audio(ogg_path, mp3_path, codec="libmp3lame", bitrate="128k")
-        ogg_path.unlink(missing_ok=True)
+    @staticmethod
+    def _generate_batch(model: Any, generation_kwargs: dict[str, Any], texts: list[str]) -> list[list[Any]]:
+        # Every chunk in a batch shares the selection, so only `text` differs.
+        shared = {name: value for name, value in generation_kwargs.items() if name != "text"}
+        return [list(results) for results in model.batch_generate(texts=texts, **shared)]
+
+    def _finalize_artifact(
+        self,
+        output_path: Path,
+        audio_format: AudioFormat,
+        pcm: PcmAssembler,
+        spool: PcmSpool | None,
+        output_basename: str,
+        delivery: DeliverySelection,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        size_bytes = output_path.stat().st_size
+        while audio_format.kind == "voice" and size_bytes > self._voice_max_bytes:
+            if cancel is not None and cancel.is_set():
+                # Nobody will collect the encoded file.
+                output_path.unlink(missing_ok=True)
+                _raise_if_cancelled(cancel)
+            # The size prediction missed; step down the ladder from the spooled
+            # PCM, or from the encoded file when none was kept.
+            fallback = fallback_format(
+                audio_format, pcm.duration_seconds, size_bytes, self._voice_max_bytes, delivery
+            )
+            if fallback is None:
+                break
+            fallback_path = self._output_path(output_basename, fallback)
+            if fallback_path == output_path:
+                fallback_path = self._artifacts_dir / f"{output_basename}.{fallback.bitrate}.{fallback.extension}"
+            if spool is not None:
+                size_bytes = _encode(spool, pcm.sample_rate, fallback_path, fallback)
+            else:
+                size_bytes = transcode(
+                    output_path,
+                    fallback_path,
+                    codec=fallback.codec,
+                    bitrate=fallback.bitrate,
+                    output_sample_rate=fallback.sample_rate,
+                    application=fallback.application,
+                )
+            output_path.unlink(missing_ok=True)
+            output_path, audio_format = fallback_path, fallback
 
         return ArtifactMeta(
-            path=str(mp3_path),
-            kind="document",
-            mime_type="audio/mpeg",
-            size_bytes=mp3_path.stat().st_size,
+            path=str(output_path),
+            kind=audio_format.kind,
+            mime_type=audio_format.mime_type,
+            size_bytes=size_bytes,
+            duration_seconds=round(pcm.duration_seconds, 2),
+            silence_removed_seconds=round(pcm.silence_removed_seconds, 2),
+            peak_pcm_bytes=pcm.peak_bytes,
+            audio_format=audio_format.label,
         )
 
-    def _load_model(self, model_id: str) -> Any:
-        with self._lock:
-            model = self._models.get(model_id)
-            if model is None:
-                model = load_model(model_id)
-                self._models[model_id] = model
-            return model
+    def _record_postprocess(self, silence_removed_seconds: float, peak_bytes: int) -> None:
+        with self._postprocess_lock:
+            self._postprocess["articles"] += 1
+            self._postprocess["silence_removed_seconds"] += silence_removed_seconds
+            self._postprocess["max_peak_pcm_bytes"] = max(self._postprocess["max_peak_pcm_bytes"], peak_bytes)
+
+    def preload(self, model_ids: list[str], warm_up: bool = True) -> None:
+        """Load models ahead of the first job, optionally running one short generation each.
+
+        The warm-up compiles kernels and fills allocator caches, so the first
+        real chunk does not pay for it inside the job's timeout.
+        """
+        for model_id in model_ids:
+            try:
+                with self._models.lease(model_id) as model:
+                    if warm_up:
+                        descriptor = get_tts_model(model_id)
+                        voice = descriptor.default_voice if descriptor else "default"
+                        selection = TtsSelection(model_id=model_id, voice=voice, speed=1.0)
+                        sample_rate = getattr(model, "sample_rate", 24_000)
+                        for _ in self._run_model(model, selection, _WARM_UP_TEXT, sample_rate):
+                            pass
+            except Exception as exc:  # noqa: BLE001
+                # A model that fails here is loaded lazily by its first job.
+                self._preload_errors[model_id] = str(exc)
+
+    def stats(self) -> dict[str, object]:
+        with self._postprocess_lock:
+            postprocess = dict(self._postprocess)
+        postprocess["silence_removed_seconds"] = round(postprocess["silence_removed_seconds"], 2)
+        return {**self._models.stats(), "preload_errors": dict(self._preload_errors), "postprocess": postprocess}
+
+    def component_stats(self) -> dict[str, dict[str, object]]:
+        """`stats` plus the chunk cache and batcher counters, keyed by their `GET /v1/metrics` section."""
+        sections: dict[str, dict[str, object]] = {"tts_models": self.stats()}
+        if self._chunk_cache is not None:
+            sections["chunk_cache"] = dict(self._chunk_cache.stats())
+        if self._batcher is not None:
+            sections["tts_batches"] = dict(self._batcher.stats())
+        return sections
+
+    @staticmethod
+    def _model_bytes(model: Any) -> int:
+        parameters = getattr(model, "parameters", None)
+        if not callable(parameters):
+            return 0
+        return sum(value.nbytes for _, value in tree_flatten(parameters()))
 
     def _build_generation_kwargs(self, model: Any, selection: TtsSelection, text_chunk: str) -> dict[str, Any]:
         kwargs: dict[str, Any] = {"text": text_chunk}
@@ -138,58 +580,26 @@ class MlxTtsEngine:
 
         return self._QWEN3_VOICE_DESIGN_INSTRUCTS["chelsie"]
 
-    @staticmethod
-    def _convert_audio(input_path: Path, output_path: Path, codec: str, bitrate: str) -> None:
-        command = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            str(input_path),
-            "-c:a",
-            codec,
-            "-b:a",
-            bitrate,
-            str(output_path),
-        ]
-        completed = subprocess.run(command, capture_output=True, text=True)
-        if completed.returncode != 0:
-            raise RuntimeError(f"ffmpeg conversion failed: {completed.stderr.strip()}")
 
-    @staticmethod
-    def _normalize_text(text: str) -> str:
-        normalized = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-        normalized = re.sub(r"[`*_>#-]", " ", normalized)
-        normalized = re.sub(r"\s+", " ", normalized)
-        return normalized.strip()
+def build_worker_engine(settings: Settings) -> MlxTtsEngine:
+    """Engine for a TTS worker process (see `ProcessTtsEngine`), built from settings in the child.
 
-    @staticmethod
-    def _chunk_text(text: str, max_chars: int = 1_500) -> list[str]:
-        if len(text) <= max_chars:
-            return [text]
-
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        chunks: list[str] = []
-        current = ""
-
-        for sentence in sentences:
-            if not sentence:
-                continue
-            candidate = f"{current} {sentence}".strip() if current else sentence
-            if len(candidate) <= max_chars:
-                current = candidate
-                continue
-
-            if current:
-                chunks.append(current)
-
-            if len(sentence) <= max_chars:
-                current = sentence
-            else:
-                parts = [sentence[i : i + max_chars] for i in range(0, len(sentence), max_chars)]
-                chunks.extend(parts[:-1])
-                current = parts[-1]
-
-        if current:
-            chunks.append(current)
-
-        return chunks
+    No batcher: a worker runs one request at a time, so a batch would never
+    form and every chunk would wait out `TTS_BATCH_MAX_WAIT_MS` for nothing.
+    """
+    chunk_cache = None
+    if settings.chunk_cache_max_bytes > 0:
+        # The chunk index is shared with the other workers through the database.
+        repository = SQLiteJobRepository(
+            settings.db_path,
+            busy_timeout_ms=settings.db_busy_timeout_ms,
+            synchronous=settings.db_synchronous,
+        )
+        chunk_cache = ChunkAudioCache(settings.artifacts_dir / "chunks", settings.chunk_cache_max_bytes, repository)
+    return MlxTtsEngine(
+        settings.artifacts_dir,
+        settings.voice_max_bytes,
+        streaming=settings.tts_streaming_enabled,
+        chunk_cache=chunk_cache,
+        model_memory_budget_bytes=settings.tts_model_memory_budget_bytes,
+    )
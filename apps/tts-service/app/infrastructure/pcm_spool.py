@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+
+class PcmSpool:
+    """Append-only raw float32 PCM file next to the artifact being built.
+
+    Holds a finished article's audio on disk instead of in RAM, so it can be
+    encoded (or re-encoded into a fallback format) once its duration is
+    known. Reads come back in fixed-size blocks; memory stays flat however
+    long the article is.
+    """
+
+    def __init__(self, path: Path, block_samples: int = 1 << 18) -> None:
+        self.path = path
+        self._block_samples = block_samples
+        self._handle = path.open("wb")
+        self.samples = 0
+
+    def write(self, audio: np.ndarray) -> None:
+        self._handle.write(np.ascontiguousarray(audio, dtype=np.float32).data)
+        self.samples += audio.size
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        self._handle.flush()
+        with self.path.open("rb") as handle:
+            while True:
+                block = np.fromfile(handle, dtype=np.float32, count=self._block_samples)
+                if block.size == 0:
+                    return
+                yield block
+
+    def discard(self) -> None:
+        self._handle.close()
+        self.path.unlink(missing_ok=True)
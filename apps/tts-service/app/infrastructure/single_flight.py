@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class SingleFlight:
+    """Per-key locks so concurrent callers for one key run the work once.
+
+    Locks are reference counted and dropped when the last waiter leaves, so
+    the table only holds keys that are currently in flight.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, tuple[threading.Lock, list[int]]] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        with self._guard:
+            lock, waiters = self._locks.setdefault(key, (threading.Lock(), [0]))
+            waiters[0] += 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                waiters[0] -= 1
+                if waiters[0] == 0:
+                    self._locks.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._guard:
+            return len(self._locks)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app.domain.entities import ArtifactMeta, DeliverySelection, SynthesisProgress, TtsSelection
+from app.domain.ports import TtsEnginePort
+from app.domain.text_processing import normalize_text
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.single_flight import SingleFlight
+
+
+def synthesis_cache_key(text: str, selection: TtsSelection, delivery: DeliverySelection) -> str:
+    # Delivery preferences change the output format, so they are part of the key.
+    payload = json.dumps(
+        {
+            "text": normalize_text(text),
+            "model_id": selection.model_id,
+            "voice": selection.voice,
+            "speed": round(selection.speed, 3),
+            "prefer": delivery.prefer,
+            "fallback": delivery.fallback,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachingTtsEngine:
+    """Content-addressed cache in front of a `TtsEnginePort`.
+
+    Finished artifacts stay on disk and are indexed in `synthesis_cache`.
+    When the cache grows past `max_bytes`, least recently used entries are
+    dropped, and their files are deleted once no job item references them.
+    Entries used within `eviction_grace_seconds` are kept: the item that just
+    received them may not have stored its `artifact_path` yet.
+    """
+
+    def __init__(
+        self,
+        engine: TtsEnginePort,
+        repository: SQLiteJobRepository,
+        max_bytes: int,
+        eviction_grace_seconds: float = 600.0,
+    ) -> None:
+        self._engine = engine
+        self._repository = repository
+        self._max_bytes = max_bytes
+        self._eviction_grace = timedelta(seconds=eviction_grace_seconds)
+        self._single_flight = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        delivery = delivery or DeliverySelection()
+        if delivery.split:
+            # Parts are delivered as they are encoded and acked one by one,
+            # so there is no single artifact to share.
+            return self._engine.synthesize(
+                text,
+                selection,
+                output_basename,
+                on_progress=on_progress,
+                delivery=delivery,
+                cancel=cancel,
+            )
+        key = synthesis_cache_key(text, selection, delivery)
+
+        # Concurrent requests for the same content wait for one synthesis.
+        with self._single_flight.hold(key):
+            cached = self._lookup(key)
+            if cached is not None:
+                self._hits += 1
+                return cached
+
+            self._misses += 1
+            artifact = self._engine.synthesize(
+                text,
+                selection,
+                output_basename,
+                on_progress=on_progress,
+                delivery=delivery,
+                cancel=cancel,
+            )
+            self._repository.put_cache_entry(
+                key,
+                path=artifact.path,
+                kind=artifact.kind,
+                mime_type=artifact.mime_type,
+                size_bytes=artifact.size_bytes,
+            )
+        self.evict()
+        return artifact
+
+    def evict(self) -> None:
+        entries = self._repository.list_cache_entries()
+        total = sum(entry["size_bytes"] for entry in entries)
+        recent = (datetime.now(timezone.utc) - self._eviction_grace).isoformat()
+        for entry in entries:
+            if total <= self._max_bytes or entry["last_used_at"] >= recent:
+                break
+            self._repository.delete_cache_entry(entry["key"])
+            total -= entry["size_bytes"]
+            self._evictions += 1
+            if not self._repository.artifact_in_use(entry["path"]):
+                Path(entry["path"]).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        entries = self._repository.list_cache_entries()
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": len(entries),
+            "bytes": sum(entry["size_bytes"] for entry in entries),
+            "max_bytes": self._max_bytes,
+        }
+
+    def _lookup(self, key: str) -> ArtifactMeta | None:
+        entry = self._repository.get_cache_entry(key)
+        if entry is None:
+            return None
+        if not Path(entry["path"]).exists():
+            self._repository.delete_cache_entry(key)
+            return None
+        self._repository.touch_cache_entry(key)
+        return ArtifactMeta(
+            path=entry["path"],
+            kind=entry["kind"],
+            mime_type=entry["mime_type"],
+            size_bytes=entry["size_bytes"],
+        )
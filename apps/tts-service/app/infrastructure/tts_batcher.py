@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class _PendingChunk:
+    text: str
+    done: threading.Event = field(default_factory=threading.Event)
+    result: list[Any] | None = None
+    error: BaseException | None = None
+
+
+class TtsBatchScheduler:
+    """Groups chunk generations from concurrent items into one model call.
+
+    Callers with the same key (model, voice, speed) that arrive within
+    `max_wait_seconds` of the first one are submitted together, up to
+    `max_batch_size` chunks. The first caller of a group runs the batch on
+    its own thread; the others block until their slice of the output is set.
+    """
+
+    def __init__(self, max_batch_size: int = 4, max_wait_seconds: float = 0.05) -> None:
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait_seconds = max_wait_seconds
+        self._groups: dict[Hashable, list[_PendingChunk]] = {}
+        self._condition = threading.Condition()
+        self._batches = 0
+        self._chunks = 0
+        self._largest_batch = 0
+
+    def submit(
+        self,
+        key: Hashable,
+        text: str,
+        run_batch: Callable[[list[str]], list[list[Any]]],
+    ) -> list[Any]:
+        """Generate `text` as part of a batch; return this chunk's outputs."""
+        pending = _PendingChunk(text)
+        with self._condition:
+            group = self._groups.get(key)
+            leader = group is None
+            if group is None:
+                group = self._groups[key] = []
+            group.append(pending)
+            if len(group) >= self._max_batch_size:
+                # Full: later arrivals start a new group.
+                self._groups.pop(key, None)
+                self._condition.notify_all()
+
+            if leader:
+                deadline = time.monotonic() + self._max_wait_seconds
+                while self._groups.get(key) is group and (remaining := deadline - time.monotonic()) > 0:
+                    self._condition.wait(remaining)
+                if self._groups.get(key) is group:
+                    del self._groups[key]
+
+        if leader:
+            self._run(group, run_batch)
+        else:
+            pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        assert pending.result is not None
+        return pending.result
+
+    def stats(self) -> dict[str, float]:
+        with self._condition:
+            return {
+                "batches": self._batches,
+                "chunks": self._chunks,
+                "avg_batch_size": round(self._chunks / self._batches, 2) if self._batches else 0.0,
+                "largest_batch": self._largest_batch,
+                "max_batch_size": self._max_batch_size,
+                "max_wait_seconds": self._max_wait_seconds,
+            }
+
+    def _run(self, group: list[_PendingChunk], run_batch: Callable[[list[str]], list[list[Any]]]) -> None:
+        with self._condition:
+            self._batches += 1
+            self._chunks += len(group)
+            self._largest_batch = max(self._largest_batch, len(group))
+        try:
+            outputs = run_batch([pending.text for pending in group])
+            if len(outputs) != len(group):
+                raise RuntimeError(f"Batch returned {len(outputs)} outputs for {len(group)} chunks")
+            for pending, output in zip(group, outputs):
+                pending.result = output
+        except BaseException as exc:
+            for pending in group:
+                pending.error = exc
+        finally:
+            for pending in group:
+                pending.done.set()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.single_flight import SingleFlight
+
+
+@dataclass(slots=True)
+class _LoadedModel:
+    model: Any
+    resident_bytes: int
+    load_seconds: float
+    leases: int = 0
+
+
+class TtsModelPool:
+    """Loaded TTS models, evicted least recently used past a memory budget.
+
+    Each model id loads under its own lock, so loading one model never
+    blocks synthesis with (or loading of) another. Models in use by a
+    running synthesis are never evicted; the budget can be exceeded while
+    they are leased and is restored on the next load.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        memory_budget_bytes: int,
+        measure: Callable[[Any], int] = lambda _: 0,
+        on_evict: Callable[[], None] | None = None,
+    ) -> None:
+        self._loader = loader
+        self._memory_budget_bytes = memory_budget_bytes
+        self._measure = measure
+        self._on_evict = on_evict
+        self._models: OrderedDict[str, _LoadedModel] = OrderedDict()
+        self._guard = threading.Lock()
+        self._loading = SingleFlight()
+        self._loads = 0
+        self._evictions = 0
+
+    @contextmanager
+    def lease(self, model_id: str) -> Iterator[Any]:
+        entry = self._get_or_load(model_id)
+        try:
+            yield entry.model
+        finally:
+            with self._guard:
+                entry.leases -= 1
+
+    def loaded_model_ids(self) -> list[str]:
+        with self._guard:
+            return list(self._models)
+
+    def stats(self) -> dict[str, object]:
+        with self._guard:
+            return {
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "resident_bytes": sum(entry.resident_bytes for entry in self._models.values()),
+                "memory_budget_bytes": self._memory_budget_bytes,
+                "models": {
+                    model_id: {
+                        "resident_bytes": entry.resident_bytes,
+                        "load_seconds": round(entry.load_seconds, 3),
+                        "in_use": entry.leases,
+                    }
+                    for model_id, entry in self._models.items()
+                },
+            }
+
+    def _get_or_load(self, model_id: str) -> _LoadedModel:
+        entry = self._take(model_id)
+        if entry is not None:
+            return entry
+
+        with self._loading.hold(model_id):
+            # Another caller may have finished loading while we waited.
+            entry = self._take(model_id)
+            if entry is not None:
+                return entry
+
+            started = time.perf_counter()
+            model = self._loader(model_id)
+            entry = _LoadedModel(
+                model=model,
+                resident_bytes=self._measure(model),
+                load_seconds=time.perf_counter() - started,
+                leases=1,
+            )
+            with self._guard:
+                self._models[model_id] = entry
+                self._loads += 1
+                evicted = self._evict_locked(keep=model_id)
+
+        if evicted:
+            del evicted
+            gc.collect()
+            if self._on_evict is not None:
+                self._on_evict()
+        return entry
+
+    def _take(self, model_id: str) -> _LoadedModel | None:
+        with self._guard:
+            entry = self._models.get(model_id)
+            if entry is not None:
+                entry.leases += 1
+                self._models.move_to_end(model_id)
+            return entry
+
+    def _evict_locked(self, keep: str) -> list[_LoadedModel]:
+        evicted: list[_LoadedModel] = []
+        total = sum(entry.resident_bytes for entry in self._models.values())
+        for model_id in list(self._models):
+            if total <= self._memory_budget_bytes:
+                break
+            entry = self._models[model_id]
+            if model_id == keep or entry.leases:
+                continue
+            del self._models[model_id]
+            total -= entry.resident_bytes
+            self._evictions += 1
+            evicted.append(entry)
+        return evicted
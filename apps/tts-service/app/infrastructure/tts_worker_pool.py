@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+
+from app.domain.entities import ArtifactMeta, DeliverySelection, SynthesisProgress, TtsSelection
+from app.domain.ports import SynthesisCancelled, TtsEnginePort
+
+
+def _worker_main(
+    conn: Connection,
+    engine_factory: Callable[[], TtsEnginePort],
+    preload_model_ids: list[str],
+    warm_up: bool,
+) -> None:
+    engine = engine_factory()
+    preload = getattr(engine, "preload", None)
+    if preload is not None and preload_model_ids:
+        preload(preload_model_ids, warm_up)
+    component_stats = getattr(engine, "component_stats", None)
+
+    def send_stats() -> None:
+        # Counters live in this process; the pool keeps the latest snapshot for `GET /v1/metrics`.
+        if component_stats is not None:
+            conn.send(("stats", component_stats()))
+
+    send_stats()
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        text, selection, output_basename, delivery = request
+        try:
+            artifact = engine.synthesize(
+                text,
+                selection,
+                output_basename,
+                on_progress=lambda progress: conn.send(("progress", progress)),
+                delivery=delivery,
+            )
+            send_stats()
+            conn.send(("result", artifact))
+        except Exception as exc:  # noqa: BLE001
+            send_stats()
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+@dataclass(slots=True)
+class _Worker:
+    process: BaseProcess
+    conn: Connection
+
+
+class ProcessTtsEngine:
+    """Runs synthesis in long-lived worker processes that keep models loaded.
+
+    Each request is sent over a pipe to an idle worker; progress updates and
+    the artifact come back the same way. Setting `cancel` kills the worker
+    (stopping the model mid-chunk) and deletes its partial output; a worker
+    that crashes is replaced before the next request is handed out.
+
+    Engines with `component_stats` report them after every request; the latest
+    snapshot per live worker is available through `worker_stats`.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], TtsEnginePort],
+        workers: int,
+        artifacts_dir: Path,
+        preload_model_ids: list[str] | None = None,
+        warm_up: bool = True,
+        poll_interval_seconds: float = 0.1,
+    ) -> None:
+        self._engine_factory = engine_factory
+        self._size = max(1, workers)
+        self._artifacts_dir = artifacts_dir
+        self._preload_model_ids = preload_model_ids or []
+        self._warm_up = warm_up
+        self._poll_interval_seconds = poll_interval_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._start_lock = threading.Lock()
+        self._started = False
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._kills = 0
+        self._restarts = 0
+        self._worker_stats: dict[int, dict[str, dict[str, object]]] = {}
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._started:
+                return
+            for _ in range(self._size):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        with self._start_lock:
+            self._started = False
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout_seconds)
+            self._kill(worker)
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        self.start()
+        worker = self._checkout(cancel)
+        if cancel is not None and cancel.is_set():
+            # Cancelled while waiting for a worker: it never saw the request.
+            self._idle.put(worker)
+            raise SynthesisCancelled(output_basename)
+        healthy = False
+        try:
+            worker.conn.send((text, selection, output_basename, delivery or DeliverySelection()))
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise SynthesisCancelled(output_basename)
+                if not worker.conn.poll(self._poll_interval_seconds):
+                    if not worker.process.is_alive():
+                        raise RuntimeError(f"TTS worker exited with code {worker.process.exitcode}")
+                    continue
+                try:
+                    kind, payload = worker.conn.recv()
+                except EOFError as exc:
+                    worker.process.join(1.0)
+                    raise RuntimeError(f"TTS worker exited with code {worker.process.exitcode}") from exc
+                if kind == "progress":
+                    if on_progress is not None:
+                        on_progress(payload)
+                    continue
+                if kind == "stats":
+                    with self._stats_lock:
+                        self._worker_stats[worker.process.pid] = payload
+                    continue
+                healthy = True
+                if kind == "result":
+                    return payload
+                raise RuntimeError(payload)
+        finally:
+            if healthy:
+                self._idle.put(worker)
+            else:
+                self._kill(worker)
+                for partial_file in self._artifacts_dir.glob(f"{output_basename}.*"):
+                    partial_file.unlink(missing_ok=True)
+                self._replace()
+
+    def stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return {
+                "workers": self._size,
+                "idle": self._idle.qsize(),
+                "requests": self._requests,
+                "kills": self._kills,
+                "restarts": self._restarts,
+            }
+
+    def worker_stats(self, section: str) -> dict[str, object]:
+        """One metrics section (e.g. `tts_models`) as last reported by each live worker."""
+        with self._stats_lock:
+            reports = [self._worker_stats[pid] for pid in sorted(self._worker_stats)]
+        return {"workers": [report[section] for report in reports if section in report]}
+
+    def _checkout(self, cancel: threading.Event | None = None) -> _Worker:
+        while True:
+            try:
+                worker = self._idle.get(timeout=self._poll_interval_seconds)
+                break
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    raise SynthesisCancelled("cancelled while waiting for a TTS worker") from None
+        with self._stats_lock:
+            self._requests += 1
+        if worker.process.is_alive():
+            return worker
+        # Died while idle (e.g. killed for memory); hand out a fresh one.
+        self._kill(worker)
+        with self._stats_lock:
+            self._restarts += 1
+        return self._spawn()
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._engine_factory, self._preload_model_ids, self._warm_up),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process=process, conn=parent_conn)
+
+    def _replace(self) -> None:
+        with self._stats_lock:
+            self._restarts += 1
+        if self._started:
+            self._idle.put(self._spawn())
+
+    def _kill(self, worker: _Worker) -> None:
+        with self._stats_lock:
+            self._worker_stats.pop(worker.process.pid, None)
+        if worker.process.is_alive():
+            worker.process.kill()
+            with self._stats_lock:
+                self._kills += 1
+        worker.process.join()
+        worker.conn.close()
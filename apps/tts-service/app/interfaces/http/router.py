@@ -1,40 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.application.job_service import JobService
 from app.config.settings import Settings, get_settings
-from app.domain.entities import LmSelection, TtsSelection
+from app.domain.entities import DeliverySelection, LmSelection, TtsSelection
 from app.domain.model_registry import list_tts_models
+from app.infrastructure.db.job_updates import LAGGED, TERMINAL_JOB_STATUSES
 from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
-from app.infrastructure.lm_studio_client import LmStudioClient
+from app.infrastructure.lm_model_catalog import LmModelCatalog
 from app.interfaces.http.schemas import (
     CreateJobRequest,
     CreateJobResponse,
     JobItemResponse,
     JobStatusResponse,
+    JobUpdatesResponse,
     LmValidateRequest,
     LmValidateResponse,
 )
 
 router = APIRouter()
 
+_STREAM_READ_BYTES = 64 * 1024
+_STREAM_POLL_SECONDS = 0.5
+_STREAM_MEDIA_TYPES = {".ogg": "audio/ogg", ".mp3": "audio/mpeg"}
+_LONG_POLL_MAX_SECONDS = 60.0
+_SSE_KEEPALIVE_SECONDS = 15.0
+
 
 def get_repo(request: Request) -> SQLiteJobRepository:
     return request.app.state.repository
 
 
-def get_lm_client(request: Request) -> LmStudioClient:
-    return request.app.state.lm_client
+def get_lm_catalog(request: Request) -> LmModelCatalog:
+    return request.app.state.lm_catalog
 
 
 def get_job_service(request: Request) -> JobService:
     return request.app.state.job_service
 
 
+def get_metrics_providers(request: Request) -> dict[str, Callable[[], dict[str, object]]]:
+    return getattr(request.app.state, "metrics_providers", {})
+
+
 @router.get("/health")
 def health(
     repo: SQLiteJobRepository = Depends(get_repo),
@@ -46,6 +61,14 @@ def health(
     return {"status": "ok"}
 
 
+@router.get("/v1/metrics")
+async def metrics(
+    service: JobService = Depends(get_job_service),
+    providers: dict[str, Callable[[], dict[str, object]]] = Depends(get_metrics_providers),
+) -> dict[str, object]:
+    return {**service.metrics(), **{name: provider() for name, provider in providers.items()}}
+
+
 @router.get("/v1/tts/models")
 def tts_models() -> dict[str, list[dict[str, object]]]:
     models = [
@@ -63,17 +86,17 @@ def tts_models() -> dict[str, list[dict[str, object]]]:
 
 
 @router.get("/v1/lm/models")
-def lm_models(client: LmStudioClient = Depends(get_lm_client)) -> dict[str, list[dict[str, str]]]:
-    models = [{"id": model_id} for model_id in client.list_models()]
+async def lm_models(catalog: LmModelCatalog = Depends(get_lm_catalog)) -> dict[str, list[dict[str, str]]]:
+    models = [{"id": model_id} for model_id in await catalog.list_models()]
     return {"data": models}
 
 
 @router.post("/v1/lm/models/validate", response_model=LmValidateResponse)
-def validate_lm_model(
+async def validate_lm_model(
     request: LmValidateRequest,
-    client: LmStudioClient = Depends(get_lm_client),
+    catalog: LmModelCatalog = Depends(get_lm_catalog),
 ) -> LmValidateResponse:
-    result = client.validate_model(request.model_id)
+    result = await catalog.validate_model(request.model_id)
     return LmValidateResponse(valid=result.valid, reason=result.reason)
 
 
@@ -92,11 +115,18 @@ async def create_job(
         filename_model_id=request.lm.filename_model_id,
     )
 
+    delivery = DeliverySelection(
+        prefer=request.delivery.prefer,
+        fallback=request.delivery.fallback,
+        split=request.delivery.split,
+    )
+
     job_id = await service.create_job(
         chat_id=request.chat_id,
         urls=[str(url) for url in request.urls],
         tts=tts,
         lm=lm,
+        delivery=delivery,
     )
     return CreateJobResponse(job_id=job_id, status="queued")
 
@@ -107,6 +137,21 @@ def get_job_status(job_id: str, repo: SQLiteJobRepository = Depends(get_repo)) -
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    parts_by_item: dict[str, list[dict]] = {}
+    for part in repo.list_job_artifacts(job_id):
+        base = f"/v1/jobs/{job_id}/items/{part['item_id']}/parts/{part['part']}"
+        parts_by_item.setdefault(part["item_id"], []).append(
+            {
+                "part": part["part"],
+                "kind": part["kind"],
+                "mime_type": part["mime_type"],
+                "size_bytes": part["size_bytes"],
+                "duration_seconds": part["duration_seconds"],
+                "acked": part["path"] is None,
+                "download_url": None if part["path"] is None else base,
+            }
+        )
+
     items = []
     for item in repo.get_job_items(job_id):
         artifact = None
@@ -118,6 +163,17 @@ def get_job_status(job_id: str, repo: SQLiteJobRepository = Depends(get_repo)) -
                 "download_url": f"/v1/jobs/{job_id}/items/{item['id']}/artifact",
             }
 
+        progress = None
+        if item.get("chunks_total"):
+            partial_path = item.get("partial_path")
+            streaming = item["status"] == "processing" and partial_path is not None
+            progress = {
+                "chunks_done": item.get("chunks_done") or 0,
+                "chunks_total": item["chunks_total"],
+                "bytes_available": _file_size(partial_path) if streaming else None,
+                "stream_url": f"/v1/jobs/{job_id}/items/{item['id']}/stream" if streaming else None,
+            }
+
         items.append(
             JobItemResponse(
                 item_id=item["id"],
@@ -126,6 +182,8 @@ def get_job_status(job_id: str, repo: SQLiteJobRepository = Depends(get_repo)) -
                 summary=item.get("summary"),
                 filename=item.get("filename"),
                 artifact=artifact,
+                progress=progress,
+                parts=parts_by_item.get(item["id"]),
                 error=item.get("error_message"),
             )
         )
@@ -138,6 +196,128 @@ def get_job_status(job_id: str, repo: SQLiteJobRepository = Depends(get_repo)) -
     )
 
 
+@router.get("/v1/jobs/{job_id}/events", response_model=JobUpdatesResponse)
+async def wait_for_job_updates(
+    job_id: str,
+    since: str | None = None,
+    wait: float = Query(default=25.0, ge=0),
+    repo: SQLiteJobRepository = Depends(get_repo),
+) -> JobUpdatesResponse:
+    """Long-poll: events after `since`, waiting up to `wait` seconds for the next change."""
+    # Subscribe before reading, so a change committed in between still wakes us.
+    with repo.updates.subscribe(job_id) as subscription:
+        job = repo.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        events = repo.get_job_events(job_id, since)
+        updates: list[dict] = []
+        if not events and job["status"] not in TERMINAL_JOB_STATUSES and wait > 0:
+            update = await subscription.get(min(wait, _LONG_POLL_MAX_SECONDS))
+            if update is not None:
+                # Events are re-read so `since` stays a database cursor.
+                updates = [
+                    update
+                    for update in (update, *subscription.drain())
+                    if update is not LAGGED and update["type"] != "event"
+                ]
+                events = repo.get_job_events(job_id, since)
+                job = repo.get_job(job_id) or job
+
+    return JobUpdatesResponse(
+        job_id=job_id,
+        status=job["status"],
+        events=[repo.event_update(event) for event in events],
+        updates=updates,
+        last_event_id=events[-1]["id"] if events else since,
+    )
+
+
+@router.get("/v1/jobs/{job_id}/events/stream")
+async def stream_job_updates(
+    job_id: str,
+    since: str | None = None,
+    last_event_id: str | None = Header(default=None),
+    repo: SQLiteJobRepository = Depends(get_repo),
+) -> StreamingResponse:
+    if not repo.get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _job_update_stream(repo, job_id, last_event_id or since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _job_update_stream(repo: SQLiteJobRepository, job_id: str, since: str | None) -> AsyncIterator[str]:
+    # Starts with the job status and the events after `since`, then forwards
+    # changes as the repository publishes them. Ends once the job finishes.
+    with repo.updates.subscribe(job_id) as subscription:
+        cursor = _JobUpdateCursor(repo, job_id, since)
+        batch = cursor.resync()
+        while True:
+            for update in batch:
+                yield _sse(update)
+            if cursor.finished:
+                # The final status and the last event are published together.
+                for update in cursor.accept(subscription.drain()):
+                    yield _sse(update)
+                return
+            update = await subscription.get(_SSE_KEEPALIVE_SECONDS)
+            if update is None:
+                yield ": keep-alive\n\n"
+                batch = []
+                continue
+            batch = cursor.accept([update, *subscription.drain()])
+
+
+class _JobUpdateCursor:
+    """Tracks what an SSE client has seen, so replays and live updates do not overlap."""
+
+    def __init__(self, repo: SQLiteJobRepository, job_id: str, since: str | None) -> None:
+        self._repo = repo
+        self._job_id = job_id
+        self._replayed: set[str] = set()
+        self.last_event_id = since
+        self.finished = False
+
+    def resync(self) -> list[dict]:
+        job = self._repo.get_job(self._job_id)
+        if job is None:
+            self.finished = True
+            return []
+        events = self._repo.get_job_events(self._job_id, self.last_event_id)
+        self._replayed.update(event["id"] for event in events)
+        if events:
+            self.last_event_id = events[-1]["id"]
+        self.finished = job["status"] in TERMINAL_JOB_STATUSES
+        status = {"type": "job", "status": job["status"], "error_message": job.get("error_message")}
+        return [status, *(self._repo.event_update(event) for event in events)]
+
+    def accept(self, updates: list[dict]) -> list[dict]:
+        accepted: list[dict] = []
+        for update in updates:
+            if update is LAGGED:
+                accepted.extend(self.resync())
+                continue
+            if update["type"] == "event":
+                # Published after commit, so it may also have been replayed.
+                if update["id"] in self._replayed:
+                    continue
+                self.last_event_id = update["id"]
+            elif update["type"] == "job" and update["status"] in TERMINAL_JOB_STATUSES:
+                self.finished = True
+            accepted.append(update)
+        return accepted
+
+
+def _sse(update: dict) -> str:
+    lines = [f"event: {update['type']}", f"data: {json.dumps(update, separators=(',', ':'))}"]
+    if update["type"] == "event":
+        # Lets a reconnecting client resume through `Last-Event-ID`.
+        lines.insert(0, f"id: {update['id']}")
+    return "\n".join(lines) + "\n\n"
+
+
 @router.get("/v1/jobs/{job_id}/items/{item_id}/artifact")
 def download_artifact(
     job_id: str,
@@ -161,6 +341,87 @@ def download_artifact(
     return FileResponse(path, media_type=item.get("mime_type") or "application/octet-stream", filename=filename)
 
 
+@router.get("/v1/jobs/{job_id}/items/{item_id}/parts/{part}")
+def download_part(
+    job_id: str,
+    item_id: str,
+    part: int,
+    repo: SQLiteJobRepository = Depends(get_repo),
+):
+    artifact = repo.get_item_artifact(job_id, item_id, part)
+    if not artifact:
+        raise HTTPException(status_code=404, detail="Part not found")
+
+    artifact_path = artifact.get("path")
+    if not artifact_path:
+        raise HTTPException(status_code=404, detail="Part already acknowledged")
+
+    path = Path(artifact_path)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Part file not found")
+
+    item = repo.get_job_item(job_id, item_id) or {}
+    filename = f"{item.get('filename') or item_id}-part{part}{path.suffix.lower()}"
+    return FileResponse(path, media_type=artifact["mime_type"], filename=filename)
+
+
+@router.get("/v1/jobs/{job_id}/items/{item_id}/stream")
+def stream_artifact(
+    job_id: str,
+    item_id: str,
+    repo: SQLiteJobRepository = Depends(get_repo),
+):
+    item = repo.get_job_item(job_id, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    # Finished items are served as a regular file, which supports Range requests.
+    if item["status"] != "processing":
+        return download_artifact(job_id, item_id, repo)
+
+    partial_path = item.get("partial_path")
+    if not partial_path or not Path(partial_path).exists():
+        raise HTTPException(status_code=404, detail="Audio stream not available yet")
+
+    return StreamingResponse(
+        _follow_partial_audio(repo, job_id, item_id, Path(partial_path)),
+        media_type=_STREAM_MEDIA_TYPES.get(Path(partial_path).suffix.lower(), "application/octet-stream"),
+    )
+
+
+async def _follow_partial_audio(
+    repo: SQLiteJobRepository,
+    job_id: str,
+    item_id: str,
+    path: Path,
+) -> AsyncIterator[bytes]:
+    # The handle stays valid even if the engine removes the file afterwards
+    # (e.g. when it falls back to an mp3 document).
+    with path.open("rb") as handle:
+        while True:
+            data = handle.read(_STREAM_READ_BYTES)
+            if data:
+                yield data
+                continue
+
+            item = repo.get_job_item(job_id, item_id)
+            if not item or item["status"] != "processing":
+                remainder = handle.read()
+                if remainder:
+                    yield remainder
+                return
+            await asyncio.sleep(_STREAM_POLL_SECONDS)
+
+
+def _file_size(path: str | None) -> int | None:
+    if not path:
+        return None
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return None
+
+
 @router.post("/v1/jobs/{job_id}/items/{item_id}/ack-sent")
 def ack_sent(
     job_id: str,
@@ -173,8 +434,21 @@ def ack_sent(
     return {"ok": True}
 
 
+@router.post("/v1/jobs/{job_id}/items/{item_id}/parts/{part}/ack-sent")
+def ack_part_sent(
+    job_id: str,
+    item_id: str,
+    part: int,
+    service: JobService = Depends(get_job_service),
+) -> dict[str, bool]:
+    ok = service.acknowledge_part(job_id, item_id, part)
+    if not ok:
+        raise HTTPException(status_code=404, detail="Part not found")
+    return {"ok": True}
+
+
 @router.post("/v1/jobs/{job_id}/cancel")
-def cancel_job(job_id: str, service: JobService = Depends(get_job_service)) -> dict[str, bool]:
+async def cancel_job(job_id: str, service: JobService = Depends(get_job_service)) -> dict[str, bool]:
     ok = service.cancel_job(job_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Job not found")
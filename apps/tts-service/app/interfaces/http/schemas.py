@@ -28,6 +28,9 @@ class LmSelectionRequest(BaseModel):
 class DeliveryRequest(BaseModel):
     prefer: Literal["voice", "document"] = "voice"
     fallback: Literal["voice", "document"] = "document"
+    # Voice only: deliver a long article as several voice notes, each under
+    # the voice size limit and downloadable as soon as it is encoded.
+    split: bool = False
 
 
 class CreateJobRequest(BaseModel):
@@ -50,6 +53,8 @@ class JobItemResponse(BaseModel):
     summary: str | None = None
     filename: str | None = None
     artifact: dict | None = None
+    progress: dict | None = None
+    parts: list[dict] | None = None
     error: str | None = None
 
 
@@ -58,3 +63,11 @@ class JobStatusResponse(BaseModel):
     status: str
     error_message: str | None = None
     items: list[JobItemResponse]
+
+
+class JobUpdatesResponse(BaseModel):
+    job_id: str
+    status: str
+    events: list[dict]
+    updates: list[dict]
+    last_event_id: str | None = None
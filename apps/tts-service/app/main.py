@@ -1,25 +1,109 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import partial
+
 from fastapi import FastAPI
 
 from app.application.job_service import JobService
 from app.config.settings import get_settings
+from app.domain.ports import TtsEnginePort
+from app.infrastructure.article_cache import CachingArticleParser
+from app.infrastructure.chunk_cache import ChunkAudioCache
+from app.infrastructure.db.event_writer import JobEventWriter
 from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
 from app.infrastructure.firecrawl_parser import FirecrawlArticleParser
+from app.infrastructure.lm_model_catalog import LmModelCatalog
 from app.infrastructure.lm_studio_client import LmStudioClient
-from app.infrastructure.mlx_tts_engine import MlxTtsEngine
+from app.infrastructure.mlx_tts_engine import MlxTtsEngine, build_worker_engine
+from app.infrastructure.synthesis_cache import CachingTtsEngine
+from app.infrastructure.tts_batcher import TtsBatchScheduler
+from app.infrastructure.tts_worker_pool import ProcessTtsEngine
 from app.interfaces.http.router import router
 
 settings = get_settings()
 
-repository = SQLiteJobRepository(settings.db_path)
+repository = SQLiteJobRepository(
+    settings.db_path,
+    busy_timeout_ms=settings.db_busy_timeout_ms,
+    synchronous=settings.db_synchronous,
+)
 repository.init_schema()
 
 lm_client = LmStudioClient(
     base_url=settings.lm_studio_base_url,
     timeout_seconds=settings.lm_http_timeout_seconds,
+    max_connections=settings.lm_http_max_connections,
+    max_keepalive_connections=settings.lm_http_max_keepalive_connections,
+    keepalive_expiry_seconds=settings.lm_http_keepalive_expiry_seconds,
+    repository=repository,
+    context_tokens=settings.lm_context_tokens,
+    model_context_tokens=settings.lm_model_context_tokens,
+    map_parallelism=settings.lm_map_parallelism,
 )
 
 article_parser = FirecrawlArticleParser(api_key=settings.firecrawl_api_key) if settings.firecrawl_api_key else None
-tts_engine = MlxTtsEngine(settings.artifacts_dir, settings.voice_max_bytes)
+lm_catalog = LmModelCatalog(
+    lm_client,
+    repository,
+    models_ttl_seconds=settings.lm_models_cache_ttl_seconds,
+    validation_ttl_seconds=settings.lm_validation_cache_ttl_seconds,
+)
+
+metrics_providers: dict[str, Callable[[], dict[str, object]]] = {
+    "lm_client": lm_client.stats,
+    "lm_catalog": lm_catalog.stats,
+    "job_updates": repository.updates.stats,
+}
+
+preload_ids = [model_id.strip() for model_id in settings.tts_preload_models.split(",") if model_id.strip()]
+stop_tts: Callable[[], None] | None = None
+
+if settings.tts_worker_processes > 0:
+    # Models live in worker processes; each builds its own engine from settings.
+    worker_pool = ProcessTtsEngine(
+        partial(build_worker_engine, settings),
+        settings.tts_worker_processes,
+        settings.artifacts_dir,
+        preload_model_ids=preload_ids,
+        warm_up=settings.tts_warm_up_enabled,
+    )
+    metrics_providers["tts_workers"] = worker_pool.stats
+    # Each worker reports its own models and chunk cache counters.
+    metrics_providers["tts_models"] = partial(worker_pool.worker_stats, "tts_models")
+    if settings.chunk_cache_max_bytes > 0:
+        metrics_providers["chunk_cache"] = partial(worker_pool.worker_stats, "chunk_cache")
+    base_tts_engine: TtsEnginePort = worker_pool
+    start_tts: Callable[[], None] = worker_pool.start
+    stop_tts = worker_pool.stop
+else:
+    chunk_cache = None
+    if settings.chunk_cache_max_bytes > 0:
+        chunk_cache = ChunkAudioCache(settings.artifacts_dir / "chunks", settings.chunk_cache_max_bytes, repository)
+        metrics_providers["chunk_cache"] = chunk_cache.stats
+
+    batcher = None
+    if settings.tts_batch_max_size > 1:
+        batcher = TtsBatchScheduler(settings.tts_batch_max_size, settings.tts_batch_max_wait_ms / 1000)
+        metrics_providers["tts_batches"] = batcher.stats
+
+    mlx_engine = MlxTtsEngine(
+        settings.artifacts_dir,
+        settings.voice_max_bytes,
+        streaming=settings.tts_streaming_enabled,
+        chunk_cache=chunk_cache,
+        model_memory_budget_bytes=settings.tts_model_memory_budget_bytes,
+        batcher=batcher,
+    )
+    metrics_providers["tts_models"] = mlx_engine.stats
+    base_tts_engine = mlx_engine
+    start_tts = partial(mlx_engine.preload, preload_ids, settings.tts_warm_up_enabled)
+
+tts_engine = base_tts_engine
+if settings.synthesis_cache_max_bytes > 0:
+    synthesis_cache = CachingTtsEngine(base_tts_engine, repository, settings.synthesis_cache_max_bytes)
+    metrics_providers["synthesis_cache"] = synthesis_cache.stats
+    tts_engine = synthesis_cache
 
 if article_parser is None:
     # Delay hard failure; health endpoint will be degraded until key is provided.
@@ -28,6 +112,10 @@ if article_parser is None:
             raise RuntimeError("FIRECRAWL_API_KEY is missing")
 
     article_parser = _MissingParser()
+elif settings.article_cache_ttl_seconds > 0:
+    article_cache = CachingArticleParser(article_parser, repository, settings.article_cache_ttl_seconds)
+    metrics_providers["article_cache"] = article_cache.stats
+    article_parser = article_cache
 
 job_service = JobService(
     repository=repository,
@@ -35,13 +123,42 @@ job_service = JobService(
     tts_engine=tts_engine,
     lm_client=lm_client,
     url_concurrency=settings.url_concurrency,
+    parse_workers=settings.parse_workers,
+    tts_workers=settings.tts_workers,
+    lm_workers=settings.lm_workers,
+    stage_queue_size=settings.stage_queue_size,
     parse_timeout_seconds=settings.parse_timeout_seconds,
     tts_task_timeout_seconds=settings.tts_task_timeout_seconds,
     lm_task_timeout_seconds=settings.lm_task_timeout_seconds,
+    event_writer=JobEventWriter(
+        repository,
+        max_batch=settings.event_flush_batch_size,
+        flush_interval_seconds=settings.event_flush_interval_seconds,
+    ),
 )
 
-app = FastAPI(title="TTS Service", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    await job_service.start()
+    # Model loads run in the background; jobs for a model still loading wait on its lock.
+    preload = asyncio.create_task(asyncio.to_thread(start_tts))
+    try:
+        yield
+    finally:
+        if not preload.done():
+            preload.cancel()
+        await job_service.shutdown()
+        if stop_tts is not None:
+            await asyncio.to_thread(stop_tts)
+        await lm_client.aclose()
+        repository.close()
+
+
+app = FastAPI(title="TTS Service", version="0.1.0", lifespan=lifespan)
 app.state.repository = repository
 app.state.lm_client = lm_client
+app.state.lm_catalog = lm_catalog
 app.state.job_service = job_service
+app.state.metrics_providers = metrics_providers
 app.include_router(router)
@@ -0,0 +1,106 @@
+"""Disk bytes written and wall-clock per artifact: WAV intermediate vs PCM pipe vs spooled PCM.
+
+`pcm-spool` is the engine's path when the format waits for the real
+duration or a fallback re-encode is possible: PCM is appended to a spool
+file, then piped to ffmpeg from it.
+
+Requires ffmpeg and soundfile. Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_encoding --minutes 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.infrastructure.audio_encoder import MP3_CODEC, OPUS_CODEC, encode_pcm
+from app.infrastructure.pcm_spool import PcmSpool
+
+SAMPLE_RATE = 24_000
+
+
+def _synthetic_speech(minutes: float, segment_seconds: float = 20.0) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    total = int(minutes * 60 * SAMPLE_RATE)
+    step = int(segment_seconds * SAMPLE_RATE)
+    segments = []
+    for start in range(0, total, step):
+        length = min(step, total - start)
+        t = np.arange(length, dtype=np.float32) / SAMPLE_RATE
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+        tone = np.sin(2 * np.pi * (140 + 40 * np.sin(2 * np.pi * 0.5 * t)) * t)
+        noise = rng.normal(0, 0.02, length)
+        segments.append((0.3 * envelope * tone + noise).astype(np.float32))
+    return segments
+
+
+def _ffmpeg(input_path: Path, output_path: Path, codec: str, bitrate: str) -> None:
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(input_path), "-c:a", codec, "-b:a", bitrate, str(output_path)],
+        check=True,
+    )
+
+
+def _legacy(segments: list[np.ndarray], root: Path, with_mp3: bool) -> int:
+    merged = np.concatenate(segments)
+    wav_path = root / "legacy.wav"
+    sf.write(wav_path, merged, SAMPLE_RATE)
+    written = wav_path.stat().st_size
+    ogg_path = root / "legacy.ogg"
+    _ffmpeg(wav_path, ogg_path, OPUS_CODEC, "64k")
+    written += ogg_path.stat().st_size
+    wav_path.unlink()
+    if with_mp3:
+        mp3_path = root / "legacy.mp3"
+        _ffmpeg(ogg_path, mp3_path, MP3_CODEC, "128k")
+        written += mp3_path.stat().st_size
+    return written
+
+
+def _piped(segments: list[np.ndarray], root: Path, with_mp3: bool) -> int:
+    written = encode_pcm(segments, SAMPLE_RATE, root / "piped.ogg", codec=OPUS_CODEC, bitrate="64k")
+    if with_mp3:
+        written += encode_pcm(segments, SAMPLE_RATE, root / "piped.mp3", codec=MP3_CODEC, bitrate="128k")
+    return written
+
+
+def _spooled(segments: list[np.ndarray], root: Path, with_mp3: bool) -> int:
+    spool = PcmSpool(root / "spooled.pcm")
+    try:
+        for segment in segments:
+            spool.write(segment)
+        written = spool.samples * 4
+        written += encode_pcm(spool.blocks(), SAMPLE_RATE, root / "spooled.ogg", codec=OPUS_CODEC, bitrate="64k")
+        if with_mp3:
+            written += encode_pcm(spool.blocks(), SAMPLE_RATE, root / "spooled.mp3", codec=MP3_CODEC, bitrate="128k")
+    finally:
+        spool.discard()
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=10.0)
+    args = parser.parse_args()
+
+    segments = _synthetic_speech(args.minutes)
+    print(f"audio: {args.minutes:.1f} min, {sum(s.nbytes for s in segments) / 1e6:.1f} MB float32 PCM")
+    for with_mp3 in (False, True):
+        label = "ogg+mp3" if with_mp3 else "ogg"
+        for name, run in (("wav-intermediate", _legacy), ("pcm-pipe", _piped), ("pcm-spool", _spooled)):
+            with tempfile.TemporaryDirectory() as tmp:
+                started = time.perf_counter()
+                written = run(segments, Path(tmp), with_mp3)
+                elapsed = time.perf_counter() - started
+            print(f"{label:<8} {name:<17} disk_written={written / 1e6:8.2f} MB  wall={elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Status delivery to waiting clients: polling `GET /v1/jobs/{id}` vs pushed updates.
+
+Each client waits for a job whose items change status every `--interval`
+seconds. Pollers re-read the job and its items every `--poll` seconds, as the
+bot does; subscribers wait on the repository's update hub. Reported: SQLite
+reads, process CPU time and the delay between a status commit and a client
+seeing it.
+
+Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_job_updates --clients 50 --changes 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+async def _poller(
+    repo: SQLiteJobRepository,
+    job_id: str,
+    poll: float,
+    changes: int,
+    seen: dict,
+    delays: list,
+    reads: list,
+) -> None:
+    last: dict[str, str] = {}
+    while len(last) < changes or any(status != "completed" for status in last.values()):
+        repo.get_job(job_id)
+        items = repo.get_job_items(job_id)
+        reads[0] += 2
+        now = time.perf_counter()
+        for item in items:
+            if item["status"] != "queued" and last.get(item["id"]) != item["status"]:
+                last[item["id"]] = item["status"]
+                delays.append(now - seen[(item["id"], item["status"])])
+        await asyncio.sleep(poll)
+
+
+async def _subscriber(repo: SQLiteJobRepository, job_id: str, changes: int, seen: dict, delays: list) -> None:
+    with repo.updates.subscribe(job_id) as subscription:
+        completed = 0
+        while completed < changes:
+            update = await subscription.get(60)
+            if update is None or update["type"] != "item":
+                continue
+            delays.append(time.perf_counter() - seen[(update["item_id"], update["status"])])
+            completed += update["status"] == "completed"
+
+
+async def _writer(repo: SQLiteJobRepository, item_ids: list[str], interval: float, seen: dict) -> None:
+    for item_id in item_ids:
+        await asyncio.sleep(interval)
+        for status in ("processing", "completed"):
+            seen[(item_id, status)] = time.perf_counter()
+            repo.update_item_status(item_id, status)
+
+
+async def _run(mode: str, args: argparse.Namespace) -> tuple[int, float, list[float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SQLiteJobRepository(Path(tmp) / "bench.db")
+        repo.init_schema()
+        job_id, item_ids = repo.create_job("bench", [f"https://example.com/{i}" for i in range(args.changes)])
+        seen: dict = {}
+        delays: list[float] = []
+        reads = [0]
+        if mode == "poll":
+            clients = [_poller(repo, job_id, args.poll, args.changes, seen, delays, reads) for _ in range(args.clients)]
+        else:
+            clients = [_subscriber(repo, job_id, args.changes, seen, delays) for _ in range(args.clients)]
+        cpu = time.process_time()
+        await asyncio.gather(_writer(repo, item_ids, args.interval, seen), *clients)
+        cpu = time.process_time() - cpu
+        repo.close()
+        return reads[0], cpu, delays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.5)
+    parser.add_argument("--poll", type=float, default=1.0)
+    args = parser.parse_args()
+
+    for mode, label in (("poll", f"poll {args.poll:g}s"), ("push", "push")):
+        reads, cpu, delays = asyncio.run(_run(mode, args))
+        print(
+            f"{label:<10} clients={args.clients} sqlite_reads={reads:>6} cpu={cpu:.3f}s "
+            f"delay_p50={statistics.median(delays) * 1000:.1f}ms max={max(delays) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
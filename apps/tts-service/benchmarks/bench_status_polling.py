@@ -0,0 +1,93 @@
+"""Status-poll latency while background jobs write events.
+
+Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_status_polling --writers 4 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _poll(repo: SQLiteJobRepository, job_id: str, seconds: float) -> list[float]:
+    samples: list[float] = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        repo.get_job(job_id)
+        repo.get_job_items(job_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _write_events(repo: SQLiteJobRepository, job_id: str, item_id: str, stop: threading.Event, counter: list[int]) -> None:
+    while not stop.is_set():
+        repo.add_event(job_id, "info", "Synthetic event", item_id)
+        counter[0] += 1
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<12} polls={len(samples):>7} "
+        f"p50={statistics.median(samples):.3f}ms "
+        f"p95={_percentile(samples, 95):.3f}ms "
+        f"p99={_percentile(samples, 99):.3f}ms "
+        f"max={max(samples):.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SQLiteJobRepository(Path(tmp) / "bench.db")
+        repo.init_schema()
+        job_id, item_ids = repo.create_job("bench", [f"https://example.com/{i}" for i in range(args.items)])
+
+        _report("idle", _poll(repo, job_id, args.seconds))
+
+        stop = threading.Event()
+        counters = [[0] for _ in range(args.writers)]
+        writers = [
+            threading.Thread(
+                target=_write_events,
+                args=(repo, job_id, item_ids[index % len(item_ids)], stop, counters[index]),
+                daemon=True,
+            )
+            for index in range(args.writers)
+        ]
+        for writer in writers:
+            writer.start()
+        try:
+            samples = _poll(repo, job_id, args.seconds)
+        finally:
+            stop.set()
+            for writer in writers:
+                writer.join()
+
+        _report(f"{args.writers} writers", samples)
+        total_events = sum(counter[0] for counter in counters)
+        print(f"events written: {total_events} ({total_events / args.seconds:.0f}/s)")
+        repo.close()
+
+
+if __name__ == "__main__":
+    main()
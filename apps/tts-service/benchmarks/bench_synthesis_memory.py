@@ -0,0 +1,83 @@
+"""Peak PCM memory for a long article: segment list + concatenate vs spooled assembly.
+
+A fake model yields one segment per chunk (tone plus edge silence). The
+baseline keeps every segment and concatenates them before encoding; the
+current path assembles into a `PcmSpool` and reads it back in blocks, as
+the encoder would. Peak memory is measured with `tracemalloc`, which sees
+numpy allocations. Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_synthesis_memory --hours 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from app.infrastructure.audio_postprocess import PcmAssembler
+from app.infrastructure.pcm_spool import PcmSpool
+
+SAMPLE_RATE = 24_000
+
+
+def _segments(hours: float, segment_seconds: float) -> Iterator[np.ndarray]:
+    rng = np.random.default_rng(7)
+    count = int(hours * 3600 / segment_seconds)
+    t = np.arange(int(segment_seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    tone = np.sin(2 * np.pi * 180 * t).astype(np.float32)
+    edge = np.zeros(SAMPLE_RATE // 4, dtype=np.float32)
+    for _ in range(count):
+        amplitude = np.float32(rng.uniform(0.05, 0.6))
+        yield np.concatenate([edge, tone * amplitude, edge])
+
+
+def _consume(blocks: Iterator[np.ndarray]) -> int:
+    # Stands in for ffmpeg's stdin: touches every byte once.
+    return sum(block.nbytes for block in blocks)
+
+
+def _concatenate(hours: float, segment_seconds: float, _: Path) -> int:
+    segments = list(_segments(hours, segment_seconds))
+    audio = np.concatenate(segments)
+    return _consume(iter([audio]))
+
+
+def _spooled(hours: float, segment_seconds: float, workdir: Path) -> int:
+    spool = PcmSpool(workdir / "article.pcm")
+    try:
+        pcm = PcmAssembler(SAMPLE_RATE, spool.write)
+        for segment in _segments(hours, segment_seconds):
+            pcm.append(segment)
+        pcm.finish()
+        return _consume(spool.blocks())
+    finally:
+        spool.discard()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--segment-seconds", type=float, default=12.0)
+    args = parser.parse_args()
+
+    print(f"{args.hours:g} h synthetic article, {args.segment_seconds:g} s segments, {SAMPLE_RATE} Hz float32")
+    print(f"{'mode':<14}{'wall s':>9}{'peak MB':>10}{'PCM MB':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, run in [("concatenate", _concatenate), ("spooled", _spooled)]:
+            tracemalloc.start()
+            started = time.perf_counter()
+            pcm_bytes = run(args.hours, args.segment_seconds, Path(workdir))
+            wall = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{label:<14}{wall:>9.2f}{peak / 1e6:>10.1f}{pcm_bytes / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
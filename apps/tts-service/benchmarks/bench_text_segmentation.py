@@ -0,0 +1,137 @@
+"""Markdown normalization and chunking throughput, previous vs current segmenter.
+
+The corpus is synthetic markdown mixing prose, links, code blocks, tables,
+lists and CJK paragraphs. The previous implementation is inlined below as
+the baseline. Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_text_segmentation --articles 200 --max-chars 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from app.domain.text_processing import chunk_text, normalize_text
+
+_WORDS = (
+    "model latency throughput audio sentence voice the a of and to in is for with on "
+    "retrieval benchmark memory pipeline encoder decoder synthesis article summary"
+).split()
+
+
+def _legacy_normalize(text: str) -> str:
+    normalized = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+    normalized = re.sub(r"[`*_>#-]", " ", normalized)
+    normalized = re.sub(r"\s+", " ", normalized)
+    return normalized.strip()
+
+
+def _legacy_chunk(text: str, max_chars: int) -> list[str]:
+    if len(text) <= max_chars:
+        return [text]
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    chunks: list[str] = []
+    current = ""
+    for sentence in sentences:
+        if not sentence:
+            continue
+        candidate = f"{current} {sentence}".strip() if current else sentence
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+        if len(sentence) <= max_chars:
+            current = sentence
+        else:
+            parts = [sentence[i : i + max_chars] for i in range(0, len(sentence), max_chars)]
+            chunks.extend(parts[:-1])
+            current = parts[-1]
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(6, 30))
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words)), "[link](https://example.com/page)")
+    if rng.random() < 0.1:
+        words.insert(rng.randrange(len(words)), "**bold**,")
+    return " ".join(words).capitalize() + rng.choice([".", ".", "!", "?"])
+
+
+def _article(rng: random.Random, paragraphs: int) -> str:
+    blocks = [f"# Article {rng.randint(1, 999)}"]
+    for index in range(paragraphs):
+        kind = index % 7
+        if kind == 3:
+            blocks.append("```python\nfor i in range(10):\n    print(i)\n```")
+        elif kind == 5:
+            blocks.append("| name | value |\n|------|-------|\n| a | 1 |\n| b | 2 |")
+        elif kind == 2:
+            # A run-on sentence longer than any chunk, as scraped from bad markup.
+            blocks.append(" ".join(rng.choices(_WORDS, k=rng.randint(150, 300))))
+        elif kind == 6:
+            blocks.append("東京は晴れです。明日は雨が降るでしょう！" * rng.randint(2, 8))
+        else:
+            blocks.append(" ".join(_sentence(rng) for _ in range(rng.randint(3, 12))))
+        if index % 4 == 0:
+            blocks.append("- first point\n- second point\n![chart](chart.png)")
+    return "\n\n".join(blocks)
+
+
+def _time(articles: list[str], normalize, chunk, max_chars: int, repeat: int) -> tuple[float, int]:  # type: ignore[no-untyped-def]
+    # Best of `repeat` runs, to keep scheduler noise out of the comparison.
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = 0
+        for article in articles:
+            chunks += len(chunk(normalize(article), max_chars))
+        best = min(best, time.perf_counter() - started)
+    return best, chunks
+
+
+def _cut_words(articles: list[str], normalize, chunk, max_chars: int) -> int:  # type: ignore[no-untyped-def]
+    # A chunk that ends between two letters of the source text split a word.
+    cuts = 0
+    for article in articles:
+        text = normalize(article)
+        cursor = 0
+        for piece in chunk(text, max_chars):
+            end = text.find(piece, cursor) + len(piece)
+            if end < len(text) and text[end - 1].isalnum() and text[end].isalnum():
+                cuts += 1
+            cursor = end
+    return cuts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--max-chars", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    articles = [_article(rng, args.paragraphs) for _ in range(args.articles)]
+    megabytes = sum(len(article.encode()) for article in articles) / 1_000_000
+    print(f"{args.articles} articles, {megabytes:.1f} MB markdown, max_chars={args.max_chars}")
+    print(f"{'segmenter':<12}{'wall s':>10}{'MB/s':>10}{'chunks':>10}{'cut words':>11}")
+    for label, normalize, chunk in [
+        ("previous", _legacy_normalize, _legacy_chunk),
+        ("current", normalize_text, chunk_text),
+    ]:
+        wall, chunks = _time(articles, normalize, chunk, args.max_chars, args.repeat)
+        cuts = _cut_words(articles, normalize, chunk, args.max_chars)
+        print(f"{label:<12}{wall:>10.3f}{megabytes / wall:>10.1f}{chunks:>10}{cuts:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Chunk throughput with and without cross-request batching, using a fake model.
+
+The fake model costs a fixed per-call overhead plus a small per-chunk cost,
+like an accelerator that is underused by one short generation at a time.
+Run from `apps/tts-service`:
+
+    python -m benchmarks.bench_tts_batching --items 8 --chunks 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+
+from app.infrastructure.tts_batcher import TtsBatchScheduler
+
+
+class FakeBatchModel:
+    def __init__(self, call_overhead_seconds: float, per_chunk_seconds: float) -> None:
+        self._call_overhead = call_overhead_seconds
+        self._per_chunk = per_chunk_seconds
+        # One accelerator: calls do not overlap.
+        self._device = threading.Lock()
+
+    def generate(self, text: str) -> list[str]:
+        return self.batch_generate([text])[0]
+
+    def batch_generate(self, texts: list[str]) -> list[list[str]]:
+        with self._device:
+            time.sleep(self._call_overhead + self._per_chunk * len(texts))
+        return [[f"audio:{text}"] for text in texts]
+
+
+def _run(
+    model: FakeBatchModel,
+    items: int,
+    chunks: int,
+    scheduler: TtsBatchScheduler | None,
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def synthesize(item: int) -> None:
+        for chunk in range(chunks):
+            text = f"item {item} chunk {chunk}"
+            started = time.perf_counter()
+            if scheduler is None:
+                output = model.generate(text)
+            else:
+                output = scheduler.submit("model/voice/1.0", text, model.batch_generate)
+            assert output == [f"audio:{text}"]
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=synthesize, args=(item,)) for item in range(items)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=8, help="concurrent items sharing model/voice/speed")
+    parser.add_argument("--chunks", type=int, default=10, help="chunks per item")
+    parser.add_argument("--call-overhead-ms", type=float, default=40.0)
+    parser.add_argument("--per-chunk-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    model = FakeBatchModel(args.call_overhead_ms / 1000, args.per_chunk_ms / 1000)
+    total = args.items * args.chunks
+    print(f"{args.items} items x {args.chunks} chunks")
+    print(f"{'mode':<12}{'wall s':>10}{'chunks/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'avg batch':>11}")
+    for label, scheduler in [
+        ("sequential", None),
+        ("batched", TtsBatchScheduler(args.max_batch_size, args.max_wait_ms / 1000)),
+    ]:
+        wall, latencies = _run(model, args.items, args.chunks, scheduler)
+        latencies.sort()
+        avg_batch = scheduler.stats()["avg_batch_size"] if scheduler else 1.0
+        print(
+            f"{label:<12}{wall:>10.2f}{total / wall:>12.1f}"
+            f"{statistics.median(latencies) * 1000:>10.1f}{latencies[int(len(latencies) * 0.95)] * 1000:>10.1f}"
+            f"{avg_batch:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.interfaces.http.router import router
+
+
+def _client(repo: SQLiteJobRepository) -> TestClient:
+    app = FastAPI()
+    app.state.repository = repo
+    app.include_router(router)
+    return TestClient(app)
+
+
+def _later(action, delay: float = 0.2) -> threading.Thread:  # type: ignore[no-untyped-def]
+    thread = threading.Thread(target=lambda: (time.sleep(delay), action()))
+    thread.start()
+    return thread
+
+
+def test_long_poll_returns_as_soon_as_the_job_changes(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, (item_id,) = repo.create_job("chat-1", ["https://example.com"])
+    repo.add_event(job_id, "info", "Job started")
+    client = _client(repo)
+
+    first = client.get(f"/v1/jobs/{job_id}/events", params={"wait": 5}).json()
+    assert [event["message"] for event in first["events"]] == ["Job started"]
+
+    writer = _later(lambda: repo.update_item_progress(item_id, chunks_done=1, chunks_total=3))
+    started = time.perf_counter()
+    second = client.get(
+        f"/v1/jobs/{job_id}/events",
+        params={"since": first["last_event_id"], "wait": 5},
+    ).json()
+    elapsed = time.perf_counter() - started
+    writer.join()
+
+    assert elapsed < 2
+    assert second["events"] == []
+    assert second["updates"] == [{"type": "progress", "item_id": item_id, "chunks_done": 1, "chunks_total": 3}]
+    assert second["last_event_id"] == first["last_event_id"]
+
+    idle = client.get(f"/v1/jobs/{job_id}/events", params={"since": first["last_event_id"], "wait": 0.1}).json()
+    assert idle["events"] == [] and idle["updates"] == []
+    assert client.get("/v1/jobs/missing/events").status_code == 404
+    assert repo.updates.stats()["subscribers"] == 0
+
+
+def test_sse_stream_replays_then_follows_until_the_job_finishes(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, (item_id,) = repo.create_job("chat-1", ["https://example.com"])
+    repo.add_event(job_id, "info", "Job started")
+    resume_from = repo.get_job_events(job_id)[0]["id"]
+    repo.add_event(job_id, "info", "Parsing started", item_id)
+    client = _client(repo)
+
+    def finish() -> None:
+        repo.update_item_status(item_id, "failed", "boom")
+        repo.add_event(job_id, "error", "Item failed: boom", item_id)
+        repo.update_job_status(job_id, "failed")
+
+    writer = _later(finish)
+    with client.stream(
+        "GET",
+        f"/v1/jobs/{job_id}/events/stream",
+        headers={"Last-Event-ID": resume_from},
+    ) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.iter_lines()
+            if line.startswith("data: ")
+        ]
+    writer.join()
+
+    assert [(message["type"], message.get("status") or message.get("message")) for message in messages] == [
+        ("job", "queued"),
+        ("event", "Parsing started"),
+        ("item", "failed"),
+        ("event", "Item failed: boom"),
+        ("job", "failed"),
+    ]
@@ -0,0 +1,54 @@
+import threading
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.interfaces.http.router import router
+
+
+def test_stream_follows_partial_audio_until_item_finishes(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, (item_id,) = repo.create_job("chat-1", ["https://example.com"])
+    repo.update_item_status(item_id, "processing")
+
+    partial = tmp_path / "partial.ogg"
+    partial.write_bytes(b"OggS-first")
+    repo.update_item_progress(item_id, chunks_done=1, chunks_total=2, partial_path=str(partial))
+
+    app = FastAPI()
+    app.state.repository = repo
+    app.include_router(router)
+    client = TestClient(app)
+
+    status = client.get(f"/v1/jobs/{job_id}").json()
+    progress = status["items"][0]["progress"]
+    assert progress["chunks_done"] == 1
+    assert progress["bytes_available"] == len(b"OggS-first")
+    assert progress["stream_url"] == f"/v1/jobs/{job_id}/items/{item_id}/stream"
+
+    def finish_synthesis() -> None:
+        time.sleep(0.2)
+        with partial.open("ab") as handle:
+            handle.write(b"-second")
+        repo.update_item_progress(item_id, chunks_done=2, chunks_total=2)
+        repo.set_item_result(
+            item_id,
+            summary="summary",
+            filename="name",
+            artifact_path=str(partial),
+            artifact_kind="voice",
+            mime_type="audio/ogg",
+            size_bytes=partial.stat().st_size,
+        )
+
+    writer = threading.Thread(target=finish_synthesis)
+    writer.start()
+    response = client.get(progress["stream_url"])
+    writer.join()
+
+    assert response.status_code == 200
+    assert response.content == b"OggS-first-second"
@@ -1,10 +1,16 @@
 import asyncio
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
 from app.application.job_service import JobService
-from app.domain.entities import ArtifactMeta, LmSelection, TtsSelection
+from app.domain.entities import ArtifactMeta, DeliverySelection, LmSelection, SynthesisProgress, TtsSelection
 from app.domain.ports import ParsedArticle
 from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.interfaces.http.router import router
 
 
 class FakeParser:
@@ -16,25 +22,50 @@ class FakeTtsEngine:
     def __init__(self, root: Path) -> None:
         self.root = root
 
-    def synthesize(self, text: str, selection: TtsSelection, output_basename: str) -> ArtifactMeta:
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
         path = self.root / f"{output_basename}.ogg"
         path.write_bytes(b"audio")
         return ArtifactMeta(path=str(path), kind="voice", mime_type="audio/ogg", size_bytes=5)
 
 
 class FakeLmClient:
-    def list_models(self) -> list[str]:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def list_models(self) -> list[str]:
         return ["fake"]
 
-    def validate_model(self, model_id: str):  # type: ignore[no-untyped-def]
+    async def validate_model(self, model_id: str):  # type: ignore[no-untyped-def]
         return True, None
 
-    def summarize(self, text: str, selection: LmSelection) -> str:
+    async def summarize(self, text: str, selection: LmSelection) -> str:
+        self.calls.append("summarize")
         return "summary"
 
-    def filename(self, text: str, url: str, selection: LmSelection) -> str:
+    async def filename(self, text: str, url: str, selection: LmSelection) -> str:
+        self.calls.append("filename")
         return "file-name"
 
+    async def summary_and_filename(
+        self,
+        text: str,
+        url: str,
+        selection: LmSelection,
+    ) -> tuple[str | None, str | None]:
+        self.calls.append("combined")
+        return "combined summary", None
+
+    def request_rounds(self, text: str, model_id: str) -> int:
+        return 1
+
 
 def test_job_lifecycle(tmp_path: Path) -> None:
     repo = SQLiteJobRepository(tmp_path / "tts.db")
@@ -67,3 +98,228 @@ def test_job_lifecycle(tmp_path: Path) -> None:
 
     status = asyncio.run(run_job_and_wait())
     assert status == "completed"
+    assert service.metrics()["artifacts"] == {
+        "count": 2,
+        "avg_size_bytes": 5,
+        "formats": {"voice: audio/ogg": 2},
+    }
+
+
+def test_same_lm_model_uses_one_combined_request(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    lm_client = FakeLmClient()
+    service = JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=FakeTtsEngine(tmp_path),
+        lm_client=lm_client,
+        url_concurrency=1,
+    )
+
+    async def run() -> list[dict]:  # type: ignore[type-arg]
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=["https://example.com/post"],
+            tts=TtsSelection(model_id="m", voice="v", speed=1.0),
+            lm=LmSelection(summary_model_id="same", filename_model_id="same"),
+        )
+        for _ in range(100):
+            job = repo.get_job(job_id)
+            if job and job["status"] == "completed":
+                break
+            await asyncio.sleep(0.05)
+        await service.shutdown()
+        return repo.get_job_items(job_id)
+
+    items = asyncio.run(run())
+    assert lm_client.calls == ["combined"]
+    assert items[0]["summary"] == "combined summary"
+    # The missing field falls back on its own.
+    assert items[0]["filename"].startswith("examplecom-")
+
+
+class SplittingTtsEngine:
+    """Emits part 1, then waits for `release` before encoding part 2."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        assert delivery is not None and delivery.split
+        assert on_progress is not None
+        parts = []
+        for part in (1, 2):
+            if part == 2:
+                self.release.wait(5)
+            path = self.root / f"{output_basename}.part{part}.ogg"
+            path.write_bytes(b"OggS-part%d" % part)
+            meta = ArtifactMeta(
+                path=str(path),
+                kind="voice",
+                mime_type="audio/ogg",
+                size_bytes=path.stat().st_size,
+                duration_seconds=60.0,
+                part=part,
+            )
+            parts.append(meta)
+            on_progress(SynthesisProgress(chunks_done=part, chunks_total=2, completed_part=meta))
+        self.finished.set()
+        return ArtifactMeta(
+            path=parts[0].path,
+            kind="voice",
+            mime_type="audio/ogg",
+            size_bytes=sum(part.size_bytes for part in parts),
+            duration_seconds=120.0,
+        )
+
+
+def test_parts_are_downloadable_before_the_item_completes(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = SplittingTtsEngine(tmp_path)
+    service = JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=engine,
+        lm_client=FakeLmClient(),
+        url_concurrency=1,
+    )
+    app = FastAPI()
+    app.state.repository = repo
+    app.state.job_service = service
+    app.include_router(router)
+    client = TestClient(app)
+
+    async def wait_for(predicate: Callable[[], bool]) -> None:
+        for _ in range(100):
+            if predicate():
+                return
+            await asyncio.sleep(0.05)
+        raise AssertionError("timed out")
+
+    async def run() -> tuple[str, str]:
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=["https://example.com/long-read"],
+            tts=TtsSelection(model_id="m", voice="v", speed=1.0),
+            lm=LmSelection(summary_model_id="s", filename_model_id="f"),
+            delivery=DeliverySelection(split=True),
+        )
+        await wait_for(lambda: bool(repo.list_job_artifacts(job_id)))
+
+        status = (await asyncio.to_thread(client.get, f"/v1/jobs/{job_id}")).json()
+        item = status["items"][0]
+        assert item["status"] == "processing"
+        (part,) = item["parts"]
+        assert part["part"] == 1 and not part["acked"]
+        download = await asyncio.to_thread(client.get, part["download_url"])
+        assert download.content == b"OggS-part1"
+        assert download.headers["content-disposition"].endswith('-part1.ogg"')
+
+        ack = await asyncio.to_thread(client.post, f"{part['download_url']}/ack-sent")
+        assert ack.json() == {"ok": True}
+        assert not (tmp_path / f"{job_id}-{item['item_id']}.part1.ogg").exists()
+
+        engine.release.set()
+        await wait_for(lambda: (repo.get_job(job_id) or {}).get("status") == "completed")
+        await service.shutdown()
+        return job_id, item["item_id"]
+
+    job_id, item_id = asyncio.run(run())
+
+    item = client.get(f"/v1/jobs/{job_id}").json()["items"][0]
+    assert [(part["part"], part["acked"]) for part in item["parts"]] == [(1, True), (2, False)]
+    # Part 1 was the item's own artifact; acking it already released it.
+    assert item["artifact"] is None
+    assert client.get(f"/v1/jobs/{job_id}/items/{item_id}/parts/1").status_code == 404
+
+    assert client.post(f"/v1/jobs/{job_id}/items/{item_id}/ack-sent").json() == {"ok": True}
+    assert not (tmp_path / f"{job_id}-{item_id}.part2.ogg").exists()
+    assert client.post(f"/v1/jobs/{job_id}/items/{item_id}/parts/9/ack-sent").status_code == 404
+
+
+def test_parts_finished_after_cancel_are_discarded(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = SplittingTtsEngine(tmp_path)
+    service = JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=engine,
+        lm_client=FakeLmClient(),
+        url_concurrency=1,
+    )
+
+    async def run() -> str:
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=["https://example.com/long-read"],
+            tts=TtsSelection(model_id="m", voice="v", speed=1.0),
+            lm=LmSelection(summary_model_id="s", filename_model_id="f"),
+            delivery=DeliverySelection(split=True),
+        )
+        for _ in range(100):
+            if repo.list_job_artifacts(job_id):
+                break
+            await asyncio.sleep(0.05)
+        service.cancel_job(job_id)
+        # The engine ignores the cancel and still finishes part 2.
+        engine.release.set()
+        await asyncio.to_thread(engine.finished.wait, 5)
+        await asyncio.sleep(0.1)
+        await service.shutdown()
+        return job_id
+
+    job_id = asyncio.run(run())
+    assert [part["path"] for part in repo.list_job_artifacts(job_id)] == [None]
+    assert list(tmp_path.glob("*.ogg")) == []
+
+
+def test_split_item_artifact_reports_part_one(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = SplittingTtsEngine(tmp_path)
+    engine.release.set()
+    service = JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=engine,
+        lm_client=FakeLmClient(),
+        url_concurrency=1,
+    )
+
+    async def run() -> str:
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=["https://example.com/long-read"],
+            tts=TtsSelection(model_id="m", voice="v", speed=1.0),
+            lm=LmSelection(summary_model_id="s", filename_model_id="f"),
+            delivery=DeliverySelection(split=True),
+        )
+        for _ in range(100):
+            if (repo.get_job(job_id) or {}).get("status") == "completed":
+                break
+            await asyncio.sleep(0.05)
+        await service.shutdown()
+        return job_id
+
+    job_id = asyncio.run(run())
+    app = FastAPI()
+    app.state.repository = repo
+    app.include_router(router)
+    client = TestClient(app)
+
+    artifact = client.get(f"/v1/jobs/{job_id}").json()["items"][0]["artifact"]
+    download = client.get(artifact["download_url"])
+    assert artifact["size_bytes"] == len(download.content) == len(b"OggS-part1")
@@ -0,0 +1,330 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from app.application.job_service import JobService
+from app.domain.entities import ArtifactMeta, DeliverySelection, LmSelection, SynthesisProgress, TtsSelection
+from app.domain.ports import ParsedArticle, SynthesisCancelled
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+TTS = TtsSelection(model_id="m", voice="v", speed=1.0)
+LM = LmSelection(summary_model_id="s", filename_model_id="f")
+
+
+class FakeParser:
+    def parse(self, url: str) -> ParsedArticle:
+        return ParsedArticle(url=url, markdown="Some content for testing.", title="Title")
+
+
+class CountingTtsEngine:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        path = self.root / f"{output_basename}.ogg"
+        path.write_bytes(b"audio")
+        return ArtifactMeta(path=str(path), kind="voice", mime_type="audio/ogg", size_bytes=5)
+
+
+class FakeLmClient:
+    async def summarize(self, text: str, selection: LmSelection) -> str:
+        return "summary"
+
+    async def filename(self, text: str, url: str, selection: LmSelection) -> str:
+        return "file-name"
+
+    async def summary_and_filename(
+        self,
+        text: str,
+        url: str,
+        selection: LmSelection,
+    ) -> tuple[str | None, str | None]:
+        return "summary", "file-name"
+
+    def request_rounds(self, text: str, model_id: str) -> int:
+        return 1
+
+
+def _service(repo: SQLiteJobRepository, engine: CountingTtsEngine, **kwargs: int) -> JobService:
+    return JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=engine,
+        lm_client=FakeLmClient(),
+        url_concurrency=2,
+        queue_poll_interval_seconds=0.05,
+        **kwargs,
+    )
+
+
+async def _wait_finished(repo: SQLiteJobRepository, job_ids: list[str]) -> list[str]:
+    for _ in range(200):
+        jobs = [repo.get_job(job_id) for job_id in job_ids]
+        statuses = [job["status"] for job in jobs if job]
+        if all(status in {"completed", "partial_failed", "failed", "cancelled"} for status in statuses):
+            return statuses
+        await asyncio.sleep(0.05)
+    return ["timeout"]
+
+
+def test_concurrency_limit_is_service_wide(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = CountingTtsEngine(tmp_path)
+    service = _service(repo, engine)
+
+    async def run() -> list[str]:
+        job_ids = [
+            await service.create_job(
+                chat_id=f"chat-{index}",
+                urls=[f"https://example.com/{index}/{n}" for n in range(3)],
+                tts=TTS,
+                lm=LM,
+            )
+            for index in range(3)
+        ]
+        statuses = await _wait_finished(repo, job_ids)
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["completed"] * 3
+    assert engine.peak <= 2
+
+
+class FlakyResultRepository(SQLiteJobRepository):
+    """Fails the first `set_item_result`, as a locked database would."""
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path)
+        self.failures = 1
+
+    def set_item_result(self, item_id: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        super().set_item_result(item_id, **kwargs)
+
+
+def test_repository_error_fails_the_item_and_keeps_workers_running(tmp_path: Path) -> None:
+    repo = FlakyResultRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    service = _service(repo, CountingTtsEngine(tmp_path), tts_workers=1, lm_workers=1)
+
+    async def run() -> list[str]:
+        first = await service.create_job(chat_id="chat-1", urls=["https://example.com/a"], tts=TTS, lm=LM)
+        statuses = await _wait_finished(repo, [first])
+        second = await service.create_job(chat_id="chat-2", urls=["https://example.com/b"], tts=TTS, lm=LM)
+        statuses += await _wait_finished(repo, [second])
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["failed", "completed"]
+    assert service.metrics()["items_in_flight"] == 0
+
+
+def test_interrupted_items_resume_on_start(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, _ = repo.create_job("chat-1", ["https://example.com/a", "https://example.com/b"], tts=TTS, lm=LM)
+    # Simulate a crash after one item was claimed.
+    claimed = repo.claim_next_item()
+    assert claimed is not None and claimed.job_started
+
+    service = _service(repo, CountingTtsEngine(tmp_path))
+
+    async def run() -> list[str]:
+        await service.start()
+        statuses = await _wait_finished(repo, [job_id])
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["completed"]
+    assert {item["status"] for item in repo.get_job_items(job_id)} == {"completed"}
+
+
+def test_stage_pools_are_sized_independently(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = CountingTtsEngine(tmp_path)
+    service = _service(repo, engine, parse_workers=3, tts_workers=1, lm_workers=2, stage_queue_size=1)
+
+    async def run() -> list[str]:
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=[f"https://example.com/{n}" for n in range(4)],
+            tts=TTS,
+            lm=LM,
+        )
+        statuses = await _wait_finished(repo, [job_id])
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["completed"]
+    assert engine.peak == 1
+    stages = service.metrics()["stages"]
+    assert {name: stage["workers"] for name, stage in stages.items()} == {"parse": 3, "tts": 1, "lm": 2}
+    assert stages["tts"]["queue_capacity"] == 1
+    assert stages["tts"]["processed"] == 4
+
+
+class HangingTtsEngine:
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        assert cancel is not None
+        self.started.set()
+        while not cancel.wait(0.01):
+            pass
+        self.stopped.set()
+        raise SynthesisCancelled(output_basename)
+
+
+def test_tts_timeout_signals_the_engine_to_stop(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = HangingTtsEngine()
+    service = _service(repo, engine, tts_task_timeout_seconds=1)  # type: ignore[arg-type]
+
+    async def run() -> list[str]:
+        job_id = await service.create_job(chat_id="chat-1", urls=["https://example.com/slow"], tts=TTS, lm=LM)
+        statuses = await _wait_finished(repo, [job_id])
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["failed"]
+    assert engine.stopped.wait(1)
+
+
+class HangingLmClient(FakeLmClient):
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    async def summary_and_filename(
+        self,
+        text: str,
+        url: str,
+        selection: LmSelection,
+    ) -> tuple[str | None, str | None]:
+        self.started.set()
+        await asyncio.sleep(60)
+        return "summary", "file-name"
+
+
+def test_cancel_job_reports_how_fast_work_is_released(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = HangingTtsEngine()
+    lm_client = HangingLmClient()
+    service = JobService(
+        repository=repo,
+        parser=FakeParser(),
+        tts_engine=engine,
+        lm_client=lm_client,
+        url_concurrency=1,
+        queue_poll_interval_seconds=0.05,
+    )
+
+    async def run() -> dict[str, object]:
+        job_id = await service.create_job(
+            chat_id="chat-1",
+            urls=["https://example.com/slow"],
+            tts=TTS,
+            lm=LmSelection(summary_model_id="same", filename_model_id="same"),
+        )
+        await asyncio.wait_for(lm_client.started.wait(), timeout=5)
+        assert await asyncio.to_thread(engine.started.wait, 5)
+        assert service.cancel_job(job_id)
+        for _ in range(100):
+            # The synthesis thread reports its release after the task has already given up.
+            if len(service.metrics()["cancellations"]) == 2:  # type: ignore[arg-type]
+                break
+            await asyncio.sleep(0.02)
+        metrics = service.metrics()
+        await service.shutdown()
+        return metrics
+
+    cancellations = asyncio.run(run())["cancellations"]
+    assert isinstance(cancellations, dict)
+    assert set(cancellations) == {"tts", "lm"}
+    for stage in cancellations.values():
+        assert stage["stops"] == 1
+        assert stage["max_release_seconds"] < 1
+
+
+class EncodeAfterCancelTtsEngine:
+    """Ignores the cancel until its final encode, like a stop that lands while ffmpeg runs."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.started = threading.Event()
+        self.returned = threading.Event()
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        assert cancel is not None
+        self.started.set()
+        cancel.wait(5)
+        path = self.root / f"{output_basename}.ogg"
+        path.write_bytes(b"audio")
+        self.returned.set()
+        return ArtifactMeta(path=str(path), kind="voice", mime_type="audio/ogg", size_bytes=5)
+
+
+def test_artifact_finished_after_cancel_is_deleted(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    engine = EncodeAfterCancelTtsEngine(tmp_path)
+    service = _service(repo, engine)  # type: ignore[arg-type]
+
+    async def run() -> list[str]:
+        job_id = await service.create_job(chat_id="chat-1", urls=["https://example.com/a"], tts=TTS, lm=LM)
+        assert await asyncio.to_thread(engine.started.wait, 5)
+        assert service.cancel_job(job_id)
+        statuses = await _wait_finished(repo, [job_id])
+        assert await asyncio.to_thread(engine.returned.wait, 5)
+        for _ in range(50):
+            if not list(tmp_path.glob("*.ogg")):
+                break
+            await asyncio.sleep(0.02)
+        await service.shutdown()
+        return statuses
+
+    assert asyncio.run(run()) == ["cancelled"]
+    assert list(tmp_path.glob("*.ogg")) == []
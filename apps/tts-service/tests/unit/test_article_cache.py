@@ -0,0 +1,60 @@
+import threading
+import time
+from pathlib import Path
+
+from app.domain.ports import ParsedArticle
+from app.infrastructure.article_cache import CachingArticleParser, canonical_url
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+class SlowParser:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def parse(self, url: str) -> ParsedArticle:
+        self.calls.append(url)
+        time.sleep(0.05)
+        return ParsedArticle(url=url, markdown=f"Body of {url}", title="Title")
+
+
+def _repo(tmp_path: Path) -> SQLiteJobRepository:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    return repo
+
+
+def test_canonical_url_strips_tracking_and_fragment() -> None:
+    assert (
+        canonical_url("HTTPS://Example.com:443/post?utm_source=x&b=2&fbclid=abc&a=1#section")
+        == "https://example.com/post?a=1&b=2"
+    )
+    assert canonical_url("http://example.com") == "http://example.com/"
+    assert canonical_url("http://example.com:8080/a?ref=keep") == "http://example.com:8080/a?ref=keep"
+
+
+def test_equivalent_urls_share_one_concurrent_scrape(tmp_path: Path) -> None:
+    parser = SlowParser()
+    cache = CachingArticleParser(parser, _repo(tmp_path), ttl_seconds=60)
+    urls = [f"https://example.com/post?utm_campaign={n}#top" for n in range(4)]
+    results: list[ParsedArticle] = []
+
+    threads = [threading.Thread(target=lambda url=url: results.append(cache.parse(url))) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(parser.calls) == 1
+    assert {article.markdown for article in results} == {f"Body of {parser.calls[0]}"}
+    assert sorted(article.url for article in results) == sorted(urls)
+    assert cache.stats() == {"hits": 3, "misses": 1, "in_flight": 0}
+
+
+def test_expired_entries_are_scraped_again(tmp_path: Path) -> None:
+    parser = SlowParser()
+    cache = CachingArticleParser(parser, _repo(tmp_path), ttl_seconds=0)
+
+    cache.parse("https://example.com/a")
+    cache.parse("https://example.com/a")
+
+    assert len(parser.calls) == 2
@@ -0,0 +1,69 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.infrastructure.audio_encoder import MP3_CODEC, OPUS_CODEC, PcmStreamEncoder, encode_pcm, transcode
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+
+def test_stream_encoder_writes_ogg_opus(tmp_path: Path) -> None:
+    path = tmp_path / "out.ogg"
+    encoder = PcmStreamEncoder(path, sample_rate=24_000)
+    tone = np.sin(np.linspace(0, 440 * 2 * np.pi, 24_000)).astype(np.float32)
+    encoder.write(tone)
+    encoder.write(tone)
+    encoder.close()
+
+    assert path.read_bytes()[:4] == b"OggS"
+
+
+def test_abort_removes_partial_output(tmp_path: Path) -> None:
+    path = tmp_path / "out.ogg"
+    encoder = PcmStreamEncoder(path, sample_rate=24_000)
+    encoder.write(np.zeros(24_000, dtype=np.float32))
+    encoder.abort()
+
+    assert not path.exists()
+
+
+def test_encode_pcm_writes_mp3_from_segments(tmp_path: Path) -> None:
+    path = tmp_path / "out.mp3"
+    segments = [np.zeros(12_000, dtype=np.float32), np.full(12_000, 0.1, dtype=np.float32)]
+
+    size = encode_pcm(segments, 24_000, path, codec=MP3_CODEC, bitrate="128k")
+
+    assert size == path.stat().st_size > 0
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_speech_ladder_step_is_smaller_than_default_opus(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    speechy = (0.3 * rng.standard_normal(24_000 * 10)).astype(np.float32)
+
+    default = encode_pcm([speechy], 24_000, tmp_path / "default.ogg", codec=OPUS_CODEC, bitrate="64k")
+    speech = encode_pcm(
+        [speechy],
+        24_000,
+        tmp_path / "speech.ogg",
+        codec=OPUS_CODEC,
+        bitrate="16k",
+        output_sample_rate=16_000,
+        application="voip",
+    )
+
+    assert speech < default / 2
+
+
+def test_transcode_steps_an_encoded_file_down(tmp_path: Path) -> None:
+    source = tmp_path / "out.ogg"
+    tone = np.sin(np.linspace(0, 440 * 2 * np.pi * 5, 24_000 * 5)).astype(np.float32)
+    encode_pcm([tone], 24_000, source, codec=OPUS_CODEC, bitrate="64k")
+    target = tmp_path / "out.16k.ogg"
+
+    size = transcode(source, target, OPUS_CODEC, "16k", output_sample_rate=16_000, application="voip")
+
+    assert size == target.stat().st_size < source.stat().st_size
+    assert target.read_bytes()[:4] == b"OggS"
@@ -0,0 +1,60 @@
+from app.domain.audio_format import (
+    DOCUMENT_MP3_128K,
+    VOICE_OPUS_16K_SPEECH,
+    VOICE_OPUS_24K_SPEECH,
+    VOICE_OPUS_32K,
+    VOICE_OPUS_64K,
+    estimate_duration_seconds,
+    fallback_format,
+    max_voice_seconds,
+    plan_format,
+    predict_size_bytes,
+)
+from app.domain.entities import DeliverySelection
+
+VOICE_MAX_BYTES = 45_000_000
+HOUR = 3_600.0
+
+
+def test_prediction_scales_with_duration_and_bitrate() -> None:
+    assert predict_size_bytes(2 * HOUR, VOICE_OPUS_64K) > 2 * predict_size_bytes(HOUR, VOICE_OPUS_32K) * 0.99
+    assert 28_000_000 < predict_size_bytes(HOUR, VOICE_OPUS_64K) < 32_000_000
+
+
+def test_plan_steps_down_bitrate_before_falling_back_to_document() -> None:
+    delivery = DeliverySelection()
+    assert plan_format(HOUR, VOICE_MAX_BYTES, delivery) == VOICE_OPUS_64K
+    assert plan_format(2 * HOUR, VOICE_MAX_BYTES, delivery) == VOICE_OPUS_32K
+    assert plan_format(3.5 * HOUR, VOICE_MAX_BYTES, delivery) == VOICE_OPUS_24K_SPEECH
+    assert plan_format(4 * HOUR, VOICE_MAX_BYTES, delivery) == VOICE_OPUS_16K_SPEECH
+    assert plan_format(8 * HOUR, VOICE_MAX_BYTES, delivery) == DOCUMENT_MP3_128K
+
+
+def test_plan_honours_delivery_preferences() -> None:
+    assert plan_format(60, VOICE_MAX_BYTES, DeliverySelection(prefer="document")) == DOCUMENT_MP3_128K
+    insist_on_voice = DeliverySelection(prefer="voice", fallback="voice")
+    assert plan_format(8 * HOUR, VOICE_MAX_BYTES, insist_on_voice) == VOICE_OPUS_16K_SPEECH
+
+
+def test_fallback_applies_the_observed_miss_to_smaller_steps() -> None:
+    delivery = DeliverySelection()
+    predicted = predict_size_bytes(HOUR, VOICE_OPUS_64K)
+    # 20% over the prediction: 32k would be ~18 MB, fits.
+    assert fallback_format(VOICE_OPUS_64K, HOUR, int(predicted * 1.2), 20_000_000, delivery) == VOICE_OPUS_32K
+    # A 3x miss skips straight to the speech-tuned 16k step.
+    assert fallback_format(VOICE_OPUS_64K, HOUR, predicted * 3, 25_000_000, delivery) == VOICE_OPUS_16K_SPEECH
+    assert fallback_format(VOICE_OPUS_16K_SPEECH, HOUR, 50_000_000, 45_000_000, delivery) == DOCUMENT_MP3_128K
+    insist_on_voice = DeliverySelection(fallback="voice")
+    assert fallback_format(VOICE_OPUS_16K_SPEECH, HOUR, 50_000_000, 45_000_000, insist_on_voice) is None
+    assert VOICE_OPUS_24K_SPEECH.label == "ogg 24k/24kHz"
+
+
+def test_duration_estimate_accounts_for_speed() -> None:
+    text = "word " * 3_000
+    assert estimate_duration_seconds(text, 2.0) == estimate_duration_seconds(text, 1.0) / 2
+
+
+def test_max_voice_seconds_keeps_a_part_under_the_voice_limit() -> None:
+    seconds = max_voice_seconds(VOICE_OPUS_64K, VOICE_MAX_BYTES)
+    assert predict_size_bytes(seconds, VOICE_OPUS_64K) < VOICE_MAX_BYTES
+    assert predict_size_bytes(seconds / 0.8, VOICE_OPUS_64K) > VOICE_MAX_BYTES
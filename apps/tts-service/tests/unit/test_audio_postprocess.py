@@ -0,0 +1,52 @@
+import numpy as np
+
+from app.infrastructure.audio_postprocess import PcmAssembler, trim_silence
+
+RATE = 24_000
+
+
+def _tone(seconds: float, amplitude: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE), dtype=np.float32) / RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _padded(seconds: float, amplitude: float, silence: float) -> np.ndarray:
+    quiet = np.zeros(int(silence * RATE), dtype=np.float32)
+    return np.concatenate([quiet, _tone(seconds, amplitude), quiet])
+
+
+def test_trim_silence_keeps_a_short_margin_and_returns_a_view() -> None:
+    audio = _padded(1.0, 0.5, silence=0.5)
+    trimmed = trim_silence(audio, RATE, keep_ms=60)
+    assert np.shares_memory(trimmed, audio)
+    assert abs(trimmed.size / RATE - 1.12) < 0.02
+    assert trim_silence(np.zeros(RATE, dtype=np.float32), RATE).size == 0
+
+
+def _assemble(segments: list[np.ndarray]) -> tuple[PcmAssembler, np.ndarray]:
+    out: list[np.ndarray] = []
+    pcm = PcmAssembler(RATE, lambda audio: out.append(audio.copy()), crossfade_ms=15)
+    for segment in segments:
+        pcm.append(segment)
+    pcm.finish()
+    return pcm, np.concatenate(out)
+
+
+def test_assembler_levels_crossfades_and_reports_removed_silence() -> None:
+    pcm, audio = _assemble([_padded(1.0, 0.05, silence=0.4), _padded(1.0, 0.8, silence=0.4)])
+
+    first, second = audio[RATE // 4 : RATE // 2], audio[-RATE // 2 : -RATE // 4]
+    rms = [float(np.sqrt(np.mean(np.square(part)))) for part in (first, second)]
+    assert abs(rms[0] - rms[1]) < 0.01
+    assert float(np.max(np.abs(audio))) <= 0.98 + 1e-6
+    assert abs(pcm.silence_removed_seconds - 4 * 0.34) < 0.03
+    # Two trimmed segments overlapping by one crossfade.
+    assert audio.size == 2 * int(1.12 * RATE) - int(0.015 * RATE)
+    assert pcm.duration_seconds == audio.size / RATE
+
+
+def test_working_memory_does_not_grow_with_length() -> None:
+    short, _ = _assemble([_tone(2.0, 0.3)] * 3)
+    long, _ = _assemble([_tone(2.0, 0.3)] * 60)
+    assert long.duration_seconds > 100
+    assert long.peak_bytes == short.peak_bytes
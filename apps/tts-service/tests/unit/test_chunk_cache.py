@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.entities import TtsSelection
+from app.infrastructure.chunk_cache import ChunkAudioCache
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+TTS = TtsSelection(model_id="m", voice="v", speed=1.0)
+
+
+def _repo(tmp_path: Path) -> SQLiteJobRepository:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    return repo
+
+
+def test_roundtrip_and_counters(tmp_path: Path) -> None:
+    cache = ChunkAudioCache(tmp_path / "chunks", 1_000_000, _repo(tmp_path))
+    key = ChunkAudioCache.key("Hello there.", TTS, 24_000)
+    assert key != ChunkAudioCache.key("Hello there.", TtsSelection(model_id="m", voice="v", speed=1.2), 24_000)
+
+    assert cache.get(key) is None
+    cache.put(key, np.linspace(-1, 1, 100, dtype=np.float32))
+    audio = cache.get(key)
+
+    assert audio is not None and audio.dtype == np.float32 and audio.size == 100
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_least_recently_used_chunk_is_evicted(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    chunk = np.zeros(1_000, dtype=np.float32)
+    cache = ChunkAudioCache(tmp_path / "chunks", 2 * (chunk.nbytes + 256), repo)
+    keys = [ChunkAudioCache.key(f"chunk {index}", TTS, 24_000) for index in range(3)]
+
+    cache.put(keys[0], chunk)
+    cache.put(keys[1], chunk)
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], chunk)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["evictions"] == 1
+    assert len(list((tmp_path / "chunks").glob("*.npy"))) == 2
+
+    reloaded = ChunkAudioCache(tmp_path / "chunks", 10_000_000, repo)
+    assert reloaded.stats()["entries"] == 2
+
+
+def test_workers_share_entries_and_one_size_limit(tmp_path: Path) -> None:
+    chunk = np.zeros(1_000, dtype=np.float32)
+    max_bytes = 2 * (chunk.nbytes + 256)
+    # Two processes' caches: same directory and database, separate repositories.
+    first = ChunkAudioCache(tmp_path / "chunks", max_bytes, _repo(tmp_path))
+    second = ChunkAudioCache(tmp_path / "chunks", max_bytes, _repo(tmp_path))
+    keys = [ChunkAudioCache.key(f"chunk {index}", TTS, 24_000) for index in range(3)]
+
+    first.put(keys[0], chunk)
+    assert second.get(keys[0]) is not None
+    second.put(keys[1], chunk)
+    first.put(keys[2], chunk)
+
+    assert len(list((tmp_path / "chunks").glob("*.npy"))) == 2
+    assert second.get(keys[0]) is None
+    assert second.get(keys[1]) is not None
+    assert first.stats()["entries"] == second.stats()["entries"] == 2
+
+
+def test_files_from_before_the_index_are_adopted(tmp_path: Path) -> None:
+    key = ChunkAudioCache.key("Old chunk.", TTS, 24_000)
+    (tmp_path / "chunks").mkdir()
+    np.save(tmp_path / "chunks" / f"{key}.npy", np.ones(10, dtype=np.float32))
+
+    cache = ChunkAudioCache(tmp_path / "chunks", 1_000_000, _repo(tmp_path))
+
+    audio = cache.get(key)
+    assert audio is not None and audio.size == 10
@@ -0,0 +1,44 @@
+import threading
+from pathlib import Path
+
+from app.infrastructure.db.connection_pool import SQLiteConnectionPool
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+def test_pool_uses_wal_and_reuses_thread_connection(tmp_path: Path) -> None:
+    pool = SQLiteConnectionPool(tmp_path / "tts.db")
+    with pool.reader() as first, pool.reader() as second:
+        assert first is second
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    pool.close()
+
+
+def test_reads_do_not_wait_for_open_write(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, _ = repo.create_job("chat-1", ["https://example.com"])
+
+    write_started = threading.Event()
+    release_write = threading.Event()
+
+    def hold_write() -> None:
+        with repo._pool.writer() as conn:
+            conn.execute("UPDATE jobs SET status = 'processing' WHERE id = ?", (job_id,))
+            write_started.set()
+            release_write.wait(timeout=5)
+
+    writer = threading.Thread(target=hold_write)
+    writer.start()
+    write_started.wait(timeout=5)
+    try:
+        job = repo.get_job(job_id)
+        assert job is not None
+        assert job["status"] == "queued"
+    finally:
+        release_write.set()
+        writer.join()
+
+    updated = repo.get_job(job_id)
+    assert updated is not None
+    assert updated["status"] == "processing"
+    repo.close()
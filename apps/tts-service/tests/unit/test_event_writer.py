@@ -0,0 +1,57 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from app.infrastructure.db.event_writer import JobEventWriter
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+
+
+def _repo(tmp_path: Path) -> tuple[SQLiteJobRepository, str]:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, _ = repo.create_job("chat-1", ["https://example.com"])
+    return repo, job_id
+
+
+def test_events_are_buffered_until_batch_size(tmp_path: Path) -> None:
+    repo, job_id = _repo(tmp_path)
+    writer = JobEventWriter(repo, max_batch=3)
+
+    writer.add(job_id, "info", "one")
+    writer.add(job_id, "info", "two")
+    assert repo.get_job_events(job_id) == []
+
+    writer.add(job_id, "info", "three")
+    messages = [event["message"] for event in repo.get_job_events(job_id)]
+    assert messages == ["one", "two", "three"]
+    assert writer.stats() == {"pending": 0, "flushes": 1, "written": 3, "flush_errors": 0}
+
+
+def test_stop_flushes_pending_events(tmp_path: Path) -> None:
+    repo, job_id = _repo(tmp_path)
+    writer = JobEventWriter(repo, max_batch=100, flush_interval_seconds=60)
+
+    async def run() -> None:
+        writer.start()
+        writer.add(job_id, "info", "pending")
+        await writer.stop()
+
+    asyncio.run(run())
+    assert [event["message"] for event in repo.get_job_events(job_id)] == ["pending"]
+
+
+class FailingRepository(SQLiteJobRepository):
+    def add_events(self, rows):  # type: ignore[no-untyped-def]
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_full_buffer_keeps_rows_when_the_flush_fails(tmp_path: Path) -> None:
+    repo = FailingRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, _ = repo.create_job("chat-1", ["https://example.com"])
+    writer = JobEventWriter(repo, max_batch=2)
+
+    writer.add(job_id, "info", "one")
+    writer.add(job_id, "info", "two")
+
+    assert writer.stats() == {"pending": 2, "flushes": 0, "written": 0, "flush_errors": 1}
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+from app.infrastructure.db.job_updates import LAGGED, JobUpdateHub
+
+
+def test_updates_published_from_another_thread_reach_the_subscriber() -> None:
+    hub = JobUpdateHub()
+
+    async def run() -> list[dict | None]:
+        with hub.subscribe("job-1") as subscription:
+            def publish() -> None:
+                for job_id in ("job-2", "job-1"):
+                    hub.publish(job_id, {"type": "job", "status": "processing"})
+
+            publisher = threading.Thread(target=publish)
+            publisher.start()
+            received = [await subscription.get(1.0), await subscription.get(0.05)]
+            publisher.join()
+        return received
+
+    assert asyncio.run(run()) == [{"type": "job", "status": "processing"}, None]
+    assert hub.stats() == {"subscribers": 0, "published": 2, "delivered": 1}
+
+
+def test_slow_subscriber_gets_one_lagged_marker_instead_of_a_backlog() -> None:
+    hub = JobUpdateHub(max_pending=2)
+
+    async def run() -> list[dict]:
+        with hub.subscribe("job-1") as subscription:
+            for index in range(5):
+                hub.publish("job-1", {"type": "progress", "chunks_done": index})
+            await asyncio.sleep(0)
+            return subscription.drain()
+
+    updates = asyncio.run(run())
+    assert [update.get("chunks_done") for update in updates[:2]] == [0, 1]
+    assert updates[2:] == [LAGGED]
@@ -0,0 +1,86 @@
+import asyncio
+from pathlib import Path
+
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.lm_model_catalog import LmModelCatalog
+from app.infrastructure.lm_studio_client import LmValidationResult
+
+
+class FakeLmClient:
+    def __init__(self) -> None:
+        self.models = ["a", "b"]
+        self.list_calls = 0
+        self.validate_calls: list[str] = []
+
+    async def list_models(self) -> list[str]:
+        self.list_calls += 1
+        await asyncio.sleep(0.01)
+        return list(self.models)
+
+    async def validate_model(self, model_id: str) -> LmValidationResult:
+        self.validate_calls.append(model_id)
+        await asyncio.sleep(0.01)
+        if model_id == "broken":
+            return LmValidationResult(valid=False, reason="template error")
+        if model_id == "offline":
+            return LmValidationResult(valid=False, reason="LM Studio unreachable", transient=True)
+        return LmValidationResult(valid=True)
+
+
+def _repo(tmp_path: Path) -> SQLiteJobRepository:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    return repo
+
+
+def test_validations_persist_and_concurrent_misses_share_one_check(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    client = FakeLmClient()
+
+    async def run() -> list[bool]:
+        catalog = LmModelCatalog(client, repo)  # type: ignore[arg-type]
+        results = await asyncio.gather(*(catalog.validate_model("a") for _ in range(3)))
+        restarted = LmModelCatalog(client, repo)  # type: ignore[arg-type]
+        results.append(await restarted.validate_model("a"))
+        return [result.valid for result in results]
+
+    assert asyncio.run(run()) == [True] * 4
+    assert client.validate_calls == ["a"]
+
+
+def test_stale_model_list_refreshes_in_background_and_invalidates(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    client = FakeLmClient()
+
+    async def run() -> tuple[list[str], list[str]]:
+        catalog = LmModelCatalog(client, repo, models_ttl_seconds=0)  # type: ignore[arg-type]
+        await catalog.list_models()
+        await catalog.validate_model("a")
+        await catalog.validate_model("b")
+        await catalog.validate_model("broken")
+
+        client.models = ["a", "c"]
+        stale = await catalog.list_models()
+        await asyncio.sleep(0.05)
+        return stale, await catalog.list_models()
+
+    stale, fresh = asyncio.run(run())
+
+    assert stale == ["a", "b"]
+    assert fresh == ["a", "c"]
+    assert repo.get_lm_validation("a") is not None
+    assert repo.get_lm_validation("b") is None
+    assert repo.get_lm_validation("broken") is None
+
+
+def test_unreachable_lm_studio_is_not_cached_as_invalid(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    client = FakeLmClient()
+
+    async def run() -> list[bool]:
+        catalog = LmModelCatalog(client, repo)  # type: ignore[arg-type]
+        return [(await catalog.validate_model("offline")).valid for _ in range(2)]
+
+    assert asyncio.run(run()) == [False, False]
+    assert repo.get_lm_validation("offline") is None
+    assert client.validate_calls == ["offline", "offline"]
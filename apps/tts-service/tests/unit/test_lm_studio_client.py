@@ -0,0 +1,161 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+
+from app.domain.entities import LmSelection
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.lm_studio_client import LmStudioClient, parse_metadata_json
+
+LM = LmSelection(summary_model_id="s", filename_model_id="f")
+SAME_MODEL = LmSelection(summary_model_id="s", filename_model_id="s")
+
+
+def _client(handler) -> LmStudioClient:  # type: ignore[no-untyped-def]
+    return LmStudioClient("http://lm.test/v1/", transport=httpx.MockTransport(handler))
+
+
+def test_chat_falls_back_to_completions_endpoint() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path.endswith("/chat/completions"):
+            return httpx.Response(400, text="unsupported template")
+        assert json.loads(request.content)["model"] == "s"
+        return httpx.Response(200, json={"choices": [{"text": " A summary. "}]})
+
+    async def run() -> str:
+        client = _client(handler)
+        try:
+            return await client.summarize("Article body.", LM)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == "A summary."
+    assert seen == ["/v1/chat/completions", "/v1/chat/completions", "/v1/completions"]
+
+
+def test_concurrent_calls_are_native_coroutines() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/models"):
+            return httpx.Response(200, json={"data": [{"id": "a"}, {"id": ""}, {"id": "b"}]})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    async def run() -> tuple[list[str], list[str], bool]:
+        client = _client(handler)
+        try:
+            models = await client.list_models()
+            texts = await asyncio.gather(*(client.filename("Body", "https://example.com", LM) for _ in range(5)))
+            validation = await client.validate_model("a")
+        finally:
+            await client.aclose()
+        return models, list(texts), validation.valid
+
+    assert asyncio.run(run()) == (["a", "b"], ["ok"] * 5, True)
+
+
+def test_working_dialect_is_remembered_across_restarts(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path.endswith("/chat/completions"):
+            return httpx.Response(400, text="unsupported template")
+        return httpx.Response(200, json={"choices": [{"text": "ok"}]})
+
+    async def run() -> tuple[dict[str, int], dict[str, int]]:
+        first = LmStudioClient("http://lm.test/v1", transport=httpx.MockTransport(handler), repository=repo)
+        assert (await first.validate_model("s")).valid
+        await first.aclose()
+
+        restarted = LmStudioClient("http://lm.test/v1", transport=httpx.MockTransport(handler), repository=repo)
+        await restarted.summarize("Body", LM)
+        await restarted.filename("Body", "https://example.com", SAME_MODEL)
+        await restarted.aclose()
+        return first.stats(), restarted.stats()
+
+    first_stats, restarted_stats = asyncio.run(run())
+
+    assert repo.list_lm_dialects() == {"s": "completions"}
+    assert seen == ["/v1/chat/completions"] * 2 + ["/v1/completions"] * 3
+    assert (first_stats["requests"], first_stats["fallback_attempts"]) == (1, 2)
+    assert (restarted_stats["requests"], restarted_stats["fallback_attempts"]) == (2, 0)
+    assert restarted_stats["known_dialects"] == 1
+
+
+def test_metadata_json_is_read_from_fenced_or_partial_replies() -> None:
+    assert parse_metadata_json('```json\n{"summary": " Short. ", "filename": "a-b-c"}\n```') == ("Short.", "a-b-c")
+    assert parse_metadata_json('Sure! {"note": {"x": 1}} then {"summary": "S", "filename": ""}') == ("S", None)
+    assert parse_metadata_json('{"summary": "S"} trailing') == ("S", None)
+    assert parse_metadata_json("no json at all") == (None, None)
+
+
+def test_long_article_is_summarized_in_parts_with_bounded_parallelism() -> None:
+    active = 0
+    peak = 0
+    prompts: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        prompts.append(prompt)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        reply = "Final summary." if prompt.startswith("Summarize") else f"Notes {len(prompts)}."
+        return httpx.Response(200, json={"choices": [{"message": {"content": reply}}]})
+
+    async def run() -> tuple[str, dict[str, int]]:
+        client = LmStudioClient(
+            "http://lm.test/v1",
+            transport=httpx.MockTransport(handler),
+            context_tokens=1_000,
+            model_context_tokens={"big": 100_000},
+            map_parallelism=2,
+        )
+        article = " ".join(f"Sentence {n} reports a distinct fact." for n in range(1_500))
+        summary = await client.summarize(article, LM)
+        await client.summarize(article, LmSelection(summary_model_id="big", filename_model_id="big"))
+        await client.aclose()
+        return summary, client.stats()
+
+    summary, stats = asyncio.run(run())
+
+    map_prompts = [prompt for prompt in prompts if prompt.startswith("This is part")]
+    assert summary == "Final summary."
+    assert len(map_prompts) > 2
+    assert peak <= 2
+    assert stats["map_reduce_runs"] == 1
+    # The large-context model gets the whole article in one request.
+    assert "Sentence 1499" in prompts[-1]
+
+
+def test_validation_marks_an_unreachable_server_as_transient() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def run():  # type: ignore[no-untyped-def]
+        client = _client(handler)
+        try:
+            return await client.validate_model("s")
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(run())
+    assert not result.valid and result.transient
+
+
+def test_request_rounds_count_map_rounds_plus_the_final_request() -> None:
+    client = LmStudioClient("http://lm.test/v1", context_tokens=1_000, model_context_tokens={"big": 100_000})
+    article = " ".join(f"Sentence {n} reports a distinct fact." for n in range(1_500))
+    chunks = len(client._map_chunks(article, "s"))
+
+    assert chunks > 2
+    assert client.request_rounds(article, "s") == -(-chunks // 2) + 1
+    assert client.request_rounds(article, "big") == 1
+    asyncio.run(client.aclose())
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.infrastructure.pcm_spool import PcmSpool
+
+
+def test_spool_reads_back_in_blocks_and_discards_its_file(tmp_path: Path) -> None:
+    spool = PcmSpool(tmp_path / "item.pcm", block_samples=1000)
+    audio = np.linspace(-1, 1, 2500, dtype=np.float32)
+    spool.write(audio[:1200])
+    spool.write(audio[1200:])
+
+    blocks = list(spool.blocks())
+    assert [block.size for block in blocks] == [1000, 1000, 500]
+    assert np.array_equal(np.concatenate(blocks), audio)
+    assert spool.samples == 2500
+
+    spool.discard()
+    assert not (tmp_path / "item.pcm").exists()
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
@@ -18,3 +19,67 @@ def test_repository_create_and_update_job(tmp_path: Path) -> None:
     updated = repo.get_job(job_id)
     assert updated is not None
     assert updated["status"] == "processing"
+
+
+def test_item_artifact_parts_keep_files_in_use_until_acked(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, (item_id,) = repo.create_job("chat-1", ["https://example.com"])
+
+    for part in (2, 1):
+        repo.add_item_artifact(
+            item_id,
+            part=part,
+            path=f"/tmp/a.part{part}.ogg",
+            kind="voice",
+            mime_type="audio/ogg",
+            size_bytes=100 * part,
+            duration_seconds=60.0,
+        )
+    assert [row["part"] for row in repo.list_job_artifacts(job_id)] == [1, 2]
+    assert repo.get_item_artifact("other-job", item_id, 1) is None
+    assert repo.artifact_in_use("/tmp/a.part1.ogg")
+
+    repo.clear_item_artifact_part(item_id, 1)
+    assert not repo.artifact_in_use("/tmp/a.part1.ogg")
+    assert repo.get_item_artifact(job_id, item_id, 1)["acked_at"] is not None  # type: ignore[index]
+    assert repo.clear_item_artifact_parts(item_id) == ["/tmp/a.part2.ogg"]
+    assert repo.clear_item_artifact_parts(item_id) == []
+
+
+def test_acks_and_cancellation_publish_item_updates(tmp_path: Path) -> None:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    job_id, (done_id, queued_id) = repo.create_job("chat-1", ["https://example.com/a", "https://example.com/b"])
+    for part in (1, 2):
+        repo.add_item_artifact(
+            done_id,
+            part=part,
+            path=f"/tmp/a.part{part}.ogg",
+            kind="voice",
+            mime_type="audio/ogg",
+            size_bytes=100,
+        )
+
+    async def run() -> list[dict]:
+        with repo.updates.subscribe(job_id) as subscription:
+            repo.clear_item_artifact_part(done_id, 1)
+            repo.clear_item_artifact_parts(done_id)
+            repo.clear_item_artifact(done_id)
+            repo.update_item_status(done_id, "completed")
+            repo.mark_cancelled(job_id)
+            await asyncio.sleep(0)
+            return subscription.drain()
+
+    updates = asyncio.run(run())
+    summary = [(update["type"], update.get("item_id"), update.get("status", update.get("part"))) for update in updates]
+    assert summary == [
+        ("part", done_id, 1),
+        ("part", done_id, 2),
+        ("item", done_id, "queued"),
+        ("item", done_id, "completed"),
+        ("item", queued_id, "cancelled"),
+        ("job", None, "cancelled"),
+    ]
+    assert all(update["acked"] for update in updates if update["type"] == "part")
+    assert updates[2]["artifact"] is None
@@ -0,0 +1,79 @@
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from app.application.job_service import JobService
+from app.domain.entities import ArtifactMeta, DeliverySelection, SynthesisProgress, TtsSelection
+from app.infrastructure.db.sqlite_repository import SQLiteJobRepository
+from app.infrastructure.synthesis_cache import CachingTtsEngine
+
+TTS = TtsSelection(model_id="m", voice="v", speed=1.0)
+
+
+class CountingEngine:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.calls = 0
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        self.calls += 1
+        path = self.root / f"{output_basename}.ogg"
+        path.write_bytes(b"audio")
+        return ArtifactMeta(path=str(path), kind="voice", mime_type="audio/ogg", size_bytes=5)
+
+
+def _repo(tmp_path: Path) -> SQLiteJobRepository:
+    repo = SQLiteJobRepository(tmp_path / "tts.db")
+    repo.init_schema()
+    return repo
+
+
+def test_same_normalized_text_and_voice_hits_cache(tmp_path: Path) -> None:
+    engine = CountingEngine(tmp_path)
+    cache = CachingTtsEngine(engine, _repo(tmp_path), max_bytes=1_000)
+
+    first = cache.synthesize("# Title\n\nSome **text** here.", TTS, "a")
+    second = cache.synthesize("Title  Some text here.", TTS, "b")
+    other_voice = cache.synthesize("Title Some text here.", TtsSelection(model_id="m", voice="w", speed=1.0), "c")
+
+    assert second.path == first.path
+    assert other_voice.path != first.path
+    assert engine.calls == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_shared_artifact_survives_ack_until_unreferenced_and_evicted(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    cache = CachingTtsEngine(CountingEngine(tmp_path), repo, max_bytes=1_000, eviction_grace_seconds=0)
+    artifact = cache.synthesize("Shared article.", TTS, "shared")
+
+    job_id, item_ids = repo.create_job("chat-1", ["https://example.com", "https://example.com"])
+    for item_id in item_ids:
+        repo.set_item_result(
+            item_id,
+            summary="s",
+            filename="f",
+            artifact_path=artifact.path,
+            artifact_kind=artifact.kind,
+            mime_type=artifact.mime_type,
+            size_bytes=artifact.size_bytes,
+        )
+
+    service = JobService(repository=repo, parser=None, tts_engine=cache, lm_client=None, url_concurrency=1)  # type: ignore[arg-type]
+    assert service.acknowledge_sent(job_id, item_ids[0])
+
+    # Over budget while still referenced: the index entry goes, the file stays.
+    cache._max_bytes = 0
+    cache.evict()
+    assert Path(artifact.path).exists()
+
+    assert service.acknowledge_sent(job_id, item_ids[1])
+    assert not Path(artifact.path).exists()
@@ -0,0 +1,25 @@
+from app.domain.text_budget import estimate_tokens, select_spans
+
+
+def test_estimate_tokens_counts_cjk_per_character() -> None:
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("你好世界") == 4
+
+
+def test_select_spans_keeps_lede_conclusion_and_content_over_boilerplate() -> None:
+    paragraphs = (
+        ["Lede: the council approved a 2025 budget of 40 million."]
+        + ["Subscribe to our newsletter and accept cookies to read more."] * 10
+        + [f"Section {n} explains how project {n} changes transit routes and schedules." for n in range(30)]
+        + ["In conclusion, construction starts next spring."]
+    )
+    text = "\n\n".join(paragraphs)
+
+    selected = select_spans(text, 200)
+
+    assert estimate_tokens(selected) <= 200
+    assert selected.startswith("Lede:")
+    assert selected.endswith("construction starts next spring.")
+    assert "Subscribe" not in selected
+    assert "[...]" in selected
+    assert select_spans("Short article.", 200) == "Short article."
@@ -0,0 +1,56 @@
+from app.domain.model_registry import list_tts_models
+from app.domain.text_processing import chunk_text, normalize_text
+
+MARKDOWN = """# Release notes
+
+Read the [full post](https://example.com/post) or visit https://example.com/x?a=1 now.
+![diagram](img/diagram.png)
+
+```python
+print("never spoken")
+```
+
+| col | value |
+|-----|-------|
+| a   | 1     |
+
+- **First** point uses `snake_case` names.
+- Second, _well-known_ point.
+> Quoted line.
+---
+"""
+
+
+def test_normalize_strips_markdown_constructs() -> None:
+    assert normalize_text(MARKDOWN) == (
+        "Release notes Read the full post or visit now. "
+        "First point uses snake_case names. Second, well-known point. Quoted line."
+    )
+
+
+def test_comparison_operators_are_not_taken_for_html_tags() -> None:
+    assert normalize_text("Growth was <5% while costs were >20% higher.") == "Growth was <5% while costs were >20% higher."
+    assert normalize_text("Use it if x < 10 and y > 5, then stop.") == "Use it if x < 10 and y > 5, then stop."
+    assert normalize_text("A <b>bold</b> claim.<br/>") == "A bold claim."
+
+
+def test_chunks_break_at_sentences_and_respect_abbreviations() -> None:
+    text = "Dr. Smith went home. He slept well. Then J. Doe came by."
+    assert chunk_text(text, 25) == ["Dr. Smith went home.", "He slept well.", "Then J. Doe came by."]
+
+
+def test_long_sentences_split_at_clauses_then_words_without_cutting_them() -> None:
+    sentence = "alpha beta gamma, delta epsilon zeta eta theta iota kappa lambda mu"
+    chunks = chunk_text(sentence, 20)
+    assert chunks[0] == "alpha beta gamma,"
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks).split() == sentence.split()
+
+
+def test_cjk_text_splits_after_fullwidth_punctuation() -> None:
+    text = "東京は晴れです。明日は雨です！今日は寒いですか？"
+    assert chunk_text(text, 10) == ["東京は晴れです。", "明日は雨です！", "今日は寒いですか？"]
+
+
+def test_every_model_has_a_chunk_size() -> None:
+    assert all(model.max_chunk_chars >= 200 for model in list_tts_models())
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from app.infrastructure.tts_batcher import TtsBatchScheduler
+
+
+def _submit_all(scheduler: TtsBatchScheduler, texts: list[str], run_batch) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    results: dict[str, object] = {}
+
+    def submit(text: str) -> None:
+        try:
+            results[text] = scheduler.submit(("m", "v", 1.0), text, run_batch)
+        except Exception as exc:  # noqa: BLE001
+            results[text] = exc
+
+    threads = [threading.Thread(target=submit, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_chunks_share_a_batch_and_get_their_own_output() -> None:
+    scheduler = TtsBatchScheduler(max_batch_size=3, max_wait_seconds=0.5)
+    batches: list[list[str]] = []
+
+    def run_batch(texts: list[str]) -> list[list[str]]:
+        batches.append(texts)
+        return [[f"audio:{text}"] for text in texts]
+
+    results = _submit_all(scheduler, ["a", "b", "c", "d"], run_batch)
+
+    assert results == {text: [f"audio:{text}"] for text in "abcd"}
+    assert sorted(len(batch) for batch in batches) == [1, 3]
+    assert scheduler.stats()["largest_batch"] == 3
+
+
+def test_batch_failure_reaches_every_caller() -> None:
+    scheduler = TtsBatchScheduler(max_batch_size=2, max_wait_seconds=0.5)
+
+    def run_batch(texts: list[str]) -> list[list[str]]:
+        raise RuntimeError("device lost")
+
+    results = _submit_all(scheduler, ["a", "b"], run_batch)
+
+    assert all(isinstance(result, RuntimeError) for result in results.values())
+    with pytest.raises(RuntimeError):
+        TtsBatchScheduler(max_wait_seconds=0).submit("k", "x", lambda texts: [])
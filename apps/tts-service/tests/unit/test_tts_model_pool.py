@@ -0,0 +1,64 @@
+import threading
+import time
+
+from app.infrastructure.tts_model_pool import TtsModelPool
+
+
+class SlowLoader:
+    def __init__(self) -> None:
+        self.loads: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, model_id: str) -> dict[str, str]:
+        with self._lock:
+            self.loads.append(model_id)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return {"id": model_id}
+
+
+def test_different_models_load_in_parallel_and_same_model_loads_once() -> None:
+    loader = SlowLoader()
+    pool = TtsModelPool(loader, memory_budget_bytes=10_000, measure=lambda _: 100)
+
+    def use(model_id: str) -> None:
+        with pool.lease(model_id):
+            pass
+
+    threads = [threading.Thread(target=use, args=(model_id,)) for model_id in ["a", "a", "a", "b"]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(loader.loads) == ["a", "b"]
+    assert loader.peak == 2
+    stats = pool.stats()
+    assert stats["loads"] == 2
+    assert stats["resident_bytes"] == 200
+    assert stats["models"]["a"]["load_seconds"] > 0  # type: ignore[index]
+
+
+def test_least_recently_used_idle_model_is_evicted_past_budget() -> None:
+    evicted: list[bool] = []
+    pool = TtsModelPool(SlowLoader(), memory_budget_bytes=250, measure=lambda _: 100, on_evict=lambda: evicted.append(True))
+
+    with pool.lease("a"), pool.lease("b"):
+        pass
+    with pool.lease("a"):
+        # "b" is least recently used and idle; "a" is leased and must stay.
+        with pool.lease("c"):
+            pass
+        assert pool.loaded_model_ids() == ["a", "c"]
+
+    with pool.lease("c"):
+        with pool.lease("d"):
+            assert pool.loaded_model_ids() == ["c", "d"]
+
+    assert pool.stats()["evictions"] == 2
+    assert evicted == [True, True]
@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from app.domain.entities import ArtifactMeta, DeliverySelection, SynthesisProgress, TtsSelection
+from app.domain.ports import SynthesisCancelled
+from app.infrastructure.tts_worker_pool import ProcessTtsEngine
+
+TTS = TtsSelection(model_id="m", voice="v", speed=1.0)
+
+
+class SlowEngine:
+    """Runs in the worker process; `text` is the number of 0.1 s chunks, or `crash`."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.requests = 0
+
+    def synthesize(
+        self,
+        text: str,
+        selection: TtsSelection,
+        output_basename: str,
+        on_progress: Callable[[SynthesisProgress], None] | None = None,
+        delivery: DeliverySelection | None = None,
+        cancel: threading.Event | None = None,
+    ) -> ArtifactMeta:
+        if text == "crash":
+            os._exit(3)
+        self.requests += 1
+        path = self.root / f"{output_basename}.ogg"
+        chunks = int(text)
+        with path.open("wb") as handle:
+            for index in range(1, chunks + 1):
+                time.sleep(0.1)
+                handle.write(b"a")
+                handle.flush()
+                if on_progress is not None:
+                    on_progress(SynthesisProgress(chunks_done=index, chunks_total=chunks, partial_path=str(path)))
+        return ArtifactMeta(path=str(path), kind="voice", mime_type="audio/ogg", size_bytes=chunks)
+
+    def component_stats(self) -> dict[str, dict[str, object]]:
+        return {"tts_models": {"requests": self.requests}}
+
+
+def _build_engine(root: Path) -> SlowEngine:
+    return SlowEngine(root)
+
+
+@pytest.fixture
+def pool(tmp_path: Path):  # type: ignore[no-untyped-def]
+    engine = ProcessTtsEngine(
+        partial(_build_engine, tmp_path),
+        workers=1,
+        artifacts_dir=tmp_path,
+        poll_interval_seconds=0.02,
+    )
+    engine.start()
+    yield engine
+    engine.stop()
+
+
+def test_worker_returns_artifact_and_progress(pool: ProcessTtsEngine) -> None:
+    progress: list[int] = []
+
+    artifact = pool.synthesize("2", TTS, "item-1", on_progress=lambda update: progress.append(update.chunks_done))
+
+    assert artifact.size_bytes == 2
+    assert progress == [1, 2]
+
+
+def test_cancel_kills_worker_and_removes_partial_output(pool: ProcessTtsEngine, tmp_path: Path) -> None:
+    cancel = threading.Event()
+    threading.Timer(0.5, cancel.set).start()
+
+    started = time.perf_counter()
+    with pytest.raises(SynthesisCancelled):
+        pool.synthesize("100", TTS, "item-2", cancel=cancel)
+
+    assert time.perf_counter() - started < 2
+    assert not (tmp_path / "item-2.ogg").exists()
+    # The replacement worker serves the next request.
+    assert pool.synthesize("1", TTS, "item-3").size_bytes == 1
+    assert pool.stats()["kills"] == 1
+
+
+def test_crashed_worker_is_restarted(pool: ProcessTtsEngine) -> None:
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        pool.synthesize("crash", TTS, "item-4")
+
+    assert pool.synthesize("1", TTS, "item-5").size_bytes == 1
+    assert pool.stats()["restarts"] == 1
+
+
+def test_request_cancelled_while_waiting_leaves_the_worker_alone(pool: ProcessTtsEngine) -> None:
+    busy = threading.Thread(target=pool.synthesize, args=("5", TTS, "item-6"))
+    busy.start()
+    time.sleep(0.1)
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    with pytest.raises(SynthesisCancelled):
+        pool.synthesize("1", TTS, "item-7", cancel=cancel)
+    busy.join()
+
+    assert pool.synthesize("1", TTS, "item-8").size_bytes == 1
+    assert {name: pool.stats()[name] for name in ("kills", "restarts")} == {"kills": 0, "restarts": 0}
+
+
+def test_worker_stats_follow_each_live_worker(pool: ProcessTtsEngine) -> None:
+    pool.synthesize("1", TTS, "item-9")
+    pool.synthesize("1", TTS, "item-10")
+    assert pool.worker_stats("tts_models") == {"workers": [{"requests": 2}]}
+
+    with pytest.raises(RuntimeError):
+        pool.synthesize("crash", TTS, "item-11")
+    # The crashed worker's counters go with it; the replacement starts fresh.
+    assert pool.worker_stats("tts_models") == {"workers": []}
+    pool.synthesize("1", TTS, "item-12")
+    assert pool.worker_stats("tts_models") == {"workers": [{"requests": 1}]}
+    assert pool.worker_stats("chunk_cache") == {"workers": []}